@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+热点路径基准测试
+在合成项目上计时解析、查找语言文件夹、查重、对比、长度对比、字符串扫描/替换、导入和导出，
+结果与 baseline JSON 对比，回归直接以百分比显示
+
+用法:
+    python -m benchmarks.run_benchmarks                       # 与 benchmarks/baseline.json 对比
+    python -m benchmarks.run_benchmarks --save-baseline       # 把本次结果保存为基线
+    python -m benchmarks.run_benchmarks --scale large --only parse,compare
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_project import ALL_LANGUAGES, generate_import_zip, generate_project
+from models import LocalizationParser, ProjectInfoExtractor
+from models.analysis_cache import AnalysisCache
+from models.scan_cache import ScanResultCache
+from utils.constants import DEFAULT_IGNORE_FOLDERS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# 规模预设：语言数、key 数、源文件数、目录深度
+SCALES = {
+    'small': {'languages': 4, 'keys': 1000, 'source_files': 100, 'depth': 2},
+    'medium': {'languages': 8, 'keys': 10000, 'source_files': 500, 'depth': 3},
+    'large': {'languages': 16, 'keys': 50000, 'source_files': 2000, 'depth': 4},
+}
+
+# 基准注册表 {name: setup(ctx) -> 被计时的函数}
+BENCHMARKS: 'OrderedDict[str, Callable]' = OrderedDict()
+
+
+def benchmark(name: str):
+    """注册基准：被装饰函数做准备工作（不计时），返回真正被计时的无参函数"""
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def run_worker(worker) -> tuple:
+    """在当前线程同步执行 worker.run()，返回 finished 的参数；失败时抛出异常"""
+    result = []
+    worker.finished.connect(lambda *args: result.extend(args))
+    worker.run()
+    if not result or not result[0]:
+        raise RuntimeError(f"{type(worker).__name__} 失败: {result[1] if len(result) > 1 else '没有结果'}")
+    return tuple(result)
+
+
+def copy_project(ctx: dict) -> str:
+    """会修改文件的基准使用项目副本"""
+    target = tempfile.mkdtemp(prefix='bench_copy_', dir=ctx['work_dir'])
+    shutil.rmtree(target)
+    shutil.copytree(ctx['project_path'], target)
+    return target
+
+
+@benchmark('parse_strings_file')
+def bench_parse(ctx):
+    strings_files = ctx['strings_files']
+    return lambda: [LocalizationParser.parse_strings_file(path) for path in strings_files]
+
+
+@benchmark('find_lproj_folders')
+def bench_find_lproj(ctx):
+    return lambda: ProjectInfoExtractor.find_lproj_folders(ctx['project_path'], DEFAULT_IGNORE_FOLDERS)
+
+
+@benchmark('scan_duplicates')
+def bench_scan_duplicates(ctx):
+    from workers.scan_worker import ScanDuplicatesWorker
+    return lambda: run_worker(ScanDuplicatesWorker(ctx['project_path']))
+
+
+@benchmark('compare')
+def bench_compare(ctx):
+    from workers.compare_worker import CompareWorker
+    return lambda: run_worker(CompareWorker(ctx['project_path'], 'en'))
+
+
+@benchmark('length_compare')
+def bench_length_compare(ctx):
+    from workers.length_compare_worker import LengthCompareWorker
+    targets = [lang for lang in ctx['languages'] if lang != 'en'][:3]
+    return lambda: run_worker(LengthCompareWorker(ctx['project_path'], targets, "average"))
+
+
+@benchmark('format_check')
+def bench_format_check(ctx):
+    from models.format_specifier import format_signature
+    from workers.format_check_worker import FormatCheckWorker
+    format_signature.cache_clear()
+    return lambda: run_worker(FormatCheckWorker(ctx['project_path'], 'en'))
+
+
+@benchmark('similar_values')
+def bench_similar_values(ctx):
+    from workers.similar_values_worker import SimilarValuesWorker
+    return lambda: run_worker(SimilarValuesWorker(ctx['project_path'], 'en'))
+
+
+@benchmark('duplicate_values')
+def bench_duplicate_values(ctx):
+    from workers.duplicate_values_worker import DuplicateValuesWorker
+    return lambda: run_worker(DuplicateValuesWorker(ctx['project_path'], 'en'))
+
+
+def scan_strings(project_path: str, keys: list) -> list:
+    """执行 ScanStringsWorker 并返回扫描结果；没有匹配到任何硬编码字符串时抛出异常
+
+    合成项目的源码引用的是英文文案，扫描结果为空说明 key 映射读错了语言，此时的耗时没有意义
+    """
+    from workers.string_replace_worker import ScanStringsWorker
+    _, _, results, _ = run_worker(ScanStringsWorker(project_path, keys, True, True))
+    if not results:
+        raise RuntimeError("ScanStringsWorker 没有匹配到任何硬编码字符串")
+    return results
+
+
+@benchmark('scan_strings')
+def bench_scan_strings(ctx):
+    keys = ctx['keys'][::10]
+    return lambda: scan_strings(ctx['project_path'], keys)
+
+
+@benchmark('replace_strings')
+def bench_replace_strings(ctx):
+    from workers.string_replace_worker import ReplaceStringsWorker
+    project_path = copy_project(ctx)
+    results = scan_strings(project_path, ctx['keys'][::10])
+    return lambda: run_worker(ReplaceStringsWorker(results))
+
+
+@benchmark('import_merge')
+def bench_import(ctx):
+    from workers.import_worker import ImportWorker
+    project_path = copy_project(ctx)
+    mappings = {lang: lang for lang in ctx['languages']}
+    return lambda: run_worker(ImportWorker(ctx['import_zip'], project_path, "bench", mappings, merge_mode=True))
+
+
+@benchmark('export')
+def bench_export(ctx):
+    from workers.export_worker import ExportWorker
+    # 导出 zip 写到临时目录，不写入用户配置的导出路径
+    export_dir = tempfile.mkdtemp(prefix='bench_export_', dir=ctx['work_dir'])
+    return lambda: run_worker(ExportWorker(ctx['project_path'], ['strings', 'xliff', 'json'],
+                                           languages=ctx['languages'], export_path=export_dir))
+
+
+def run_suite(ctx: dict, names: list, repeat: int, memory: bool = False) -> Dict[str, dict]:
+    """每个基准运行 repeat 次（每次前清空扫描缓存和分析缓存、重新准备），记录最小值和中位数
+
+    memory=True 时额外用 tracemalloc 单独运行一次，记录峰值内存（不计入耗时）
+    """
+    results = OrderedDict()
+    for name in names:
+        timings = []
+        for _ in range(repeat):
+            ScanResultCache.clear()
+            AnalysisCache.clear()
+            timed = BENCHMARKS[name](ctx)
+            start = time.perf_counter()
+            timed()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            'min_ms': round(min(timings), 2),
+            'median_ms': round(statistics.median(timings), 2),
+            'runs': repeat,
+        }
+        line = f"  {name:<22} {results[name]['median_ms']:>10.1f} ms  (min {results[name]['min_ms']:.1f})"
+
+        if memory:
+            ScanResultCache.clear()
+            AnalysisCache.clear()
+            timed = BENCHMARKS[name](ctx)
+            tracemalloc.start()
+            try:
+                timed()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            results[name]['peak_mb'] = round(peak / (1024 * 1024), 2)
+            line += f"  峰值 {results[name]['peak_mb']:.1f} MB"
+
+        print(line)
+    return results
+
+
+def compare_with_baseline(results: Dict[str, dict], baseline: dict, threshold: float) -> list:
+    """打印与基线的差异，返回超过阈值的回归项"""
+    regressions = []
+    base_results = baseline.get('results', {})
+    print(f"\n与基线对比（阈值 +{threshold:.0f}%，基线生成于 {baseline.get('created', '未知')}）:")
+    for name, item in results.items():
+        base = base_results.get(name)
+        if not base:
+            print(f"  {name:<22} {'(无基线)':>10}")
+            continue
+        delta = (item['median_ms'] - base['median_ms']) / base['median_ms'] * 100 if base['median_ms'] else 0.0
+        flag = ""
+        if delta > threshold:
+            flag = "  ⚠ 回归"
+            regressions.append((name, delta))
+        elif delta < -threshold:
+            flag = "  ✓ 提升"
+        line = f"  {name:<22} {base['median_ms']:>10.1f} → {item['median_ms']:.1f} ms  ({delta:+.1f}%){flag}"
+
+        if 'peak_mb' in item and base.get('peak_mb'):
+            memory_delta = (item['peak_mb'] - base['peak_mb']) / base['peak_mb'] * 100
+            line += f"  内存 {base['peak_mb']:.1f} → {item['peak_mb']:.1f} MB ({memory_delta:+.1f}%)"
+            if memory_delta > threshold:
+                line += "  ⚠ 内存回归"
+                regressions.append((f"{name} (内存)", memory_delta))
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="热点路径基准测试")
+    parser.add_argument('--scale', choices=list(SCALES), default='medium')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', help=f"逗号分隔的基准名称，可选: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="把本次结果写入基线文件")
+    parser.add_argument('--threshold', type=float, default=20.0, help="中位数变慢超过该百分比视为回归")
+    parser.add_argument('--fail-on-regression', action='store_true', help="有回归时以非零状态退出")
+    parser.add_argument('--memory', action='store_true', help="同时用 tracemalloc 记录每个基准的峰值内存")
+    args = parser.parse_args()
+
+    names = list(BENCHMARKS)
+    if args.only:
+        names = [name.strip() for name in args.only.split(',') if name.strip()]
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            parser.error(f"未知的基准: {', '.join(unknown)}")
+
+    params = dict(SCALES[args.scale])
+    work_dir = tempfile.mkdtemp(prefix='l10n_bench_')
+    try:
+        print(f"生成合成项目（{args.scale}: {params}）...")
+        project = generate_project(
+            os.path.join(work_dir, 'project'),
+            languages=ALL_LANGUAGES[:params['languages']],
+            keys=params['keys'],
+            source_files=params['source_files'],
+            depth=params['depth'],
+        )
+        lproj_folders = ProjectInfoExtractor.find_lproj_folders(project['project_path'], DEFAULT_IGNORE_FOLDERS)
+        ctx = dict(project)
+        ctx['work_dir'] = work_dir
+        ctx['strings_files'] = [os.path.join(path, 'Localizable.strings') for path in lproj_folders.values()]
+        ctx['import_zip'] = generate_import_zip(os.path.join(work_dir, 'import.zip'), project)
+
+        print(f"运行 {len(names)} 个基准，每个 {args.repeat} 次:")
+        results = run_suite(ctx, names, args.repeat, args.memory)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    regressions = []
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('scale') != args.scale:
+            print(f"\n基线规模为 {baseline.get('scale')}，与本次 {args.scale} 不同，跳过对比")
+        else:
+            regressions = compare_with_baseline(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        if baseline and baseline.get('scale') == args.scale:
+            # --only 时保留未运行基准的旧基线
+            merged = OrderedDict(baseline.get('results', {}))
+            merged.update(results)
+            results = merged
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'scale': args.scale,
+                'params': params,
+                'python': platform.python_version(),
+                'machine': f"{platform.system()} {platform.machine()}",
+                'results': results,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ 基线已保存到 {args.baseline}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
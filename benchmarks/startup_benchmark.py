@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动耗时基准
+1. 首帧时间：以 L10N_STARTUP_PROBE=1 启动 main.py，首帧绘制后程序输出耗时并退出
+2. 导入耗时：python -X importtime 导入主窗口模块，列出自身耗时最多的模块
+
+用法:
+    python -m benchmarks.startup_benchmark                   # 默认 5 次，预算 300ms
+    python -m benchmarks.startup_benchmark --offscreen --fail-over-budget
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 启动预算（毫秒，首帧时间中位数）
+DEFAULT_BUDGET_MS = 300.0
+
+
+def measure_first_paint(offscreen: bool, timeout: float = 30.0) -> Tuple[Optional[float], float]:
+    """启动一次程序，返回 (进程内首帧耗时 ms, 含解释器启动和退出的总耗时 ms)"""
+    env = dict(os.environ, L10N_STARTUP_PROBE='1')
+    if offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, os.path.join(PROJECT_ROOT, 'main.py')],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=timeout
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    for line in completed.stdout.splitlines():
+        line = line.strip()
+        if line.startswith('{') and 'first_paint_ms' in line:
+            return json.loads(line)['first_paint_ms'], wall_ms
+    sys.stderr.write(completed.stderr[-2000:])
+    return None, wall_ms
+
+
+def measure_import_time(module: str = 'views.main_window') -> List[Tuple[str, int, int]]:
+    """-X importtime 导入模块，返回 [(模块, 自身耗时 us, 累计耗时 us)]，按自身耗时倒序"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="启动耗时基准")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help="首帧时间中位数预算（毫秒）")
+    parser.add_argument('--offscreen', action='store_true', help="使用 Qt offscreen 平台（CI / 无显示器环境）")
+    parser.add_argument('--top', type=int, default=15, help="显示自身导入耗时最多的前 N 个模块")
+    parser.add_argument('--fail-over-budget', action='store_true', help="超出预算时以非零状态退出")
+    args = parser.parse_args()
+
+    print(f"首帧时间（{args.repeat} 次）:")
+    first_paints = []
+    for run in range(1, args.repeat + 1):
+        first_paint, wall = measure_first_paint(args.offscreen)
+        if first_paint is None:
+            print(f"  #{run}: 未获取到首帧时间（进程 {wall:.0f} ms）")
+            continue
+        first_paints.append(first_paint)
+        print(f"  #{run}: 首帧 {first_paint:.1f} ms，进程总耗时 {wall:.0f} ms")
+
+    rows = measure_import_time()
+    if rows:
+        total_us = max(row[2] for row in rows)
+        print(f"\n导入 views.main_window 共 {total_us / 1000:.1f} ms，自身耗时最多的模块:")
+        for name, self_us, cumulative_us in rows[:args.top]:
+            print(f"  {self_us / 1000:>8.1f} ms  (累计 {cumulative_us / 1000:>7.1f} ms)  {name.strip()}")
+
+    if not first_paints:
+        print("\n⚠ 没有成功的启动记录")
+        sys.exit(1)
+
+    median = statistics.median(first_paints)
+    over_budget = median > args.budget
+    flag = "⚠ 超出预算" if over_budget else "✓"
+    print(f"\n首帧中位数 {median:.1f} ms（预算 {args.budget:.0f} ms）{flag}")
+    if over_budget and args.fail_over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
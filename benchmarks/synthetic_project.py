@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成 iOS 项目生成器
+按给定的语言数、key 数、重复比例、源文件数和目录深度生成一个可重复（固定随机种子）的项目，
+供基准测试和手动压测使用
+
+用法:
+    python -m benchmarks.synthetic_project /tmp/SyntheticApp --keys 20000 --languages 12
+"""
+
+import argparse
+import os
+import random
+import sys
+import zipfile
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.localization_parser import escape_strings_text
+
+ALL_LANGUAGES = [
+    'en', 'zh-Hans', 'zh-Hant', 'ja', 'ko', 'de', 'fr', 'es', 'it', 'pt-BR',
+    'ru', 'ar', 'th', 'vi', 'id', 'tr', 'pl', 'nl', 'sv', 'he',
+]
+
+# 各语言的译文长度系数（相对英文），让长度对比有结果
+LENGTH_FACTORS = {'de': 1.35, 'fr': 1.2, 'es': 1.15, 'ru': 1.25, 'ja': 0.6, 'ko': 0.7, 'zh-Hans': 0.45, 'zh-Hant': 0.45}
+
+WORDS = [
+    'account', 'settings', 'cancel', 'confirm', 'delete', 'photo', 'video', 'share', 'profile', 'message',
+    'network', 'error', 'retry', 'upload', 'download', 'search', 'filter', 'history', 'privacy', 'notice',
+    'subscribe', 'premium', 'restore', 'purchase', 'language', 'version', 'update', 'available', 'loading', 'done',
+]
+
+
+def make_key(index: int) -> str:
+    return f"module_{index // 500}_item_{index}"
+
+
+def make_value(rng: random.Random, index: int) -> str:
+    """英文值；约 2% 带换行、引号等需要转义的字符，5% 带格式符"""
+    words = rng.choices(WORDS, k=rng.randint(1, 8))
+    value = f"{' '.join(words).capitalize()} {index}"
+    if index % 20 == 0:
+        value += " %@" if index % 40 == 0 else " %d"
+    if rng.random() < 0.02:
+        value += '\n"quoted" \\ tail'
+    return value
+
+
+def translate(value: str, lang_code: str, rng: random.Random) -> str:
+    """伪译文：按语言系数伸缩长度，带语言前缀便于肉眼区分"""
+    if lang_code == 'en':
+        return value
+    factor = LENGTH_FACTORS.get(lang_code, 1.1) * rng.uniform(0.8, 1.4)
+    length = max(1, int(len(value) * factor))
+    body = (value * (length // len(value) + 1))[:length]
+    return f"[{lang_code}] {body}"
+
+
+def write_strings(file_path: str, entries: List[tuple]):
+    """entries: [(key, value)] 或 [(None, 注释)]"""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('/* Generated by benchmarks.synthetic_project */\n\n')
+        for key, value in entries:
+            if key is None:
+                f.write(f'\n//<!-- ========== {value} 新增 ========== -->\n')
+            else:
+                f.write(f'"{escape_strings_text(key)}" = "{escape_strings_text(value)}";\n')
+
+
+def nested_dir(root: str, index: int, depth: int, fanout: int = 4) -> str:
+    """按序号把文件分散到 depth 层的目录树中"""
+    parts = []
+    for level in range(depth):
+        parts.append(f"Group{(index // (fanout ** level)) % fanout}")
+    return os.path.join(root, *parts)
+
+
+def generate_project(
+    output_dir: str,
+    languages: Optional[List[str]] = None,
+    keys: int = 2000,
+    duplicate_ratio: float = 0.01,
+    source_files: int = 200,
+    depth: int = 3,
+    references_per_file: int = 20,
+    seed: int = 0
+) -> Dict:
+    """生成合成项目
+
+    Args:
+        output_dir: 项目根目录（不存在时创建）
+        languages: 语言列表，默认取 ALL_LANGUAGES 前 8 个
+        keys: 每个语言的 key 数
+        duplicate_ratio: 重复 key 的比例（同一 key 在文件后部再次出现）
+        source_files: .swift / .m 源文件数
+        depth: lproj 和源文件所在目录的嵌套深度
+        references_per_file: 每个源文件中引用英文值的硬编码字符串数量
+        seed: 随机种子，相同参数生成的项目完全相同
+
+    Returns:
+        {'project_path', 'languages', 'keys', 'values', 'source_files', 'strings_bytes'}
+    """
+    rng = random.Random(seed)
+    languages = list(languages or ALL_LANGUAGES[:8])
+    key_names = [make_key(i) for i in range(keys)]
+    values = [make_value(rng, i) for i in range(keys)]
+
+    app_dir = os.path.join(output_dir, 'SyntheticApp')
+    resources_dir = nested_dir(os.path.join(app_dir, 'Resources'), 0, max(depth - 1, 0))
+
+    # 1. 各语言的 Localizable.strings（中间穿插版本注释块）
+    duplicate_count = int(keys * duplicate_ratio)
+    strings_bytes = 0
+    for lang_code in languages:
+        lang_rng = random.Random(f"{seed}:{lang_code}")
+        entries = []
+        for index, (key, value) in enumerate(zip(key_names, values)):
+            if index and index % 1000 == 0:
+                entries.append((None, f"1.{index // 1000}.0"))
+            entries.append((key, translate(value, lang_code, lang_rng)))
+        for index in lang_rng.sample(range(keys), duplicate_count):
+            entries.append((key_names[index], translate(values[index], lang_code, lang_rng)))
+
+        strings_file = os.path.join(resources_dir, f"{lang_code}.lproj", 'Localizable.strings')
+        write_strings(strings_file, entries)
+        strings_bytes += os.path.getsize(strings_file)
+
+    # 2. 源文件：一半 Swift 一半 OC，混合本地化调用和普通代码
+    sources_root = os.path.join(app_dir, 'Sources')
+    for index in range(source_files):
+        folder = nested_dir(sources_root, index, depth)
+        os.makedirs(folder, exist_ok=True)
+        is_swift = index % 2 == 0
+        file_path = os.path.join(folder, f"Feature{index}{'.swift' if is_swift else '.m'}")
+        lines = []
+        for line_index in range(references_per_file * 3):
+            if line_index % 3 == 0 and values:
+                value = values[rng.randrange(keys)].split('\n', 1)[0].replace('"', '')
+                if is_swift:
+                    lines.append(f'        label.text = "{value}".localized')
+                else:
+                    lines.append(f'    self.titleLabel.text = Localized(@"{value}");')
+            else:
+                lines.append(f'    let value{line_index} = compute({line_index}) // plain code' if is_swift
+                             else f'    NSInteger value{line_index} = [self compute:{line_index}];')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    # 3. 应被忽略的目录
+    write_strings(os.path.join(app_dir, 'Pods', 'SomePod', 'en.lproj', 'Localizable.strings'), [('pod_key', 'Pod value')])
+
+    return {
+        'project_path': output_dir,
+        'languages': languages,
+        'keys': key_names,
+        'values': values,
+        'source_files': source_files,
+        'strings_bytes': strings_bytes,
+    }
+
+
+def generate_import_zip(
+    zip_path: str,
+    project: Dict,
+    new_keys: int = 500,
+    changed_ratio: float = 0.1,
+    seed: int = 1
+) -> str:
+    """生成待导入的 zip（<lang>.strings），包含部分修改的已有 key 和 new_keys 个新 key"""
+    rng = random.Random(seed)
+    key_names, values = project['keys'], project['values']
+    changed = rng.sample(range(len(key_names)), int(len(key_names) * changed_ratio))
+
+    os.makedirs(os.path.dirname(os.path.abspath(zip_path)), exist_ok=True)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for lang_code in project['languages']:
+            lines = []
+            for index in changed:
+                value = translate(values[index], lang_code, rng) + ' (updated)'
+                lines.append(f'"{escape_strings_text(key_names[index])}" = "{escape_strings_text(value)}";')
+            for index in range(new_keys):
+                value = translate(make_value(rng, index), lang_code, rng)
+                lines.append(f'"imported_key_{index}" = "{escape_strings_text(value)}";')
+            zf.writestr(f"{lang_code}.strings", '\n'.join(lines) + '\n')
+    return zip_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成合成 iOS 多语言项目")
+    parser.add_argument('output_dir')
+    parser.add_argument('--languages', type=int, default=8, help=f"语言数（最多 {len(ALL_LANGUAGES)}）")
+    parser.add_argument('--keys', type=int, default=2000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.01)
+    parser.add_argument('--source-files', type=int, default=200)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--import-zip', help="同时生成待导入的 zip 到该路径")
+    args = parser.parse_args()
+
+    project = generate_project(
+        args.output_dir,
+        languages=ALL_LANGUAGES[:args.languages],
+        keys=args.keys,
+        duplicate_ratio=args.duplicate_ratio,
+        source_files=args.source_files,
+        depth=args.depth,
+        seed=args.seed,
+    )
+    print(f"✓ 已生成 {args.output_dir}: {len(project['languages'])} 个语言 × {args.keys} 个 key，"
+          f"{args.source_files} 个源文件，.strings 共 {project['strings_bytes'] / (1024 * 1024):.1f} MB")
+
+    if args.import_zip:
+        generate_import_zip(args.import_zip, project)
+        print(f"✓ 已生成导入文件 {args.import_zip}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,17 +8,36 @@ iOS 多语言管理工具 - 主入口
 3. 选择下载的 zip 包，一键导入到项目对应的语言文件中
 """
 
+import json
+import os
 import sys
+import time
+
+STARTED = time.perf_counter()
+
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 from views import MainWindow
+from workers.worker_pool import WorkerPool
+
+# 环境变量 L10N_STARTUP_PROBE=1 时，首帧绘制后输出启动耗时并退出（供 benchmarks.startup_benchmark 使用）
+STARTUP_PROBE_ENV = 'L10N_STARTUP_PROBE'
 
 
 def main():
     """程序入口"""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # 使用 Fusion 风格
+    app.aboutToQuit.connect(WorkerPool.shutdown)  # 退出前取消后台任务，等待池线程结束
     
     window = MainWindow()
+    
+    if os.environ.get(STARTUP_PROBE_ENV) == '1':
+        def report_first_paint():
+            print(json.dumps({'first_paint_ms': (time.perf_counter() - STARTED) * 1000}), flush=True)
+            QTimer.singleShot(0, app.quit)
+        window.first_painted.connect(report_first_paint)
+    
     window.show()
     
     sys.exit(app.exec())
@@ -1,6 +1,15 @@
 # Models module
 from .localization_parser import LocalizationParser
 from .project_info import ProjectInfoExtractor
+from .key_usage_index import KeyUsageIndex
+from .xcstrings_parser import XCStringsParser
+from .xliff_parser import XLIFFParser
+from .zip_index import ZipIndex
+from .cancellation import OperationCancelled
+from .format_specifier import FormatSpecifierChecker
+from .near_duplicates import NearDuplicateFinder
+from .value_index import ValueIndex
+from .translation_memory import TranslationMemory
 
-__all__ = ['LocalizationParser', 'ProjectInfoExtractor']
+__all__ = ['LocalizationParser', 'ProjectInfoExtractor', 'KeyUsageIndex', 'XCStringsParser', 'XLIFFParser', 'ZipIndex', 'OperationCancelled', 'FormatSpecifierChecker', 'NearDuplicateFinder', 'ValueIndex', 'TranslationMemory']
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分析结果缓存
+按「语言文件内容版本 + 分析参数」缓存整次分析的结果（长度对比、多语言对比等），
+只改参数重新分析时复用已读取的数据，语言文件没变且参数相同时直接返回上次的结果
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+# 每种分析默认最多保留的结果数（按最近使用淘汰）
+DEFAULT_LIMIT = 4
+
+
+class AnalysisCache:
+    """进程内的分析结果缓存
+
+    - name 区分不同的分析（如 'length_data'、'length_compare'、'compare'）
+    - version 为参与分析的所有语言文件的 (路径, mtime, size)，任一文件变化后自然失效
+    - params 为影响结果的参数（只影响展示的参数如阈值不要放进来，由界面在内存中过滤）
+    """
+
+    _lock = threading.Lock()
+    _entries: 'OrderedDict[Tuple[str, tuple, Hashable], Any]' = OrderedDict()
+
+    @staticmethod
+    def catalog_version(files: Iterable[str]) -> tuple:
+        """语言文件的内容版本，不存在的文件记为 (路径, None, None)"""
+        version = []
+        for file_path in sorted(set(files)):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                version.append((file_path, None, None))
+                continue
+            version.append((file_path, stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
+    @classmethod
+    def get(cls, name: str, version: tuple, params: Hashable = ()) -> Optional[Any]:
+        """获取缓存结果，没有时返回 None"""
+        key = (name, version, params)
+        with cls._lock:
+            value = cls._entries.get(key)
+            if value is not None:
+                cls._entries.move_to_end(key)
+            return value
+
+    @classmethod
+    def put(cls, name: str, version: tuple, params: Hashable, value: Any, limit: int = DEFAULT_LIMIT):
+        """写入缓存结果（结果会被多次返回，调用方之后不能再修改它）"""
+        key = (name, version, params)
+        with cls._lock:
+            cls._entries[key] = value
+            cls._entries.move_to_end(key)
+            same_name = [k for k in cls._entries if k[0] == name]
+            for stale in same_name[:max(0, len(same_name) - limit)]:
+                del cls._entries[stale]
+
+    @classmethod
+    def clear(cls, name: Optional[str] = None):
+        """清空缓存（可只清空某种分析）"""
+        with cls._lock:
+            if name is None:
+                cls._entries.clear()
+            else:
+                for key in [k for k in cls._entries if k[0] == name]:
+                    del cls._entries[key]
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+协作式取消
+解析器、扫描器的内层循环每处理 CANCEL_CHECK_INTERVAL 行 / 条目检查一次取消标志，
+取消时抛出 OperationCancelled，由 worker 统一处理（部分结果不会写入缓存）
+"""
+
+from typing import Callable, Optional
+
+# 内层循环每处理这么多行 / 条目检查一次取消（单次检查只是一次属性读取，间隔内的耗时远小于 50ms）
+CANCEL_CHECK_INTERVAL = 1024
+
+
+class OperationCancelled(Exception):
+    """操作被取消"""
+
+    def __init__(self, message: str = "操作已取消"):
+        super().__init__(message)
+
+
+def raise_if_cancelled(should_stop: Optional[Callable[[], bool]]):
+    """should_stop() 为真时抛出 OperationCancelled"""
+    if should_stop is not None and should_stop():
+        raise OperationCancelled()
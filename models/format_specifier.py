@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+格式符一致性检查
+把 value 中的 printf / NSString 格式符（%@、%d、%1$@、%lld ...）解析为签名，
+同一个 key 在各语言中的签名不一致（少参数、多参数、类型不同）时，运行时可能取错参数甚至崩溃
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, raise_if_cancelled
+
+# 格式符：%[位置$][标志][宽度][.精度][长度]转换符
+# 不支持空格标志：它极少使用，却会把「50% discount」中的「% d」误判为格式符
+FORMAT_SPECIFIER_PATTERN = re.compile(
+    r"%(?:(?P<position>[1-9]\d*)\$)?[-+#0']*(?:\d+|\*)?(?:\.(?:\d+|\*))?"
+    r"(?P<length>hh|h|ll|l|q|L|z|t|j)?(?P<conversion>[@dDiuUxXoOfFeEgGaAcCsSp%])"
+)
+
+# 转换符归类：同一类的转换符读取的参数类型相同（如 %d 与 %x）
+CONVERSION_CLASSES = {
+    '@': '@',
+    'd': 'd', 'i': 'd', 'u': 'd', 'x': 'd', 'X': 'd', 'o': 'd',
+    'D': 'ld', 'U': 'ld', 'O': 'ld',
+    'f': 'f', 'F': 'f', 'e': 'f', 'E': 'f', 'g': 'f', 'G': 'f', 'a': 'f', 'A': 'f',
+    'c': 'c', 'C': 'C',
+    's': 's', 'S': 'S',
+    'p': 'p',
+}
+
+# 长度修饰归类：h / hh 会被提升为 int；z / t / j 在 64 位上与 l 相同；q 即 ll
+LENGTH_CLASSES = {'hh': '', 'h': '', 'l': 'l', 'll': 'll', 'q': 'll', 'z': 'l', 't': 'l', 'j': 'l', 'L': 'L'}
+
+# 签名缓存大小（按 value 缓存，各语言中重复的 value 只解析一次）
+SIGNATURE_CACHE_SIZE = 65536
+
+# 签名：((参数位置, 参数类型), ...)，按位置排序
+Signature = Tuple[Tuple[int, str], ...]
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def format_signature(value: str) -> Signature:
+    """解析 value 的格式符签名，没有格式符时返回 ()"""
+    if '%' not in value:
+        return ()
+
+    arguments = {}
+    next_position = 1
+    for match in FORMAT_SPECIFIER_PATTERN.finditer(value):
+        conversion = match.group('conversion')
+        if conversion == '%':
+            continue  # %% 是字面量
+        position = match.group('position')
+        if position is None:
+            position = next_position
+            next_position += 1
+        else:
+            position = int(position)
+        length = LENGTH_CLASSES.get(match.group('length') or '', '')
+        conversion_class = CONVERSION_CLASSES[conversion]
+        if conversion_class == 'ld':
+            length, conversion_class = 'l', 'd'
+        if conversion_class in ('@', 'c', 'C', 's', 'S', 'p') or (conversion_class == 'f' and length != 'L'):
+            length = ''  # 这些转换符的长度修饰不影响参数类型（%lf 与 %f 相同）
+        arguments.setdefault(position, length + conversion_class)
+    return tuple(sorted(arguments.items()))
+
+
+def signature_text(signature: Signature) -> str:
+    """签名显示为 "%1$@ %2$ld"，没有格式符时为 "（无）" """
+    if not signature:
+        return "（无）"
+    return " ".join(f"%{position}${arg_type}" for position, arg_type in signature)
+
+
+class FormatSpecifierChecker:
+    """对比同一个 key 在各语言中的格式符签名"""
+
+    @staticmethod
+    def describe_mismatch(expected: Signature, actual: Signature) -> Tuple[str, str]:
+        """返回 (严重程度, 问题描述)
+
+        多出参数或类型不同会读取错误的参数（可能崩溃），为 'error'；只缺少参数为 'warning'
+        """
+        expected_args = dict(expected)
+        actual_args = dict(actual)
+        problems = []
+        severity = 'warning'
+
+        for position, arg_type in expected:
+            if position not in actual_args:
+                problems.append(f"缺少 %{position}${arg_type}")
+            elif actual_args[position] != arg_type:
+                problems.append(f"%{position}$ 类型 {arg_type} → {actual_args[position]}")
+                severity = 'error'
+        for position, arg_type in actual:
+            if position not in expected_args:
+                problems.append(f"多出 %{position}${arg_type}")
+                severity = 'error'
+        return severity, "；".join(problems)
+
+    @staticmethod
+    def check(
+        all_lang_data: Dict[str, dict],
+        base_lang: str,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> List[dict]:
+        """检查所有 key 的格式符是否与基准语言一致
+
+        基准语言没有该 key 时，以各语言中出现最多的签名为准。
+
+        Args:
+            all_lang_data: {lang_code: {key: value}}
+            base_lang: 基准语言
+
+        Returns:
+            [{key, lang, value, signature, base_lang, base_value, base_signature, severity, problem}]，
+            按 key、语言排序；should_stop 为真时抛出 OperationCancelled
+        """
+        # 只有至少一个语言带格式符的 key 才需要对比
+        candidate_keys = set()
+        for lang_data in all_lang_data.values():
+            raise_if_cancelled(should_stop)
+            candidate_keys.update(key for key, value in lang_data.items() if '%' in value and format_signature(value))
+
+        base_data = all_lang_data.get(base_lang, {})
+        mismatches = []
+        for index, key in enumerate(sorted(candidate_keys)):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+
+            values = {lang: lang_data[key] for lang, lang_data in all_lang_data.items() if key in lang_data}
+            signatures = {lang: format_signature(value) for lang, value in values.items()}
+
+            if key in base_data:
+                reference_lang = base_lang
+            else:
+                common = Counter(signatures.values()).most_common(1)[0][0]
+                reference_lang = min(lang for lang, signature in signatures.items() if signature == common)
+            expected = signatures[reference_lang]
+
+            for lang in sorted(signatures):
+                if lang == reference_lang or signatures[lang] == expected:
+                    continue
+                severity, problem = FormatSpecifierChecker.describe_mismatch(expected, signatures[lang])
+                mismatches.append({
+                    'key': key,
+                    'lang': lang,
+                    'value': values[lang],
+                    'signature': signatures[lang],
+                    'base_lang': reference_lang,
+                    'base_value': values[reference_lang],
+                    'base_signature': expected,
+                    'severity': severity,
+                    'problem': problem,
+                })
+        return mismatches
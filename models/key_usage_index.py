@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Key 引用索引
+维护 key → 代码位置（file:line）的倒排索引，按文件增量更新
+"""
+
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple, Callable
+
+
+class KeyUsageIndex:
+    """key → [(file, line), ...] 倒排索引
+
+    以文件为单位记录每个源文件贡献的 key 及行号，并记住文件的 mtime/size：
+    - refresh() 只重新扫描新增或修改过的文件，删除的文件从索引中移除
+    - lookup() / usage_count() 是 O(1) 的字典查找，不会触发扫描
+
+    索引可能在后台线程刷新、在 UI 线程查询，所有读写都通过锁保护。
+    reset() 会使正在进行的刷新过期，过期的刷新不再写入索引（切换项目时旧项目的刷新不会混入新索引）。
+    """
+
+    # 需要扫描的源文件类型
+    SOURCE_EXTENSIONS = ('.m', '.mm', '.h', '.swift')
+
+    # 多语言调用中的 key（预编译以提高性能）
+    USAGE_PATTERNS = [
+        # OC / Swift 函数调用: NSLocalizedString(@"key", ...) / Localized("key")
+        re.compile(r'(?:NSLocalizedString|Localized|LocaRemoveTaglized|enLocalized|D_Localized|'
+                   r'D_enLocalized|locaRemoveTaglized|LocalizedFormat)\s*\(\s*@?"((?:[^"\\\n]|\\.)*)"'),
+        # Swift: String(localized: "key")
+        re.compile(r'String\s*\(\s*localized\s*:\s*"((?:[^"\\\n]|\\.)*)"'),
+        # Swift 属性语法: "key".localized
+        re.compile(r'"((?:[^"\\\n]|\\.)*)"\s*\.\s*localized'),
+    ]
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.project_path = None
+        self._generation = 0  # 每次 reset 加一，刷新开始时记下，不一致说明已过期
+        # {file_path: (mtime_ns, size, {key: [line1, line2, ...]})}
+        self._file_entries: Dict[str, Tuple[int, int, Dict[str, List[int]]]] = {}
+        # {key: {file_path: [line1, line2, ...]}}
+        self._index: Dict[str, Dict[str, List[int]]] = {}
+
+    def reset(self, project_path: Optional[str] = None):
+        """清空索引（切换项目时调用）"""
+        with self._lock:
+            self.project_path = project_path
+            self._generation += 1
+            self._file_entries.clear()
+            self._index.clear()
+
+    @property
+    def generation(self) -> int:
+        """reset 的次数（每次切换项目加一）"""
+        with self._lock:
+            return self._generation
+
+    @property
+    def file_count(self) -> int:
+        with self._lock:
+            return len(self._file_entries)
+
+    @property
+    def key_count(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def lookup(self, key: str) -> List[Tuple[str, int]]:
+        """查询 key 的所有引用位置，返回 [(file_path, line), ...]"""
+        with self._lock:
+            locations = self._index.get(key)
+            if not locations:
+                return []
+            return [(path, line) for path in sorted(locations) for line in locations[path]]
+
+    def usage_count(self, key: str) -> int:
+        """查询 key 被引用的次数"""
+        with self._lock:
+            locations = self._index.get(key)
+            if not locations:
+                return 0
+            return sum(len(lines) for lines in locations.values())
+
+    def refresh(self, project_path: str, ignore_folders: List[str],
+                should_stop: Callable[[], bool] = None) -> Tuple[int, int, int]:
+        """增量刷新索引
+
+        索引属于其他项目时（切换项目后旧项目的刷新）直接返回，切换项目时先调用 reset(新路径)
+
+        Returns:
+            (rescanned, removed, total) 重新扫描的文件数、移除的文件数、索引中的文件总数
+        """
+        with self._lock:
+            if self.project_path is None:
+                self.reset(project_path)
+            elif project_path != self.project_path:
+                return 0, 0, len(self._file_entries)
+            generation = self._generation
+
+        def stopped() -> bool:
+            return self._generation != generation or bool(should_stop and should_stop())
+
+        seen = set()
+        rescanned = 0
+
+        for root, dirs, files in os.walk(project_path):
+            if stopped():
+                break
+
+            # 排除无关目录
+            dirs[:] = [d for d in dirs if d not in ignore_folders]
+
+            for file in files:
+                if stopped():
+                    break  # 外层循环下一次迭代时退出
+                if not file.endswith(self.SOURCE_EXTENSIONS):
+                    continue
+
+                file_path = os.path.join(root, file)
+                seen.add(file_path)
+                if self.update_file(file_path, generation):
+                    rescanned += 1
+        else:
+            # 只有完整遍历后才能确定哪些文件被删除
+            removed = 0
+            with self._lock:
+                if self._generation != generation:
+                    return rescanned, 0, len(self._file_entries)
+                for file_path in [p for p in self._file_entries if p not in seen]:
+                    self._remove_file(file_path)
+                    removed += 1
+            return rescanned, removed, self.file_count
+
+        return rescanned, 0, self.file_count
+
+    def update_file(self, file_path: str, generation: Optional[int] = None) -> bool:
+        """如果文件有变化则重新扫描，返回是否重新扫描
+
+        指定 generation 时，索引在此期间被 reset 过则不写入
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            with self._lock:
+                if generation is None or generation == self._generation:
+                    self._remove_file(file_path)
+            return False
+
+        with self._lock:
+            cached = self._file_entries.get(file_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return False
+
+        usages = self.scan_source_file(file_path)
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._remove_file(file_path)
+            self._file_entries[file_path] = (stat.st_mtime_ns, stat.st_size, usages)
+            for key, lines in usages.items():
+                self._index.setdefault(key, {})[file_path] = lines
+        return True
+
+    def _remove_file(self, file_path: str):
+        """从倒排索引中移除某个文件的贡献（调用方需持有锁）"""
+        cached = self._file_entries.pop(file_path, None)
+        if not cached:
+            return
+        for key in cached[2]:
+            locations = self._index.get(key)
+            if locations is None:
+                continue
+            locations.pop(file_path, None)
+            if not locations:
+                del self._index[key]
+
+    @classmethod
+    def scan_source_file(cls, file_path: str) -> Dict[str, List[int]]:
+        """扫描单个源文件，返回 {key: [line1, line2, ...]}"""
+        usages = {}
+
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"读取源文件出错 {file_path}: {e}")
+            return usages
+
+        # 快速过滤：没有多语言调用的文件直接跳过
+        if 'ocalized' not in content:
+            return usages
+
+        matches = []
+        for pattern in cls.USAGE_PATTERNS:
+            for match in pattern.finditer(content):
+                if match.group(1):
+                    matches.append((match.start(), match.group(1)))
+
+        # 按位置排序后增量计算行号，避免每个匹配都从头数换行
+        matches.sort()
+        line = 1
+        last_pos = 0
+        for pos, key in matches:
+            line += content.count('\n', last_pos, pos)
+            last_pos = pos
+            lines = usages.setdefault(key, [])
+            if not lines or lines[-1] != line:
+                lines.append(line)
+
+        return usages
@@ -8,21 +8,64 @@
 import os
 import re
 from collections import OrderedDict
-from typing import Optional
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, OperationCancelled, raise_if_cancelled
+from utils.perf import span
+
+# 注释或 "key" = "value"; 条目（先匹配注释，注释中的引号不会被当作条目）
+ENTRY_SPAN_PATTERN = re.compile(
+    r'(?P<comment>/\*.*?\*/|//[^\n]*)'
+    r'|"(?P<key>(?:[^"\\]|\\.)*)"\s*=\s*"(?P<value>(?:[^"\\]|\\.)*)"\s*;',
+    re.DOTALL
+)
+
+
+# .strings 的转义序列：\Uxxxx / \uxxxx（UTF-16 码元）或反斜杠加单个字符
+_ESCAPE_PATTERN = re.compile(r'\\(?:[Uu]([0-9a-fA-F]{4})|(.))', re.DOTALL)
+_UNESCAPE_CHARS = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+_ESCAPE_CHARS = {'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t', '\r': '\\r', '\0': '\\0'}
+_NEEDS_ESCAPE = re.compile(r'[\\"\n\t\r\0]')
+
+
+def _unescape_match(match: 're.Match') -> str:
+    if match.group(1) is not None:
+        return chr(int(match.group(1), 16))
+    char = match.group(2)
+    # \\ \" \' 以及未知的转义都取字符本身
+    return _UNESCAPE_CHARS.get(char, char)
+
+
+def unescape_strings_text(text: str) -> str:
+    r"""解码 .strings 中的转义字符（\\ \" \' \n \t \r \0 \Uxxxx \uxxxx）"""
+    if '\\' not in text:
+        return text
+    text = _ESCAPE_PATTERN.sub(_unescape_match, text)
+    # \UD83D\UDE00 这类代理对解码后合并为一个字符
+    if any('\ud800' <= char <= '\udfff' for char in text):
+        text = text.encode('utf-16', 'surrogatepass').decode('utf-16', 'replace')
+    return text
+
+
+def escape_strings_text(text: str) -> str:
+    """转义 .strings 中的特殊字符（与 unescape_strings_text 对应，其他字符按 UTF-8 原样写出）"""
+    return _NEEDS_ESCAPE.sub(lambda match: _ESCAPE_CHARS[match.group()], text)
 
 
 class LocalizationParser:
     """处理 .strings 文件的解析和写入"""
     
     @staticmethod
-    def parse_strings_file(file_path: str) -> OrderedDict:
+    def parse_strings_file(file_path: str, should_stop: Callable[[], bool] = None) -> OrderedDict:
         """解析 .strings 文件，返回有序字典保持原始顺序
         
         支持：
         - 单行格式: "key" = "value";
         - 多行格式: "key" = "line1\nline2\nline3";
-        - 转义字符: \", \\, \n, \t
+        - 转义字符: \", \', \\, \n, \t, \r, \0, \\Uxxxx
         - 注释: // 和 /* */
+        
+        should_stop 每 CANCEL_CHECK_INTERVAL 行 / 条目检查一次，取消时抛出 OperationCancelled
         """
         result = OrderedDict()
         
@@ -30,49 +73,56 @@ class LocalizationParser:
             return result
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 移除多行注释 /* ... */
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+            with span('read', 'LocalizationParser', file=os.path.basename(os.path.dirname(file_path))) as counters:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                counters['bytes'] = len(content)
             
-            # 移除单行注释 //
-            lines = content.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                # 移除 // 注释（但保留字符串内的 //）
-                if '//' in line:
-                    # 简单处理：如果 // 在字符串外，则移除
-                    in_string = False
-                    escape_next = False
-                    for i, char in enumerate(line):
-                        if escape_next:
-                            escape_next = False
-                            continue
-                        if char == '\\':
-                            escape_next = True
-                            continue
-                        if char == '"':
-                            in_string = not in_string
-                        if not in_string and i < len(line) - 1 and line[i:i+2] == '//':
-                            line = line[:i]
-                            break
-                cleaned_lines.append(line)
-            
-            content = '\n'.join(cleaned_lines)
-            
-            # 使用正则匹配所有 "key" = "value"; 对
-            # (?:[^"\\]|\\.)* 匹配：非引号非反斜杠的字符，或反斜杠后跟任意字符（转义）
-            # re.DOTALL 让 . 匹配换行符
-            pattern = r'"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;'
-            matches = re.findall(pattern, content, re.DOTALL)
-            
-            for key, value in matches:
-                # 解码转义字符（注意顺序）
-                key = key.replace('\\\\', '\x00').replace('\\"', '"').replace('\\n', '\n').replace('\\t', '\t').replace('\x00', '\\')
-                value = value.replace('\\\\', '\x00').replace('\\"', '"').replace('\\n', '\n').replace('\\t', '\t').replace('\x00', '\\')
-                result[key] = value
+            with span('parse', 'LocalizationParser') as counters:
+                # 移除多行注释 /* ... */
+                content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+                
+                # 移除单行注释 //
+                lines = content.split('\n')
+                cleaned_lines = []
+                for line_index, line in enumerate(lines):
+                    if line_index % CANCEL_CHECK_INTERVAL == 0:
+                        raise_if_cancelled(should_stop)
+                    # 移除 // 注释（但保留字符串内的 //）
+                    if '//' in line:
+                        # 简单处理：如果 // 在字符串外，则移除
+                        in_string = False
+                        escape_next = False
+                        for i, char in enumerate(line):
+                            if escape_next:
+                                escape_next = False
+                                continue
+                            if char == '\\':
+                                escape_next = True
+                                continue
+                            if char == '"':
+                                in_string = not in_string
+                            if not in_string and i < len(line) - 1 and line[i:i+2] == '//':
+                                line = line[:i]
+                                break
+                    cleaned_lines.append(line)
+                
+                content = '\n'.join(cleaned_lines)
+                
+                # 使用正则匹配所有 "key" = "value"; 对
+                # (?:[^"\\]|\\.)* 匹配：非引号非反斜杠的字符，或反斜杠后跟任意字符（转义）
+                # re.DOTALL 让 . 匹配换行符
+                pattern = r'"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;'
+                for index, match in enumerate(re.finditer(pattern, content, re.DOTALL)):
+                    if index % CANCEL_CHECK_INTERVAL == 0:
+                        raise_if_cancelled(should_stop)
+                    key, value = match.groups()
+                    # 解码转义字符
+                    result[unescape_strings_text(key)] = unescape_strings_text(value)
+                counters['entries'] = len(result)
                 
+        except OperationCancelled:
+            raise
         except Exception as e:
             print(f"解析文件出错 {file_path}: {e}")
         
@@ -127,6 +177,18 @@ class LocalizationParser:
         except Exception as e:
             print(f"追加文件出错 {file_path}: {e}")
     
+    @staticmethod
+    def append_entries_with_version(file_path: str, data: Dict[str, str], version: str):
+        """把条目追加到文件末尾，用版本号注释包裹（格式同 append_strings_with_version）"""
+        try:
+            with open(file_path, 'a', encoding='utf-8') as f:
+                f.write(f'\n\n//<!-- ========== {version} 新增 ========== -->\n')
+                for key, value in data.items():
+                    f.write(f'"{escape_strings_text(key)}" = "{escape_strings_text(value)}";\n')
+                f.write(f'//<!-- ========== {version} 新增 ========== -->\n')
+        except Exception as e:
+            print(f"追加文件出错 {file_path}: {e}")
+    
     @staticmethod
     def remove_duplicates(file_path: str) -> int:
         """删除重复的 key，只保留最后一个，返回删除的数量
@@ -181,6 +243,31 @@ class LocalizationParser:
             print(f"删除重复项出错 {file_path}: {e}")
             return 0
     
+    @staticmethod
+    def iter_entry_spans(content: str) -> Iterator[Tuple[str, str, int, int]]:
+        """遍历文本中的条目，yield (key, value, value_start, value_end)
+        
+        value_start / value_end 是 value（转义后的原文，不含引号）在 content 中的位置
+        """
+        for match in ENTRY_SPAN_PATTERN.finditer(content):
+            if match.group('comment') is not None:
+                continue
+            start, end = match.span('value')
+            yield unescape_strings_text(match.group('key')), unescape_strings_text(match.group('value')), start, end
+    
+    @staticmethod
+    def patch_strings_file(file_path: str, updates: Dict[str, str], version: Optional[str] = None) -> Tuple[int, int]:
+        """按位置替换 value，一次写回文件，返回 (修改数量, 追加数量)
+        
+        - 已存在的 key：只替换最后一次出现的 value 片段（与解析时后者覆盖前者一致），其余内容原样保留
+        - 不存在的 key：追加到文件末尾（指定 version 时用版本号注释包裹）
+        - value 未变化的 key 不改动
+        """
+        merger = StringsFileMerger(file_path)
+        for key, value in updates.items():
+            merger.add(key, value)
+        return merger.commit(version)
+    
     @staticmethod
     def count_duplicates(file_path: str) -> int:
         """计算文件中重复项的数量（不删除）"""
@@ -188,7 +275,7 @@ class LocalizationParser:
         return sum(len(items) - 1 for items in duplicates_info.values())
     
     @staticmethod
-    def find_duplicates(file_path: str) -> dict:
+    def find_duplicates(file_path: str, should_stop: Callable[[], bool] = None) -> dict:
         """查找文件中的重复项，返回 {key: [(value1, line1), (value2, line2), ...]}"""
         if not os.path.exists(file_path):
             return {}
@@ -202,6 +289,8 @@ class LocalizationParser:
             # 记录每个 key 的所有出现
             key_occurrences = {}
             for line_num, line in enumerate(lines, 1):
+                if line_num % CANCEL_CHECK_INTERVAL == 0:
+                    raise_if_cancelled(should_stop)
                 match = re.match(pattern, line.strip())
                 if match:
                     key, value = match.groups()
@@ -213,7 +302,76 @@ class LocalizationParser:
             duplicates = {k: v for k, v in key_occurrences.items() if len(v) > 1}
             return duplicates
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             print(f"查找重复项出错 {file_path}: {e}")
             return {}
 
+
+class StringsFileMerger:
+    """把新条目合并进已有的 .strings 文件（hash join）
+    
+    构建侧是已有文件：一次扫描得到 {key: value 片段位置}；
+    探测侧是新条目：逐条 add()，已有且值不同的记为原地替换，不存在的记为追加，
+    内存只与变更数量有关。commit() 时一次写回。
+    """
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.content = f.read()
+        
+        self.spans = {}                 # {key: (value, start, end)}，后出现的覆盖前面的
+        for key, value, start, end in LocalizationParser.iter_entry_spans(self.content):
+            self.spans[key] = (value, start, end)
+        
+        self.patches = {}               # {key: new_value}
+        self.appended = OrderedDict()   # {key: value}
+    
+    def add(self, key: str, value: str):
+        span = self.spans.get(key)
+        if span is None:
+            self.appended[key] = value
+        elif span[0] != value:
+            self.patches[key] = value
+        else:
+            # 与文件中一致（可能覆盖了之前同名条目的修改）
+            self.patches.pop(key, None)
+    
+    @property
+    def changed(self) -> bool:
+        return bool(self.patches or self.appended)
+    
+    def commit(self, version: Optional[str] = None) -> Tuple[int, int]:
+        """写回文件，返回 (修改数量, 追加数量)；没有变更时不写文件"""
+        if not self.changed:
+            return 0, 0
+        
+        patches = sorted(
+            (self.spans[key][1], self.spans[key][2], escape_strings_text(value))
+            for key, value in self.patches.items()
+        )
+        
+        pieces = []
+        last = 0
+        for start, end, text in patches:
+            pieces.append(self.content[last:start])
+            pieces.append(text)
+            last = end
+        pieces.append(self.content[last:])
+        
+        if self.appended:
+            if self.content and not self.content.endswith('\n'):
+                pieces.append('\n')
+            if version:
+                pieces.append(f'\n//<!-- ========== {version} 新增 ========== -->\n')
+            for key, value in self.appended.items():
+                pieces.append(f'"{escape_strings_text(key)}" = "{escape_strings_text(value)}";\n')
+            if version:
+                pieces.append(f'//<!-- ========== {version} 新增 ========== -->\n')
+        
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(pieces))
+        
+        return len(patches), len(self.appended)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相似文案查找
+对基准语言的 value 做归一化（大小写、标点、空白），归一化后相同的直接归为一组；
+其余按字符 3-gram 计算 MinHash 签名，用 LSH 分桶找候选对，只对同桶的候选计算 Jaccard 相似度，
+5 万条 value 也不需要两两比较
+"""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, raise_if_cancelled
+
+# MinHash 签名长度 = LSH 分桶数 × 每桶行数；10 × 5 时相似度 0.8 的对约 98% 落入同一个桶，0.4 的约 10%
+LSH_BANDS = 10
+LSH_ROWS = 5
+NUM_PERMUTATIONS = LSH_BANDS * LSH_ROWS
+
+# 字符 shingle 长度
+SHINGLE_SIZE = 3
+
+# 候选对保留的最低相似度，界面上的阈值在此之上，调整时在内存中重新分组
+MIN_SIMILARITY = 0.6
+
+# 桶内成员超过该数量时不再两两比较，只与桶内第一个成员比较（避免常见短语退化为平方复杂度）
+MAX_PAIRWISE_BUCKET = 50
+
+_PUNCTUATION = re.compile(r'[^\w\s]+')
+_WHITESPACE = re.compile(r'\s+')
+
+# 各哈希函数 h_i(x) = (a_i * x + b_i) mod p 的系数，固定种子保证每次结果相同
+_PRIME = (1 << 61) - 1
+_coefficient_rng = random.Random(20240601)
+_COEFFICIENTS = [(_coefficient_rng.randrange(1, _PRIME), _coefficient_rng.randrange(0, _PRIME))
+                 for _ in range(NUM_PERMUTATIONS)]
+
+
+def normalize_value(value: str) -> str:
+    """归一化：忽略大小写、标点和多余空白（"Cancel"、"cancel"、"Cancel." 归一化后相同）"""
+    text = _PUNCTUATION.sub(' ', value.casefold())
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def shingles(text: str) -> Set[str]:
+    """字符 shingle 集合（首尾补空格，单词边界也参与比较）"""
+    padded = f" {text} "
+    if len(padded) <= SHINGLE_SIZE:
+        return {padded}
+    return {padded[i:i + SHINGLE_SIZE] for i in range(len(padded) - SHINGLE_SIZE + 1)}
+
+
+class NearDuplicateFinder:
+    """基准语言中相似 value 的查找
+
+    结果分两步：find_candidates 做归一化和 LSH（耗时部分，由 worker 执行并缓存），
+    group 按阈值把候选对合并为分组（很快，界面调整阈值时直接在内存中调用）
+    """
+
+    @staticmethod
+    def _minhash(shingle_set: Set[str], hash_cache: Dict[str, tuple]) -> tuple:
+        """MinHash 签名：每个哈希函数下所有 shingle 哈希的最小值
+
+        shingle 的各哈希值只算一次并在各 value 间复用（文案的 3-gram 种类远少于 value 数量）
+        """
+        hashes = []
+        for shingle in shingle_set:
+            values = hash_cache.get(shingle)
+            if values is None:
+                digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+                x = int.from_bytes(digest, 'little')
+                values = hash_cache[shingle] = tuple((a * x + b) % _PRIME for a, b in _COEFFICIENTS)
+            hashes.append(values)
+        return tuple(map(min, zip(*hashes)))
+
+    @staticmethod
+    def find_candidates(
+        values: Dict[str, str],
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Tuple[List[dict], List[Tuple[int, int, float]]]:
+        """归一化并用 MinHash/LSH 找相似的候选对
+
+        Args:
+            values: {key: value}（基准语言）
+
+        Returns:
+            (nodes, pairs)
+            nodes: [{'normalized': str, 'items': [(key, value), ...]}]，归一化后相同的 value 合并为一个节点
+            pairs: [(节点下标, 节点下标, Jaccard 相似度)]，只包含相似度 >= MIN_SIMILARITY 的对
+        """
+        # 1. 归一化，完全相同的合并为一个节点
+        node_index = {}
+        nodes = []
+        for index, (key, value) in enumerate(values.items()):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+            normalized = normalize_value(value)
+            if not normalized:
+                continue  # 纯标点 / 空白 / 格式符
+            position = node_index.get(normalized)
+            if position is None:
+                node_index[normalized] = len(nodes)
+                nodes.append({'normalized': normalized, 'items': [(key, value)]})
+            else:
+                nodes[position]['items'].append((key, value))
+
+        # 2. MinHash 签名并按 band 分桶
+        shingle_sets = []
+        buckets = defaultdict(list)
+        hash_cache = {}
+        for index, node in enumerate(nodes):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+            shingle_set = shingles(node['normalized'])
+            shingle_sets.append(shingle_set)
+            signature = NearDuplicateFinder._minhash(shingle_set, hash_cache)
+            for band in range(LSH_BANDS):
+                buckets[(band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])].append(index)
+
+        # 3. 同桶的候选对计算真实的 Jaccard 相似度
+        candidates = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) <= MAX_PAIRWISE_BUCKET:
+                candidates.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+            else:
+                first = members[0]
+                candidates.update((first, b) for b in members[1:])
+
+        pairs = []
+        sizes = [len(shingle_set) for shingle_set in shingle_sets]
+        for index, (a, b) in enumerate(candidates):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+            # 集合大小相差太多时相似度不可能达到下限，不必求交集
+            small, large = sorted((sizes[a], sizes[b]))
+            if small < MIN_SIMILARITY * large:
+                continue
+            common = len(shingle_sets[a] & shingle_sets[b])
+            similarity = common / (small + large - common)
+            if similarity >= MIN_SIMILARITY:
+                pairs.append((a, b, similarity))
+        return nodes, pairs
+
+    @staticmethod
+    def group(nodes: List[dict], pairs: List[Tuple[int, int, float]], threshold: float) -> List[dict]:
+        """按阈值把相似的节点合并为分组（并查集）
+
+        Returns:
+            [{'items': [(key, value), ...], 'similarity': 组内连接的最低相似度（仅大小写/标点不同时为 1.0）}]，
+            按 key 数量从多到少排序；只有一个 key 的分组不返回
+        """
+        parent = list(range(len(nodes)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        similarity = {}
+        for a, b, value in pairs:
+            if value < threshold:
+                continue
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+                similarity[root_a] = min(value, similarity.get(root_a, 1.0), similarity.get(root_b, 1.0))
+
+        components = defaultdict(list)
+        for index in range(len(nodes)):
+            components[find(index)].append(index)
+
+        groups = []
+        for root, members in components.items():
+            items = [item for index in members for item in nodes[index]['items']]
+            if len(items) < 2:
+                continue
+            groups.append({
+                'items': sorted(items),
+                'similarity': similarity.get(root, 1.0),
+            })
+        groups.sort(key=lambda group: (-len(group['items']), group['items'][0][0]))
+        return groups
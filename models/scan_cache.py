@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+扫描结果缓存
+按文件缓存解析/扫描结果，供增量扫描（如 git 变更文件模式）复用
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class ScanResultCache:
+    """进程内的按文件结果缓存
+
+    - namespace 区分不同类型的结果（如 'duplicates'、'keys'、扫描参数不同的字符串扫描）
+    - 每条缓存记录文件的 mtime/size，文件变化后自动失效
+    """
+
+    _lock = threading.Lock()
+    _entries: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+
+    @staticmethod
+    def _signature(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def get(cls, namespace: str, file_path: str) -> Optional[Any]:
+        """获取缓存结果，文件不存在或已修改时返回 None"""
+        with cls._lock:
+            entry = cls._entries.get((namespace, file_path))
+        if entry is None:
+            return None
+
+        signature = cls._signature(file_path)
+        if signature is None or signature != entry[:2]:
+            return None
+        return entry[2]
+
+    @classmethod
+    def put(cls, namespace: str, file_path: str, value: Any):
+        """写入缓存结果"""
+        signature = cls._signature(file_path)
+        if signature is None:
+            return
+        with cls._lock:
+            cls._entries[(namespace, file_path)] = (signature[0], signature[1], value)
+
+    @classmethod
+    def clear(cls, namespace: Optional[str] = None):
+        """清空缓存（可只清空某个 namespace）"""
+        with cls._lock:
+            if namespace is None:
+                cls._entries.clear()
+            else:
+                for key in [k for k in cls._entries if k[0] == namespace]:
+                    del cls._entries[key]
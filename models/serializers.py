@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多语言导出格式序列化器
+每种格式一个流式写入器（open → write* → close），通过注册表按格式 ID 查找，
+导出时遍历一次数据，同时写入所有选中的格式
+"""
+
+import csv
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Type
+from xml.sax.saxutils import escape, quoteattr
+
+from models.localization_parser import escape_strings_text
+
+
+class LocalizationSerializer:
+    """序列化器基类
+
+    子类需要定义 format_id / display_name / extension / folder，
+    并实现 write_header / write_entry / write_footer
+    """
+
+    format_id = ''
+    display_name = ''
+    extension = ''
+    folder = ''        # 导出包中的子目录名
+
+    def __init__(self, output_dir: str, lang_code: str, source_lang: Optional[str] = None):
+        self.lang_code = lang_code
+        self.source_lang = source_lang
+        self.file_name = f"{lang_code}{self.extension}"
+        self.file_path = os.path.join(output_dir, self.folder, self.file_name)
+        self.count = 0
+        self.f = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        self.f = open(self.file_path, 'w', encoding='utf-8', newline='')
+        self.write_header()
+
+    def write(self, key: str, value: str, source_value: Optional[str] = None):
+        self.write_entry(key, value, source_value)
+        self.count += 1
+
+    def write_untranslated(self, key: str, source_value: str):
+        """写出待翻译的条目（待翻译包使用），默认以源语言的值占位"""
+        self.write(key, source_value, source_value)
+
+    def close(self):
+        if self.f is None:
+            return
+        try:
+            self.write_footer()
+        finally:
+            self.f.close()
+            self.f = None
+
+    def write_header(self):
+        pass
+
+    def write_entry(self, key: str, value: str, source_value: Optional[str]):
+        raise NotImplementedError
+
+    def write_footer(self):
+        pass
+
+
+# 格式注册表 {format_id: serializer_class}，保持注册顺序
+_SERIALIZERS: 'OrderedDict[str, Type[LocalizationSerializer]]' = OrderedDict()
+
+
+def register_serializer(cls: Type[LocalizationSerializer]) -> Type[LocalizationSerializer]:
+    """注册序列化器（可用作类装饰器）"""
+    _SERIALIZERS[cls.format_id] = cls
+    return cls
+
+
+def get_serializer(format_id: str) -> Optional[Type[LocalizationSerializer]]:
+    return _SERIALIZERS.get(format_id)
+
+
+def available_formats() -> List[Type[LocalizationSerializer]]:
+    """所有已注册的格式（按注册顺序）"""
+    return list(_SERIALIZERS.values())
+
+
+@register_serializer
+class StringsSerializer(LocalizationSerializer):
+    """iOS .strings"""
+
+    format_id = 'strings'
+    display_name = '.strings'
+    extension = '.strings'
+    folder = 'Strings'
+
+    def write_entry(self, key, value, source_value):
+        self.f.write(f'"{escape_strings_text(key)}" = "{escape_strings_text(value)}";\n')
+
+
+@register_serializer
+class AndroidXMLSerializer(LocalizationSerializer):
+    """Android strings.xml"""
+
+    format_id = 'xml'
+    display_name = '.xml'
+    extension = '.xml'
+    folder = 'XML'
+
+    def write_header(self):
+        self.f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.f.write('<resources>\n')
+
+    def write_entry(self, key, value, source_value):
+        escaped_value = escape(value, {'"': '&quot;', "'": '&apos;'})
+        self.f.write(f'    <string name={quoteattr(key)}>{escaped_value}</string>\n')
+
+    def write_footer(self):
+        self.f.write('</resources>\n')
+
+
+@register_serializer
+class XLIFFSerializer(LocalizationSerializer):
+    """XLIFF 1.2，source 为源语言的值"""
+
+    format_id = 'xliff'
+    display_name = '.xliff'
+    extension = '.xliff'
+    folder = 'XLIFF'
+
+    def write_header(self):
+        source_lang = self.source_lang or self.lang_code
+        self.f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.f.write('<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">\n')
+        self.f.write(
+            f'  <file original="Localizable.strings" source-language={quoteattr(source_lang)} '
+            f'target-language={quoteattr(self.lang_code)} datatype="plaintext">\n'
+        )
+        self.f.write('    <body>\n')
+
+    def write_entry(self, key, value, source_value):
+        source = value if source_value is None else source_value
+        self.f.write(f'      <trans-unit id={quoteattr(key)} xml:space="preserve">\n')
+        self.f.write(f'        <source>{escape(source)}</source>\n')
+        if value is not None:
+            self.f.write(f'        <target>{escape(value)}</target>\n')
+        self.f.write('      </trans-unit>\n')
+
+    def write_untranslated(self, key, source_value):
+        # 不写 <target>，译者没有填写的条目导入时会被跳过
+        self.write(key, None, source_value)
+
+    def write_footer(self):
+        self.f.write('    </body>\n')
+        self.f.write('  </file>\n')
+        self.f.write('</xliff>\n')
+
+
+@register_serializer
+class JSONSerializer(LocalizationSerializer):
+    """扁平 JSON 对象 {key: value}，逐条写出"""
+
+    format_id = 'json'
+    display_name = '.json'
+    extension = '.json'
+    folder = 'JSON'
+
+    def write_header(self):
+        self.f.write('{')
+
+    def write_entry(self, key, value, source_value):
+        separator = ',\n  ' if self.count else '\n  '
+        self.f.write(f'{separator}{json.dumps(key, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)}')
+
+    def write_footer(self):
+        self.f.write('\n}\n' if self.count else '}\n')
+
+
+@register_serializer
+class CSVSerializer(LocalizationSerializer):
+    """CSV（key, value），Excel 打开不乱码"""
+
+    format_id = 'csv'
+    display_name = '.csv'
+    extension = '.csv'
+    folder = 'CSV'
+
+    def write_header(self):
+        self.f.write('\ufeff')
+        self.writer = csv.writer(self.f)
+        self.writer.writerow(['key', self.lang_code])
+
+    def write_entry(self, key, value, source_value):
+        self.writer.writerow([key, value])
+
+
+class SourceCSVSerializer(CSVSerializer):
+    """CSV（key, 源语言, 译文），待翻译包使用，源语言一列作为翻译上下文（不在导出格式中注册）"""
+
+    def write_header(self):
+        self.f.write('\ufeff')
+        self.writer = csv.writer(self.f)
+        self.writer.writerow(['key', self.source_lang or 'source', self.lang_code])
+
+    def write_entry(self, key, value, source_value):
+        self.writer.writerow([key, source_value or '', value or ''])
+
+    def write_untranslated(self, key, source_value):
+        self.write(key, '', source_value)
+
+
+# 待翻译包可选的格式 {format_id: serializer_class}
+PACKAGE_SERIALIZERS: 'OrderedDict[str, Type[LocalizationSerializer]]' = OrderedDict([
+    ('strings', StringsSerializer),
+    ('xliff', XLIFFSerializer),
+    ('csv', SourceCSVSerializer),
+])
+
+
+def serialize_languages(
+    language_data: Dict[str, Dict[str, str]],
+    format_ids: List[str],
+    output_dir: str,
+    source_lang: Optional[str] = None,
+    should_stop=None,
+    source_data: Optional[Dict[str, str]] = None
+) -> Dict[str, List[str]]:
+    """遍历一次数据，把每条记录同时写入所有选中格式
+
+    Args:
+        language_data: {lang_code: OrderedDict(key: value)}
+        format_ids: 要导出的格式 ID 列表
+        output_dir: 输出目录（每种格式写到各自的子目录）
+        source_lang: 源语言（XLIFF 的 source 取该语言的值）
+        should_stop: 可选的取消检查函数
+        source_data: 源语言数据（源语言不在 language_data 中时单独传入）
+
+    Returns:
+        {lang_code: [已写出的文件相对路径, ...]}
+    """
+    serializer_classes = [get_serializer(format_id) for format_id in format_ids]
+    serializer_classes = [cls for cls in serializer_classes if cls is not None]
+    if source_data is None:
+        source_data = language_data.get(source_lang, {}) if source_lang else {}
+
+    written = {}
+    for lang_code, data in language_data.items():
+        if should_stop and should_stop():
+            break
+
+        serializers = [cls(output_dir, lang_code, source_lang) for cls in serializer_classes]
+        try:
+            for serializer in serializers:
+                serializer.open()
+
+            for key, value in data.items():
+                source_value = source_data.get(key)
+                for serializer in serializers:
+                    serializer.write(key, value, source_value)
+        finally:
+            for serializer in serializers:
+                serializer.close()
+
+        written[lang_code] = [os.path.join(s.folder, s.file_name) for s in serializers]
+
+    return written
+
+
+def serialize_translation_package(
+    missing_keys: Dict[str, List[str]],
+    source_data: Dict[str, str],
+    format_id: str,
+    output_dir: str,
+    source_lang: str,
+    should_stop=None
+) -> Dict[str, List[str]]:
+    """写出待翻译包：每个语言一个文件，只包含该语言缺失的 key，附带源语言的值作为上下文
+
+    Args:
+        missing_keys: {lang_code: [key, ...]}（CompareWorker 的结果）
+        source_data: 源语言数据 {key: value}
+        format_id: PACKAGE_SERIALIZERS 中的格式 ID
+        output_dir: 输出目录（写到格式对应的子目录）
+        source_lang: 源语言
+
+    Returns:
+        {lang_code: [已写出的文件相对路径]}
+    """
+    serializer_class = PACKAGE_SERIALIZERS.get(format_id)
+    if serializer_class is None:
+        return {}
+
+    written = {}
+    for lang_code, keys in missing_keys.items():
+        if should_stop and should_stop():
+            break
+
+        serializer = serializer_class(output_dir, lang_code, source_lang)
+        try:
+            serializer.open()
+            for key in keys:
+                serializer.write_untranslated(key, source_data.get(key, ''))
+        finally:
+            serializer.close()
+
+        written[lang_code] = [os.path.join(serializer.folder, serializer.file_name)]
+
+    return written
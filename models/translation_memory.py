@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译记忆
+按归一化后的基准语言文案索引各语言已有的译文：缺失翻译的 key 如果基准文案已经在别的 key 下翻译过，
+直接用那份译文作为候选，不必逐条翻译
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, raise_if_cancelled
+from models.format_specifier import format_signature
+from models.near_duplicates import normalize_value
+
+
+class TranslationMemory:
+    """基准语言文案 → 各语言译文的索引
+
+    归一化方式与相似文案一致（忽略大小写、标点和多余空白）；同一归一化文案在某个语言下
+    有多个来源时全部保留，补全时优先选基准文案完全相同的来源
+    """
+
+    def __init__(self, all_lang_data: Dict[str, dict], base_lang: str,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            all_lang_data: {lang_code: {key: value}}（只读）
+            base_lang: 基准语言
+        """
+        self.base_lang = base_lang
+        self.base_data = all_lang_data.get(base_lang, {})
+        # {归一化文案: {lang_code: [(基准文案, 译文, 来源 key), ...]}}
+        self.entries: Dict[str, Dict[str, List[Tuple[str, str, str]]]] = {}
+
+        normalized_keys = {}  # {key: 归一化文案}
+        for index, (key, base_value) in enumerate(self.base_data.items()):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+            normalized = normalize_value(base_value)
+            if normalized:
+                normalized_keys[key] = normalized
+
+        for lang_code, lang_data in all_lang_data.items():
+            if lang_code == base_lang:
+                continue
+            for index, (key, value) in enumerate(lang_data.items()):
+                if index % CANCEL_CHECK_INTERVAL == 0:
+                    raise_if_cancelled(should_stop)
+                normalized = normalized_keys.get(key)
+                if normalized is None or not value:
+                    continue
+                sources = self.entries.setdefault(normalized, {}).setdefault(lang_code, [])
+                sources.append((self.base_data[key], value, key))
+
+    def lookup(self, base_value: str, lang_code: str) -> Optional[Tuple[str, str, bool]]:
+        """查找基准文案在某个语言下的译文
+
+        只返回格式符与 base_value 一致的来源（避免把 %d 的译文填给 %@ 的 key）
+
+        Returns:
+            (译文, 来源 key, 基准文案是否完全相同)，没有可用的译文时返回 None
+        """
+        sources = self.entries.get(normalize_value(base_value), {}).get(lang_code)
+        if not sources:
+            return None
+        signature = format_signature(base_value)
+        fallback = None
+        for source_base, value, source_key in sources:
+            if source_base == base_value:
+                return value, source_key, True
+            if fallback is None and format_signature(source_base) == signature:
+                fallback = (value, source_key, False)
+        return fallback
+
+    def fill(self, missing_keys: Dict[str, List[str]],
+             should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, List[dict]]:
+        """为 CompareWorker 报告的缺失 key 批量生成候选译文
+
+        Args:
+            missing_keys: {lang_code: [key, ...]}
+
+        Returns:
+            {lang_code: [{'key', 'base_value', 'value', 'source_key', 'exact'}, ...]}，没有候选的语言不返回
+        """
+        candidates = {}
+        for lang_code, keys in missing_keys.items():
+            lang_candidates = []
+            for index, key in enumerate(keys):
+                if index % CANCEL_CHECK_INTERVAL == 0:
+                    raise_if_cancelled(should_stop)
+                base_value = self.base_data.get(key)
+                if not base_value:
+                    continue
+                found = self.lookup(base_value, lang_code)
+                if found is None:
+                    continue
+                value, source_key, exact = found
+                lang_candidates.append({
+                    'key': key,
+                    'base_value': base_value,
+                    'value': value,
+                    'source_key': source_key,
+                    'exact': exact,
+                })
+            if lang_candidates:
+                candidates[lang_code] = lang_candidates
+        return candidates
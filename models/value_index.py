@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Value 索引
+按 value 的哈希把 key 分组（value → [key, ...]），用于找出多个 key 使用完全相同的 value：
+这些 key 通常可以合并，也会让字符串替换中「按 value 找 key」出现歧义
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, raise_if_cancelled
+
+
+class ValueIndex:
+    """单个语言的 value → keys 索引
+
+    fold_case 为 True 时按 value.lower() 分组（与字符串替换「不区分大小写」的匹配方式一致）
+    """
+
+    def __init__(self, data: Dict[str, str], fold_case: bool = False,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            data: {key: value}
+            fold_case: 是否忽略大小写
+        """
+        self.fold_case = fold_case
+        self.keys_by_value: Dict[str, List[str]] = {}
+        for index, (key, value) in enumerate(data.items()):
+            if index % CANCEL_CHECK_INTERVAL == 0:
+                raise_if_cancelled(should_stop)
+            if not value:
+                continue
+            self.keys_by_value.setdefault(self.index_value(value), []).append(key)
+
+    def index_value(self, value: str) -> str:
+        """value 在索引中的形式"""
+        return value.lower() if self.fold_case else value
+
+    def keys_for(self, value: str) -> List[str]:
+        """使用该 value 的所有 key（按读取顺序），没有时返回空列表"""
+        return self.keys_by_value.get(self.index_value(value), [])
+
+    def ambiguous_values(self) -> Dict[str, List[str]]:
+        """被多个 key 使用的 value：{value: [key, ...]}"""
+        return {value: keys for value, keys in self.keys_by_value.items() if len(keys) > 1}
+
+    def duplicate_groups(self) -> List[dict]:
+        """value 相同的 key 分组
+
+        Returns:
+            [{'items': [(key, value), ...], 'similarity': 1.0}]，格式与 NearDuplicateFinder.group 一致，
+            按 key 数量从多到少排序；只有一个 key 的 value 不返回（忽略大小写时 value 为小写形式）
+        """
+        groups = [
+            {'items': sorted((key, value) for key in keys), 'similarity': 1.0}
+            for value, keys in self.ambiguous_values().items()
+        ]
+        groups.sort(key=lambda group: (-len(group['items']), group['items'][0][0]))
+        return groups
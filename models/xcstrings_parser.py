@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+String Catalog (.xcstrings) 解析器
+增量读取 JSON，逐条解析 key，不在内存中保留整棵解析树
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from models.cancellation import CANCEL_CHECK_INTERVAL, OperationCancelled, raise_if_cancelled
+from models.scan_cache import ScanResultCache
+
+# catalog 没有声明 sourceLanguage 时的源语言
+DEFAULT_SOURCE_LANGUAGE = 'en'
+
+
+class _StreamReader:
+    """分块读取 JSON 文本，按需用 raw_decode 解码单个值
+
+    只缓存尚未消费的文本；同时维护行号，供查重结果定位。
+    """
+
+    CHUNK_SIZE = 1 << 20  # 每次读取 1M 字符
+    DELIMITERS = ' \t\r\n,:]}'
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ''
+        self.pos = 0            # 当前解析位置（buffer 内）
+        self.base = 0           # buffer[0] 在整个文件中的字符偏移
+        self.eof = False
+        self.line = 1           # line_pos 处的行号
+        self.line_pos = 0       # 行号游标（buffer 内）
+
+    @property
+    def offset(self) -> int:
+        """当前解析位置在整个文件中的字符偏移"""
+        return self.base + self.pos
+
+    def fill(self) -> bool:
+        """读取更多数据，返回是否读到新数据"""
+        if self.eof:
+            return False
+
+        # 丢弃已消费的部分，避免 buffer 无限增长
+        if self.pos > self.CHUNK_SIZE:
+            self.line += self.buffer.count('\n', self.line_pos, self.pos)
+            self.buffer = self.buffer[self.pos:]
+            self.base += self.pos
+            self.pos = 0
+            self.line_pos = 0
+
+        chunk = self.f.read(self.CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def current_line(self) -> int:
+        """当前解析位置的行号（游标只向前移动）"""
+        self.line += self.buffer.count('\n', self.line_pos, self.pos)
+        self.line_pos = self.pos
+        return self.line
+
+    def peek(self) -> str:
+        """跳过空白并返回下一个字符（文件结束返回空字符串）"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"JSON 格式错误：位置 {self.offset} 处期望 '{char}'")
+        self.pos += 1
+
+    def decode_value(self):
+        """解码下一个完整的 JSON 值"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+                # 数字等标量值可能被截断（如 "1." 被解码为 1），后面必须紧跟分隔符才算完整
+                if self.eof or (end < len(self.buffer) and self.buffer[end] in self.DELIMITERS):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            if not self.fill():
+                if self.eof and self.pos < len(self.buffer):
+                    continue
+                raise ValueError(f"JSON 格式错误：位置 {self.offset} 处数据不完整")
+
+
+class XCStringsParser:
+    """处理 Xcode String Catalog（.xcstrings）文件"""
+
+    FILE_EXTENSION = '.xcstrings'
+
+    @staticmethod
+    def find_xcstrings_files(project_path: str, ignore_folders: List[str] = None) -> List[str]:
+        """查找项目中所有 .xcstrings 文件"""
+        if ignore_folders is None:
+            ignore_folders = ['Pods', 'build', 'Build', 'DerivedData', '.git', 'Carthage']
+
+        catalog_files = []
+        for root, dirs, files in os.walk(project_path):
+            # 排除忽略的目录
+            dirs[:] = [d for d in dirs if d not in ignore_folders]
+
+            for file in files:
+                if file.endswith(XCStringsParser.FILE_EXTENSION):
+                    catalog_files.append(os.path.join(root, file))
+
+        return sorted(catalog_files)
+
+    @staticmethod
+    def extract_values(key: str, entry: dict, source_language: str) -> Dict[str, str]:
+        """从单个条目中提取 {lang: value}
+
+        - 普通字符串取 stringUnit.value
+        - 复数 / 设备变体取 other（或第一个）变体的值
+        - 源语言没有本地化时，key 本身就是源语言的值
+        """
+        values = {}
+        localizations = entry.get('localizations') or {}
+
+        for lang, localization in localizations.items():
+            value = XCStringsParser._localization_value(localization)
+            if value is not None:
+                values[lang] = value
+
+        if source_language not in values and entry.get('shouldTranslate') is not False:
+            values[source_language] = key
+
+        return values
+
+    @staticmethod
+    def _localization_value(localization: dict) -> Optional[str]:
+        if not isinstance(localization, dict):
+            return None
+
+        string_unit = localization.get('stringUnit')
+        if isinstance(string_unit, dict) and 'value' in string_unit:
+            return string_unit['value']
+
+        # variations: {"plural": {"one": {...}, "other": {...}}} / {"device": {...}}
+        variations = localization.get('variations')
+        if isinstance(variations, dict):
+            for cases in variations.values():
+                if not isinstance(cases, dict) or not cases:
+                    continue
+                case = cases.get('other') or next(iter(cases.values()))
+                value = XCStringsParser._localization_value(case)
+                if value is not None:
+                    return value
+
+        return None
+
+    @staticmethod
+    def iter_entries(file_path: str, should_stop: Callable[[], bool] = None
+                     ) -> Iterator[Tuple[str, Dict[str, str], int, int]]:
+        """逐条读取 catalog，yield (key, {lang: value}, line, start_offset)
+
+        每次只解码一个条目，内存占用与单个条目大小相关，与文件大小无关。
+        start_offset 是条目 key 在文件中的字符偏移。
+        should_stop 每 CANCEL_CHECK_INTERVAL 个条目检查一次，取消时抛出 OperationCancelled。
+        """
+        for key, values, line, start, _ in XCStringsParser._iter_entries(file_path, should_stop):
+            yield key, values, line, start
+
+    @staticmethod
+    def _iter_entries(file_path: str, should_stop: Callable[[], bool] = None
+                      ) -> Iterator[Tuple[str, Dict[str, str], int, int, str]]:
+        """同 iter_entries，额外 yield 该 catalog 的源语言"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = _StreamReader(f)
+            source_language = None
+
+            reader.expect('{')
+            while reader.peek() not in ('}', ''):
+                name = reader.decode_value()
+                reader.expect(':')
+
+                if name == 'strings':
+                    if source_language is None:
+                        # strings 出现在 sourceLanguage 之前（手工编辑的文件）：先找到源语言再读取条目
+                        source_language = XCStringsParser._scan_source_language(file_path, should_stop)
+                    reader.expect('{')
+                    count = 0
+                    while reader.peek() not in ('}', ''):
+                        count += 1
+                        if count % CANCEL_CHECK_INTERVAL == 0:
+                            raise_if_cancelled(should_stop)
+                        start = reader.offset
+                        line = reader.current_line()
+                        key = reader.decode_value()
+                        reader.expect(':')
+                        entry = reader.decode_value()
+                        if isinstance(entry, dict):
+                            values = XCStringsParser.extract_values(key, entry, source_language)
+                            yield key, values, line, start, source_language
+                        if reader.peek() == ',':
+                            reader.pos += 1
+                    reader.expect('}')
+                else:
+                    value = reader.decode_value()
+                    if name == 'sourceLanguage' and isinstance(value, str):
+                        source_language = value
+
+                if reader.peek() == ',':
+                    reader.pos += 1
+
+    @staticmethod
+    def _scan_source_language(file_path: str, should_stop: Callable[[], bool] = None) -> str:
+        """读取顶层的 sourceLanguage，strings 中的条目逐条跳过（不构建整个对象）"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = _StreamReader(f)
+
+            reader.expect('{')
+            while reader.peek() not in ('}', ''):
+                name = reader.decode_value()
+                reader.expect(':')
+
+                if name == 'strings':
+                    reader.expect('{')
+                    count = 0
+                    while reader.peek() not in ('}', ''):
+                        count += 1
+                        if count % CANCEL_CHECK_INTERVAL == 0:
+                            raise_if_cancelled(should_stop)
+                        reader.decode_value()
+                        reader.expect(':')
+                        reader.decode_value()
+                        if reader.peek() == ',':
+                            reader.pos += 1
+                    reader.expect('}')
+                else:
+                    value = reader.decode_value()
+                    if name == 'sourceLanguage' and isinstance(value, str):
+                        return value
+
+                if reader.peek() == ',':
+                    reader.pos += 1
+
+        return DEFAULT_SOURCE_LANGUAGE
+
+    @staticmethod
+    def load_languages(file_path: str, should_stop: Callable[[], bool] = None) -> Dict[str, OrderedDict]:
+        """读取 catalog，转换为与 .strings 相同的按语言模型 {lang: OrderedDict(key: value)}"""
+        result = {}
+
+        try:
+            for key, values, _, _ in XCStringsParser.iter_entries(file_path, should_stop):
+                for lang, value in values.items():
+                    lang_data = result.get(lang)
+                    if lang_data is None:
+                        lang_data = result[lang] = OrderedDict()
+                    lang_data[key] = value
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            print(f"解析 String Catalog 出错 {file_path}: {e}")
+
+        return result
+
+    @staticmethod
+    def list_languages(file_path: str, should_stop: Callable[[], bool] = None) -> List[str]:
+        """列出 catalog 中出现的语言（按 mtime/size 缓存，文件不变时不重复解析）"""
+        cached = ScanResultCache.get('catalog_languages', file_path)
+        if cached is not None:
+            return list(cached)
+
+        languages = {}
+        try:
+            for _, values, _, _ in XCStringsParser.iter_entries(file_path, should_stop):
+                for lang in values:
+                    languages[lang] = None
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            print(f"解析 String Catalog 出错 {file_path}: {e}")
+            return list(languages)
+
+        ScanResultCache.put('catalog_languages', file_path, tuple(languages))
+        return list(languages)
+
+    @staticmethod
+    def find_duplicates(file_path: str, should_stop: Callable[[], bool] = None) -> dict:
+        """查找 catalog 中重复出现的 key，返回 {key: [(value, line), ...]}
+
+        JSON 解析时后出现的 key 会覆盖前面的，与 .strings 一致保留最后一个。
+        value 取源语言的值。
+        """
+        occurrences = {}
+
+        try:
+            for key, values, line, _, source_language in XCStringsParser._iter_entries(file_path, should_stop):
+                # 源语言没有值（shouldTranslate 为 false 等）时取第一个语言的值
+                value = values.get(source_language)
+                if value is None:
+                    value = next(iter(values.values()), '')
+                occurrences.setdefault(key, []).append((value, line))
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            print(f"查找重复项出错 {file_path}: {e}")
+            return {}
+
+        return {k: v for k, v in occurrences.items() if len(v) > 1}
+
+    @staticmethod
+    def remove_duplicates(file_path: str) -> int:
+        """删除 catalog 中重复的 key，只保留最后一个，返回删除的数量
+
+        按条目的字符偏移删除文本片段，其余内容（格式、缩进、顺序）保持不变。
+        """
+        try:
+            starts = []          # 每个条目 key 的起始偏移
+            key_indexes = {}     # {key: [条目序号, ...]}
+            for index, (key, _, _, start) in enumerate(XCStringsParser.iter_entries(file_path)):
+                starts.append(start)
+                key_indexes.setdefault(key, []).append(index)
+
+            remove_indexes = sorted(
+                i for indexes in key_indexes.values() if len(indexes) > 1 for i in indexes[:-1]
+            )
+            if not remove_indexes:
+                return 0
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            # 被删除的条目后面一定还有同名条目，删除区间 [本条目起点, 下一条目起点)
+            pieces = []
+            last = 0
+            for i in remove_indexes:
+                pieces.append(content[last:starts[i]])
+                last = starts[i + 1]
+            pieces.append(content[last:])
+
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(pieces))
+
+            return len(remove_indexes)
+
+        except Exception as e:
+            print(f"删除重复项出错 {file_path}: {e}")
+            return 0
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+XLIFF 解析器
+用 ElementTree.iterparse 流式读取 trans-unit，处理完立即释放节点，内存占用与文件大小无关
+"""
+
+import os
+import re
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
+XLIFF_EXTENSIONS = ('.xliff', '.xlf')
+
+TARGET_LANGUAGE_PATTERN = re.compile(rb'target-language\s*=\s*["\']([^"\']+)["\']')
+LANGUAGE_SCAN_CHUNK_SIZE = 1 << 20
+LANGUAGE_SCAN_OVERLAP = 256
+
+# 处理完即释放的元素
+RELEASED_ELEMENTS = ('trans-unit', 'group', 'body', 'file')
+
+
+def _local_name(tag: str) -> str:
+    """去掉命名空间前缀：{urn:...}trans-unit → trans-unit"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class XLIFFParser:
+    """处理 XLIFF 1.2 文件（翻译供应商交付格式）"""
+
+    @staticmethod
+    def is_xliff_file(path: str) -> bool:
+        return path.lower().endswith(XLIFF_EXTENSIONS)
+
+    @staticmethod
+    def iter_units(source: Union[str, IO[bytes]], default_lang: str = '') -> Iterator[Tuple[str, str, str, Optional[str]]]:
+        """逐个读取 trans-unit，yield (target_lang, key, source_text, target_text)
+
+        source 可以是文件路径，也可以是二进制文件对象（如 zipfile.open 的返回值）。
+        <file> 未声明语言时使用 default_lang；没有 <target> 的条目 target_text 为 None。
+        """
+        target_lang = default_lang
+        open_elems = []  # 当前打开的元素（根 → 当前），用于找到已处理节点的父节点
+        source_text = ''
+        target_text = None
+
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            name = _local_name(elem.tag)
+
+            if event == 'start':
+                open_elems.append(elem)
+                if name == 'file':
+                    target_lang = elem.get('target-language') or elem.get('source-language') or default_lang
+                elif name == 'trans-unit':
+                    source_text = ''
+                    target_text = None
+                continue
+
+            open_elems.pop()
+            if name == 'source':
+                source_text = ''.join(elem.itertext())
+            elif name == 'target':
+                target_text = ''.join(elem.itertext())
+            elif name == 'trans-unit':
+                key = elem.get('resname') or elem.get('id')
+                if key is not None:
+                    yield target_lang, key, source_text, target_text
+
+            if name in RELEASED_ELEMENTS:
+                # 释放已处理的节点并从父节点（body / group / file）摘除，
+                # 嵌套在 <group> 中的 trans-unit 也不会留在树上
+                elem.clear()
+                if open_elems:
+                    open_elems[-1].remove(elem)
+
+    @staticmethod
+    def list_target_languages(source: Union[str, IO[bytes]], default_lang: str = '') -> List[str]:
+        """列出文件中声明的目标语言
+
+        只按块扫描 target-language 属性，不构建 XML 树，大文件也能很快返回；
+        没有声明时返回 [default_lang]。
+        """
+        languages = []
+        tail = b''
+        f = open(source, 'rb') if isinstance(source, str) else source
+        try:
+            while True:
+                chunk = f.read(LANGUAGE_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                data = tail + chunk
+                for match in TARGET_LANGUAGE_PATTERN.finditer(data):
+                    lang = match.group(1).decode('utf-8', 'ignore')
+                    if lang not in languages:
+                        languages.append(lang)
+                # 保留块尾，避免属性被块边界截断
+                tail = data[-LANGUAGE_SCAN_OVERLAP:]
+        except Exception as e:
+            print(f"解析 XLIFF 出错: {e}")
+        finally:
+            if isinstance(source, str):
+                f.close()
+
+        if not languages and default_lang:
+            languages.append(default_lang)
+        return languages
+
+    @staticmethod
+    def language_from_filename(path: str) -> str:
+        """文件没有声明 target-language 时，用文件名作为语言代码（如 de.xliff）"""
+        return os.path.splitext(os.path.basename(path))[0]
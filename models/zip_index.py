@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入文件索引
+缓存导入文件夹中每个 ZIP / XLIFF 的语言列表、条目数和大小，按 路径 + mtime/size 失效，
+持久化到用户目录，下次打开时列表和语言映射对话框可以直接从缓存显示
+"""
+
+import json
+import os
+import threading
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+from models.xliff_parser import XLIFFParser
+
+
+class ZipIndex:
+    """进程内共享的导入文件索引
+
+    每条记录: {'name', 'path', 'size', 'mtime', 'mtime_ns', 'languages', 'entry_count'}
+    - languages: 文件中包含的语言（未索引时为 None）
+    - entry_count: 语言文件数（ZIP 中 .strings / .xliff 成员数，单个 XLIFF 为 1）
+    """
+
+    INDEX_FILE = os.path.expanduser("~/.ios_localization_tool_zip_index.json")
+
+    _lock = threading.Lock()
+    _entries: Dict[str, dict] = {}
+    _loaded = False
+
+    @staticmethod
+    def is_import_file(name: str) -> bool:
+        """是否为可导入的文件（.zip / .xliff / .xlf）"""
+        return name.endswith('.zip') or XLIFFParser.is_xliff_file(name)
+
+    @staticmethod
+    def signature(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _ensure_loaded(cls):
+        """首次使用时从磁盘加载索引"""
+        if cls._loaded:
+            return
+        with cls._lock:
+            if cls._loaded:
+                return
+            try:
+                with open(cls.INDEX_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    cls._entries = {path: entry for path, entry in data.items() if isinstance(entry, dict)}
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"加载导入文件索引失败: {e}")
+            cls._loaded = True
+
+    @classmethod
+    def save(cls):
+        """写回磁盘（先写临时文件再替换，避免写一半的索引）"""
+        cls._ensure_loaded()
+        with cls._lock:
+            data = dict(cls._entries)
+        tmp_path = cls.INDEX_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cls.INDEX_FILE)
+        except Exception as e:
+            print(f"保存导入文件索引失败: {e}")
+
+    @classmethod
+    def get(cls, file_path: str, signature: Optional[Tuple[int, int]] = None) -> Optional[dict]:
+        """获取已索引的记录，文件已修改（或不存在）时返回 None"""
+        cls._ensure_loaded()
+        with cls._lock:
+            entry = cls._entries.get(file_path)
+        if entry is None or entry.get('languages') is None:
+            return None
+
+        if signature is None:
+            try:
+                signature = cls.signature(os.stat(file_path))
+            except OSError:
+                return None
+        if (entry.get('mtime_ns'), entry.get('size')) != signature:
+            return None
+        return entry
+
+    @classmethod
+    def put(cls, entry: dict):
+        cls._ensure_loaded()
+        with cls._lock:
+            cls._entries[entry['path']] = entry
+
+    @classmethod
+    def cached_folder(cls, folder: str) -> List[dict]:
+        """缓存中该文件夹下的记录（不访问磁盘，用于立即显示列表），按修改时间倒序"""
+        cls._ensure_loaded()
+        folder = os.path.abspath(folder)
+        with cls._lock:
+            entries = [
+                entry for path, entry in cls._entries.items()
+                if os.path.dirname(path) == folder
+            ]
+        entries.sort(key=lambda x: x['mtime'], reverse=True)
+        return entries
+
+    @classmethod
+    def prune_folder(cls, folder: str, existing_paths: set) -> int:
+        """移除该文件夹下已经不存在的文件的记录，返回移除数量"""
+        cls._ensure_loaded()
+        folder = os.path.abspath(folder)
+        with cls._lock:
+            stale = [p for p in cls._entries if os.path.dirname(p) == folder and p not in existing_paths]
+            for path in stale:
+                del cls._entries[path]
+        return len(stale)
+
+    @staticmethod
+    def make_entry(file_path: str, stat: os.stat_result) -> dict:
+        """只包含文件系统信息的记录（语言未索引）"""
+        return {
+            'name': os.path.basename(file_path),
+            'path': file_path,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'mtime_ns': stat.st_mtime_ns,
+            'languages': None,
+            'entry_count': None,
+        }
+
+    @staticmethod
+    def read_metadata(file_path: str) -> Tuple[List[str], int]:
+        """读取文件中的语言列表和语言文件数
+
+        ZIP 只读取中央目录和 XLIFF 的 target-language 属性，不解压 .strings 内容
+        """
+        if XLIFFParser.is_xliff_file(file_path):
+            default_lang = XLIFFParser.language_from_filename(file_path)
+            return XLIFFParser.list_target_languages(file_path, default_lang), 1
+
+        languages = []
+        entry_count = 0
+        with zipfile.ZipFile(file_path, 'r') as zf:
+            for name in zf.namelist():
+                if XLIFFParser.is_xliff_file(name):
+                    entry_count += 1
+                    default_lang = XLIFFParser.language_from_filename(name)
+                    with zf.open(name) as f:
+                        for lang_code in XLIFFParser.list_target_languages(f, default_lang):
+                            if lang_code not in languages:
+                                languages.append(lang_code)
+                elif name.endswith('.strings'):
+                    entry_count += 1
+                    # 提取语言代码（去掉路径和扩展名）
+                    lang_code = os.path.splitext(os.path.basename(name))[0]
+                    if lang_code and lang_code not in languages:
+                        languages.append(lang_code)
+        return languages, entry_count
+
+    @classmethod
+    def index_file(cls, file_path: str, stat: Optional[os.stat_result] = None) -> dict:
+        """返回文件的索引记录，缓存失效时重新读取并写入缓存"""
+        file_path = os.path.abspath(file_path)
+        if stat is None:
+            stat = os.stat(file_path)
+
+        entry = cls.get(file_path, cls.signature(stat))
+        if entry is not None:
+            return entry
+
+        entry = cls.make_entry(file_path, stat)
+        try:
+            entry['languages'], entry['entry_count'] = cls.read_metadata(file_path)
+        except Exception as e:
+            print(f"解析 {entry['name']} 失败: {e}")
+            entry['languages'], entry['entry_count'] = [], 0
+        cls.put(entry)
+        return entry
+
+    @classmethod
+    def get_languages(cls, file_path: str) -> List[str]:
+        """文件中的语言列表（优先使用缓存）"""
+        try:
+            return list(cls.index_file(file_path)['languages'])
+        except OSError as e:
+            print(f"读取 {file_path} 失败: {e}")
+            return []
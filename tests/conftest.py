@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pytest 公共配置
+- 无界面运行 Qt（offscreen）
+- 配置文件写到临时目录，不读写用户的 ~/.ios_localization_tool.json
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import ConfigManager
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """每个测试使用独立的配置文件和内存配置"""
+    monkeypatch.setattr(ConfigManager, 'CONFIG_FILE', str(tmp_path / 'config.json'))
+    monkeypatch.setattr(ConfigManager, '_config', None)
+    monkeypatch.setattr(ConfigManager, '_dirty', False)
+    monkeypatch.setattr(ConfigManager, '_save_timer', None)
+    yield
+    # 丢弃未写盘的修改，恢复原配置路径后不会写到用户的配置文件
+    with ConfigManager._lock:
+        if ConfigManager._save_timer is not None:
+            ConfigManager._save_timer.cancel()
+            ConfigManager._save_timer = None
+        ConfigManager._dirty = False
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """测试进程共用一个 QApplication"""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def wait_for_pool(qapp, timeout_ms: int = 5000):
+    """等待共享线程池中的任务全部结束，并处理排队到主线程的信号"""
+    from workers.worker_pool import WorkerPool
+    pool = WorkerPool.instance()
+    assert pool.pool.waitForDone(timeout_ms)
+    # 池线程结束前可能又派发了后续任务，处理完信号后再确认一次
+    for _ in range(10):
+        qapp.processEvents()
+        if pool.active_count() == 0:
+            break
+        pool.pool.waitForDone(timeout_ms)
+    qapp.processEvents()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ConfigManager 的内存缓存、延迟写盘和变化通知"""
+
+import json
+import os
+import time
+
+import utils.config
+from conftest import wait_for_pool
+from utils.config import ConfigManager
+
+
+def read_config_file() -> dict:
+    with open(ConfigManager.CONFIG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_set_is_written_on_flush_only():
+    ConfigManager.set('export_path', '/tmp/export')
+
+    assert ConfigManager.get('export_path') == '/tmp/export'
+    assert not os.path.exists(ConfigManager.CONFIG_FILE)
+
+    ConfigManager.flush()
+
+    assert read_config_file() == {'export_path': '/tmp/export'}
+    assert not ConfigManager._dirty
+
+
+def test_write_behind_merges_changes(monkeypatch):
+    monkeypatch.setattr(utils.config, 'SAVE_DELAY', 0.05)
+    ConfigManager.set('git_base_ref', 'main')
+    ConfigManager.set('git_base_ref', 'develop')
+    ConfigManager.set('last_import_folder', '/tmp')
+
+    deadline = time.monotonic() + 2
+    while not os.path.exists(ConfigManager.CONFIG_FILE) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert read_config_file() == {'git_base_ref': 'develop', 'last_import_folder': '/tmp'}
+
+
+def test_failed_write_keeps_changes_dirty(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigManager, 'CONFIG_FILE', str(tmp_path / 'missing' / 'config.json'))
+    ConfigManager.set('git_base_ref', 'main')
+
+    ConfigManager.flush()
+
+    assert ConfigManager._dirty
+    assert not any(name.endswith('.tmp') for name in os.listdir(tmp_path))
+
+    (tmp_path / 'missing').mkdir()
+    ConfigManager.flush()
+
+    assert read_config_file() == {'git_base_ref': 'main'}
+
+
+def test_loaded_once_and_copies_returned():
+    with open(ConfigManager.CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'language_mappings': {'zh': 'zh-Hans'}}, f)
+
+    mappings = ConfigManager.get_language_mappings()
+    mappings['ja'] = 'ja'
+    os.remove(ConfigManager.CONFIG_FILE)
+
+    assert ConfigManager.get_language_mappings() == {'zh': 'zh-Hans'}
+
+
+def test_save_config_keeps_live_dict_and_notifies_changes():
+    ConfigManager.set('git_base_ref', 'main')
+    live = ConfigManager._config
+    changes = []
+    ConfigManager.subscribe(lambda key, value: changes.append((key, value)))
+    try:
+        ConfigManager.save_config({'git_base_ref': 'main', 'export_path': '/tmp'})
+        ConfigManager.set('last_import_folder', '/tmp')
+        ConfigManager.set('git_base_ref', 'main')  # 值没变不通知
+    finally:
+        ConfigManager._listeners.clear()
+
+    assert ConfigManager._config is live
+    assert ConfigManager.load_config() == {
+        'git_base_ref': 'main', 'export_path': '/tmp', 'last_import_folder': '/tmp'
+    }
+    assert changes == [('export_path', '/tmp'), ('last_import_folder', '/tmp')]
+
+
+def test_git_ref_input_follows_config(qapp):
+    from views.main_window import MainWindow
+
+    window = MainWindow()
+    try:
+        ConfigManager.save_git_base_ref('release/2.0')
+        qapp.processEvents()
+        assert window.git_ref_input.text() == 'release/2.0'
+    finally:
+        wait_for_pool(qapp)
+        window.close()
+        window.deleteLater()
+        qapp.processEvents()
+
+
+def test_import_tab_follows_config(qapp, tmp_path):
+    from views.import_tab import ImportTab
+
+    tab = ImportTab()
+    try:
+        ConfigManager.save_last_import_folder(str(tmp_path))
+        qapp.processEvents()
+        assert tab.current_folder == str(tmp_path)
+        assert tab.folder_input.text() == str(tmp_path)
+    finally:
+        wait_for_pool(qapp)
+        tab.deleteLater()
+        qapp.processEvents()
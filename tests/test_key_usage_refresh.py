@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""切换项目后 Key 引用索引的刷新"""
+
+import os
+import threading
+
+from PyQt6.QtCore import pyqtSignal
+
+from conftest import wait_for_pool
+from workers.base_worker import BaseWorker
+from workers.worker_pool import MAX_POOL_THREADS
+
+
+class BlockingWorker(BaseWorker):
+    """占住一个池线程，直到 gate 被设置"""
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, gate: threading.Event):
+        super().__init__()
+        self.gate = gate
+
+    def run(self):
+        self.gate.wait(5)
+        self.finished.emit(True, "")
+
+
+def make_project(root) -> str:
+    """最小项目：一个语言文件 + 两个引用 key 的源文件"""
+    lproj = root / 'App' / 'en.lproj'
+    lproj.mkdir(parents=True)
+    (lproj / 'Localizable.strings').write_text('"title" = "Title";\n"ok" = "OK";\n', encoding='utf-8')
+    sources = root / 'App' / 'Sources'
+    sources.mkdir()
+    (sources / 'A.swift').write_text('label.text = "title".localized\n', encoding='utf-8')
+    (sources / 'B.m').write_text('button.title = NSLocalizedString(@"ok", nil);\n', encoding='utf-8')
+    return str(root)
+
+
+def test_set_project_path_twice_refreshes_index(qapp, tmp_path):
+    """连续两次设置同一个项目：第二次 reset 之后的刷新不能合并进已取消的刷新"""
+    from views.main_window import MainWindow
+
+    project_path = make_project(tmp_path)
+    window = MainWindow()
+    try:
+        for _ in range(2):
+            # 占满线程池，让第一次的刷新停在队列里，第二次设置项目时它还没执行
+            gate = threading.Event()
+            blockers = [BlockingWorker(gate) for _ in range(MAX_POOL_THREADS)]
+            for blocker in blockers:
+                blocker.start()
+            window.set_project_path(project_path)
+            window.set_project_path(project_path)
+            gate.set()
+            wait_for_pool(qapp)
+
+            index = window.key_usage_index
+            assert index.project_path == project_path
+            assert index.file_count == 2
+            assert index.key_count == 2
+            assert index.lookup('ok') == [(os.path.join(project_path, 'App', 'Sources', 'B.m'), 1)]
+    finally:
+        window.close()
+        window.deleteLater()
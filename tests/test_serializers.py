@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""导出格式序列化器"""
+
+import xml.etree.ElementTree as ET
+
+from models.serializers import AndroidXMLSerializer
+
+
+def test_android_xml_escapes_key_and_value(tmp_path):
+    entries = [('say "hi"', 'Hi'), ('a&b', 'x < y & "z"'), ('<tag>', "it's")]
+    serializer = AndroidXMLSerializer(str(tmp_path), 'en')
+    serializer.open()
+    try:
+        for key, value in entries:
+            serializer.write(key, value)
+    finally:
+        serializer.close()
+
+    root = ET.parse(serializer.file_path).getroot()
+    assert [(node.get('name'), node.text) for node in root.iter('string')] == entries
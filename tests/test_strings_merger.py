@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""StringsFileMerger：原地替换已有条目、追加新条目"""
+
+import os
+
+from models.localization_parser import LocalizationParser, StringsFileMerger
+
+ORIGINAL = (
+    '/* 标题 */\n'
+    '"title" = "Title";\n'
+    '"ok"   =   "OK"; // 按钮\n'
+    '"dup" = "first";\n'
+    '"dup" = "second";\n'
+)
+
+
+def write_strings(tmp_path, content: str = ORIGINAL) -> str:
+    path = tmp_path / 'Localizable.strings'
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+def read(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_patch_replaces_values_in_place(tmp_path):
+    path = write_strings(tmp_path)
+    merger = StringsFileMerger(path)
+    merger.add('ok', 'Okay')
+    merger.add('dup', 'third')
+    merger.add('title', 'Title')  # 值没变不改动
+
+    assert merger.commit() == (2, 0)
+    # 注释和空白原样保留，重复的 key 只替换最后一次出现（与解析时后者覆盖前者一致）
+    assert read(path) == (
+        '/* 标题 */\n'
+        '"title" = "Title";\n'
+        '"ok"   =   "Okay"; // 按钮\n'
+        '"dup" = "first";\n'
+        '"dup" = "third";\n'
+    )
+
+
+def test_append_new_keys_with_version_markers(tmp_path):
+    path = write_strings(tmp_path, '"title" = "Title";')
+    merger = StringsFileMerger(path)
+    merger.add('cancel', 'Cancel')
+    merger.add('title', 'Heading')
+
+    assert merger.commit('2.0') == (1, 1)
+    assert read(path) == (
+        '"title" = "Heading";\n'
+        '\n//<!-- ========== 2.0 新增 ========== -->\n'
+        '"cancel" = "Cancel";\n'
+        '//<!-- ========== 2.0 新增 ========== -->\n'
+    )
+
+
+def test_unchanged_file_is_not_written(tmp_path):
+    path = write_strings(tmp_path)
+    mtime = os.stat(path).st_mtime_ns
+    merger = StringsFileMerger(path)
+    merger.add('ok', 'Changed')
+    merger.add('ok', 'OK')  # 改回文件中的值，之前的修改作废
+
+    assert not merger.changed
+    assert merger.commit() == (0, 0)
+    assert os.stat(path).st_mtime_ns == mtime
+    assert read(path) == ORIGINAL
+
+
+def test_escaped_values_round_trip(tmp_path):
+    path = write_strings(tmp_path)
+    values = {'title': 'Say "hi"\n\tnow \\ later', 'new "key"': 'line1\nline2'}
+
+    assert LocalizationParser.patch_strings_file(path, values) == (1, 1)
+
+    spans = {key: value for key, value, _, _ in LocalizationParser.iter_entry_spans(read(path))}
+    assert spans['title'] == values['title']
+    assert spans['new "key"'] == values['new "key"']
+    assert spans['ok'] == 'OK'
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""WorkerPool 的合并（相同 job_key）与取消"""
+
+import threading
+
+import pytest
+from PyQt6.QtCore import pyqtSignal
+
+from conftest import wait_for_pool
+from workers.base_worker import BaseWorker
+from workers.worker_pool import MAX_POOL_THREADS, PRIORITY_BACKGROUND, WorkerPool
+
+
+class BlockingWorker(BaseWorker):
+    """占住一个池线程，直到 gate 被设置"""
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, gate: threading.Event):
+        super().__init__()
+        self.gate = gate
+
+    def run(self):
+        self.gate.wait(5)
+        self.finished.emit(True, "")
+
+
+class CountingWorker(BaseWorker):
+    """可合并的任务：记录 run() 被执行的次数"""
+    finished = pyqtSignal(bool, str, list)
+    RESULT_TYPES = (list,)
+    runs = []
+
+    def __init__(self, name: str = 'job', emit: bool = True):
+        super().__init__()
+        self.name = name
+        self.emit = emit
+
+    def job_key(self):
+        return ('CountingWorker', self.name)
+
+    def run(self):
+        CountingWorker.runs.append(self.name)
+        if self.check_stopped():
+            self.finished.emit(False, "操作已取消", [])
+        elif self.emit:
+            self.finished.emit(True, "done", [self.name])
+
+
+class BackgroundWorker(CountingWorker):
+    PRIORITY = PRIORITY_BACKGROUND
+
+
+@pytest.fixture
+def saturated_pool(qapp):
+    """占满线程池：期间提交的任务都停在队列中，yield 释放函数"""
+    CountingWorker.runs = []
+    gate = threading.Event()
+    blockers = [BlockingWorker(gate) for _ in range(MAX_POOL_THREADS)]
+    for blocker in blockers:
+        blocker.start()
+    yield gate.set
+    gate.set()
+    wait_for_pool(qapp)
+
+
+def collect(worker) -> list:
+    results = []
+    worker.finished.connect(lambda *args: results.append(args))
+    return results
+
+
+def test_identical_jobs_are_merged(qapp, saturated_pool):
+    first, second = CountingWorker(), CountingWorker()
+    first_results, second_results = collect(first), collect(second)
+    first.start()
+    second.start()
+
+    saturated_pool()
+    wait_for_pool(qapp)
+
+    assert CountingWorker.runs == ['job']
+    assert first_results == second_results == [(True, "done", ['job'])]
+    assert not first.isRunning() and not second.isRunning()
+
+
+def test_stopped_job_is_not_merged(qapp, saturated_pool):
+    stale = CountingWorker()
+    stale_results = collect(stale)
+    stale.start()
+    stale.stop()
+    fresh = CountingWorker()
+    fresh_results = collect(fresh)
+    fresh.start()
+
+    saturated_pool()
+    wait_for_pool(qapp)
+
+    assert CountingWorker.runs == ['job', 'job']
+    assert stale_results == [(False, "操作已取消", [])]
+    assert fresh_results == [(True, "done", ['job'])]
+
+
+def test_cancel_removes_pending_job(qapp, saturated_pool):
+    worker = BackgroundWorker('background')
+    results = collect(worker)
+    worker.start()
+
+    assert WorkerPool.instance().cancel(worker)
+    assert not worker.isRunning()
+    assert worker.wait(0)
+
+    saturated_pool()
+    wait_for_pool(qapp)
+
+    assert CountingWorker.runs == []
+    assert results == []
+    assert WorkerPool.instance().active_count() == 0
+
+
+def test_cancel_subscriber_keeps_shared_job(qapp, saturated_pool):
+    owner, subscriber = CountingWorker(), CountingWorker()
+    owner_results, subscriber_results = collect(owner), collect(subscriber)
+    owner.start()
+    subscriber.start()
+
+    assert WorkerPool.instance().cancel(subscriber)
+
+    saturated_pool()
+    wait_for_pool(qapp)
+
+    assert CountingWorker.runs == ['job']
+    assert owner_results == [(True, "done", ['job'])]
+    assert subscriber_results == []
+
+
+def test_subscriber_gets_failure_when_shared_job_has_no_result(qapp, saturated_pool):
+    owner, subscriber = CountingWorker(emit=False), CountingWorker()
+    subscriber_results = collect(subscriber)
+    progress = []
+    subscriber.progress.connect(progress.append)
+    owner.start()
+    subscriber.start()
+
+    saturated_pool()
+    wait_for_pool(qapp)
+
+    assert len(subscriber_results) == 1
+    success, _, result = subscriber_results[0]
+    assert success is False and result == []
+    assert not subscriber.isRunning()
+
+    # 任务结束后不再转发共享 worker 的进度
+    owner.progress.emit("late")
+    qapp.processEvents()
+    assert progress == []
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""String Catalog 的流式读取"""
+
+import json
+
+import pytest
+
+from models.xcstrings_parser import XCStringsParser, _StreamReader
+
+STRINGS = {
+    'Hello': {'localizations': {'en': {'stringUnit': {'state': 'translated', 'value': 'Hallo EN'}}}},
+    'Tschüss': {},
+    '%lld items': {'localizations': {'de': {'variations': {'plural': {
+        'one': {'stringUnit': {'state': 'translated', 'value': '%lld Eintrag'}},
+        'other': {'stringUnit': {'state': 'translated', 'value': '%lld Einträge'}},
+    }}}}},
+}
+
+
+def write_catalog(tmp_path, source_first: bool) -> str:
+    """sourceLanguage 写在 strings 之前（Xcode 的顺序）或之后（手工编辑）"""
+    if source_first:
+        catalog = {'sourceLanguage': 'de', 'strings': STRINGS, 'version': '1.0'}
+    else:
+        catalog = {'strings': STRINGS, 'version': '1.0', 'sourceLanguage': 'de'}
+    path = tmp_path / 'Localizable.xcstrings'
+    path.write_text(json.dumps(catalog, ensure_ascii=False, indent=2), encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(params=[_StreamReader.CHUNK_SIZE, 7], ids=['default-chunk', 'small-chunk'])
+def chunk_size(request, monkeypatch):
+    """小块读取时 key / 条目会被块边界截断"""
+    monkeypatch.setattr(_StreamReader, 'CHUNK_SIZE', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('source_first', [True, False], ids=['source-first', 'source-last'])
+def test_source_language_applies_to_all_entries(tmp_path, chunk_size, source_first):
+    path = write_catalog(tmp_path, source_first)
+
+    assert XCStringsParser.load_languages(path) == {
+        'en': {'Hello': 'Hallo EN'},
+        'de': {'Hello': 'Hello', 'Tschüss': 'Tschüss', '%lld items': '%lld Einträge'},
+    }
+
+
+def test_duplicates_use_source_language_declared_after_strings(tmp_path):
+    path = tmp_path / 'Localizable.xcstrings'
+    path.write_text(
+        '{\n  "strings" : {\n'
+        '    "Title" : {},\n'
+        '    "Title" : {"localizations" : {"de" : {"stringUnit" : {"value" : "Titel"}}}}\n'
+        '  },\n  "sourceLanguage" : "de"\n}\n',
+        encoding='utf-8'
+    )
+
+    assert XCStringsParser.find_duplicates(str(path)) == {'Title': [('Title', 3), ('Titel', 4)]}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""XLIFF 流式解析"""
+
+import xml.etree.ElementTree as ET
+
+from models.xliff_parser import XLIFFParser
+
+UNIT_COUNT = 5000
+
+
+def write_grouped_xliff(path):
+    """trans-unit 嵌套在 <group> 中的 XLIFF"""
+    units = ''.join(
+        f'<trans-unit id="key{i}"><source>S{i}</source><target>T{i}</target></trans-unit>'
+        for i in range(UNIT_COUNT)
+    )
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">'
+        '<file original="Localizable.strings" source-language="en" target-language="de"><body>'
+        f'<group id="g1"><group id="g2">{units}</group></group>'
+        '<trans-unit id="plain"><source>P</source></trans-unit>'
+        '</body></file></xliff>',
+        encoding='utf-8'
+    )
+
+
+def test_grouped_units_are_read_and_released(tmp_path, monkeypatch):
+    path = tmp_path / 'de.xliff'
+    write_grouped_xliff(path)
+
+    groups = []
+    iterparse = ET.iterparse
+
+    def recording_iterparse(source, events=None):
+        for event, elem in iterparse(source, events):
+            if event == 'start' and elem.tag.endswith('group'):
+                groups.append(elem)
+            yield event, elem
+
+    monkeypatch.setattr(ET, 'iterparse', recording_iterparse)
+
+    units = []
+    tree_sizes = []
+    for unit in XLIFFParser.iter_units(str(path)):
+        units.append(unit)
+        tree_sizes.append(sum(1 for _ in groups[-1].iter()))
+
+    assert len(units) == UNIT_COUNT + 1
+    assert units[0] == ('de', 'key0', 'S0', 'T0')
+    assert units[-1] == ('de', 'plain', 'P', None)
+    # iterparse 会预读一块数据，group 上只剩预读的条目；已处理的 trans-unit 都被摘除，不随条目数累积
+    assert max(tree_sizes) < UNIT_COUNT / 2
+    assert len(groups[-1]) == 0
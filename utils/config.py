@@ -5,44 +5,173 @@
 保存和读取用户配置
 """
 
+import atexit
+import copy
 import json
 import os
-from typing import Optional
+import tempfile
+import threading
+from typing import Any, Callable, List, Optional
+
+# 修改后延迟写盘的时间（秒），期间的多次修改合并为一次写入
+SAVE_DELAY = 0.5
 
 
 class ConfigManager:
-    """配置管理器"""
+    """配置管理器
+    
+    进程内只读一次配置文件，之后读写都在内存中进行；修改后延迟 SAVE_DELAY 秒
+    合并写盘（临时文件 + 原子替换），程序退出时把未写入的修改写完
+    """
     
     # 配置文件路径
     CONFIG_FILE = os.path.expanduser("~/.ios_localization_tool.json")
     
-    @staticmethod
-    def save_config(config: dict):
-        """保存配置"""
-        try:
-            with open(ConfigManager.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"保存配置失败: {e}")
+    _lock = threading.RLock()
+    _write_lock = threading.Lock()  # 同一时间只有一个线程写盘
+    _config = None                  # 内存中的配置，首次使用时加载
+    _dirty = False                  # 是否有尚未写盘的修改
+    _save_timer = None
+    _listeners: List[Callable[[str, Any], None]] = []
     
-    @staticmethod
-    def load_config() -> dict:
-        """加载配置"""
-        if not os.path.exists(ConfigManager.CONFIG_FILE):
-            return {}
+    @classmethod
+    def _ensure_loaded(cls) -> dict:
+        """首次使用时从磁盘加载配置"""
+        if cls._config is not None:
+            return cls._config
+        with cls._lock:
+            if cls._config is None:
+                config = {}
+                try:
+                    with open(cls.CONFIG_FILE, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        config = data
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"加载配置失败: {e}")
+                cls._config = config
+            return cls._config
+    
+    @classmethod
+    def load_config(cls) -> dict:
+        """获取配置的副本（修改副本不会影响配置，需要通过 save_config / set 保存）"""
+        cls._ensure_loaded()
+        with cls._lock:
+            return copy.deepcopy(cls._config)
+    
+    @classmethod
+    def save_config(cls, config: dict):
+        """整体替换配置，延迟写盘
         
-        try:
-            with open(ConfigManager.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"加载配置失败: {e}")
-            return {}
+        在原字典上修改（不替换 _config），与并发的 set() 始终作用于同一个字典
+        """
+        cls._ensure_loaded()
+        with cls._lock:
+            old_config = dict(cls._config)
+            cls._config.clear()
+            cls._config.update(copy.deepcopy(config))
+            cls._dirty = True
+        for key in set(old_config) | set(config):
+            if old_config.get(key) != config.get(key):
+                cls._notify(key, config.get(key))
+        cls._schedule_save()
+    
+    @classmethod
+    def get(cls, key: str, default: Any = None) -> Any:
+        """读取单个配置项（内存读取，不访问磁盘）"""
+        cls._ensure_loaded()
+        with cls._lock:
+            value = cls._config.get(key, default)
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    
+    @classmethod
+    def set(cls, key: str, value: Any):
+        """修改单个配置项，值有变化时通知监听者并延迟写盘"""
+        cls._ensure_loaded()
+        with cls._lock:
+            config = cls._config
+            if key in config and config[key] == value:
+                return
+            config[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            cls._dirty = True
+        cls._notify(key, value)
+        cls._schedule_save()
+    
+    @classmethod
+    def subscribe(cls, listener: Callable[[str, Any], None]):
+        """监听配置变化：listener(key, new_value)，在修改配置的线程中同步调用"""
+        with cls._lock:
+            if listener not in cls._listeners:
+                cls._listeners.append(listener)
+    
+    @classmethod
+    def unsubscribe(cls, listener: Callable[[str, Any], None]):
+        with cls._lock:
+            if listener in cls._listeners:
+                cls._listeners.remove(listener)
+    
+    @classmethod
+    def _notify(cls, key: str, value: Any):
+        with cls._lock:
+            listeners = list(cls._listeners)
+        for listener in listeners:
+            try:
+                listener(key, value)
+            except Exception as e:
+                print(f"配置变化通知失败 {key}: {e}")
+    
+    @classmethod
+    def _schedule_save(cls):
+        """SAVE_DELAY 秒后写盘；期间再次修改会重新计时"""
+        with cls._lock:
+            if cls._save_timer is not None:
+                cls._save_timer.cancel()
+            cls._save_timer = threading.Timer(SAVE_DELAY, cls.flush)
+            cls._save_timer.daemon = True
+            cls._save_timer.start()
+    
+    @classmethod
+    def flush(cls):
+        """立即把内存中的配置写盘（先写临时文件再原子替换，不会留下写一半的配置）
+
+        取快照和写盘都在 _write_lock 内完成，并发 flush 时后取的（更新的）快照一定后写入
+        """
+        with cls._write_lock:
+            with cls._lock:
+                if cls._save_timer is not None:
+                    cls._save_timer.cancel()
+                    cls._save_timer = None
+                if cls._config is None or not cls._dirty:
+                    return
+                data = json.dumps(cls._config, indent=2, ensure_ascii=False)
+                cls._dirty = False
+            
+            config_dir = os.path.dirname(cls.CONFIG_FILE) or '.'
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix='.ios_localization_tool.', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, cls.CONFIG_FILE)
+            except Exception as e:
+                print(f"保存配置失败: {e}")
+                # 没写成功：保留脏标记，下次修改或退出时再写
+                with cls._lock:
+                    cls._dirty = True
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
     
     @staticmethod
     def get_last_project_path() -> Optional[str]:
         """获取上次的项目路径"""
-        config = ConfigManager.load_config()
-        path = config.get('last_project_path')
+        path = ConfigManager.get('last_project_path')
         
         # 检查路径是否仍然存在
         if path and os.path.exists(path):
@@ -52,15 +181,12 @@ class ConfigManager:
     @staticmethod
     def save_last_project_path(path: str):
         """保存项目路径"""
-        config = ConfigManager.load_config()
-        config['last_project_path'] = path
-        ConfigManager.save_config(config)
+        ConfigManager.set('last_project_path', path)
     
     @staticmethod
     def get_last_import_folder() -> str:
         """获取上次的导入文件夹路径"""
-        config = ConfigManager.load_config()
-        path = config.get('last_import_folder', os.path.expanduser("~/Downloads"))
+        path = ConfigManager.get('last_import_folder', os.path.expanduser("~/Downloads"))
         
         # 检查路径是否存在
         if os.path.exists(path):
@@ -70,16 +196,13 @@ class ConfigManager:
     @staticmethod
     def save_last_import_folder(path: str):
         """保存导入文件夹路径"""
-        config = ConfigManager.load_config()
-        config['last_import_folder'] = path
-        ConfigManager.save_config(config)
+        ConfigManager.set('last_import_folder', path)
     
     @staticmethod
     def get_export_path() -> str:
         """获取导出路径"""
         from utils.constants import DEFAULT_EXPORT_PATH
-        config = ConfigManager.load_config()
-        path = config.get('export_path', DEFAULT_EXPORT_PATH)
+        path = ConfigManager.get('export_path', DEFAULT_EXPORT_PATH)
         
         # 检查路径是否存在
         if os.path.exists(path) and os.path.isdir(path):
@@ -89,23 +212,32 @@ class ConfigManager:
     @staticmethod
     def save_export_path(path: str):
         """保存导出路径"""
-        config = ConfigManager.load_config()
-        config['export_path'] = path
-        ConfigManager.save_config(config)
+        ConfigManager.set('export_path', path)
     
     @staticmethod
     def get_language_mappings() -> dict:
         """获取语言映射配置"""
-        config = ConfigManager.load_config()
-        return config.get('language_mappings', {})
+        return ConfigManager.get('language_mappings', {})
     
     @staticmethod
     def save_language_mappings(mappings: dict):
         """保存语言映射配置（合并到现有配置）"""
-        config = ConfigManager.load_config()
-        existing = config.get('language_mappings', {})
+        existing = ConfigManager.get('language_mappings', {})
         # 合并新映射（新的覆盖旧的）
         existing.update(mappings)
-        config['language_mappings'] = existing
-        ConfigManager.save_config(config)
+        ConfigManager.set('language_mappings', existing)
+
+    
+    @staticmethod
+    def get_git_base_ref() -> str:
+        """获取增量扫描使用的 git 基线（如 main / v1.2.0），空字符串表示全量扫描"""
+        return ConfigManager.get('git_base_ref', '')
+    
+    @staticmethod
+    def save_git_base_ref(ref: str):
+        """保存增量扫描使用的 git 基线"""
+        ConfigManager.set('git_base_ref', ref)
+
 
+# 退出时写入尚未落盘的修改
+atexit.register(ConfigManager.flush)
@@ -5,7 +5,6 @@
 """
 
 import os
-from .theme import get_main_style, get_delete_button_style, get_theme_colors, is_dark_mode
 
 # 默认忽略的文件夹
 DEFAULT_IGNORE_FOLDERS = ['Pods', 'DerivedData', 'build', 'Build', '.git', 'Carthage']
@@ -13,17 +12,11 @@ DEFAULT_IGNORE_FOLDERS = ['Pods', 'DerivedData', 'build', 'Build', '.git', 'Cart
 # 默认导出路径
 DEFAULT_EXPORT_PATH = os.path.expanduser("~/Desktop")
 
-# 进度报告频率（每处理 N 个文件报告一次）
-PROGRESS_REPORT_INTERVAL = 10
+# 结构化进度最短发送间隔（秒），即最多 20Hz；中间的进度合并为最后一次
+PROGRESS_EMIT_INTERVAL = 0.05
 
-# 获取主题颜色
-THEME_COLORS = get_theme_colors()
-IS_DARK_MODE = is_dark_mode()
-
-# 现代化样式表（自动适配暗黑模式）
-MAIN_STYLE = get_main_style()
-
-DELETE_BUTTON_STYLE = get_delete_button_style()
+# 日志视图最多保留的行数，超出后丢弃最早的行
+LOG_MAX_LINES = 5000
 
 LARGE_BUTTON_STYLE = """
     QPushButton {
@@ -31,3 +24,12 @@ LARGE_BUTTON_STYLE = """
         font-weight: 500;
     }
 """
+
+
+def __getattr__(name):
+    # 依赖主题的样式在第一次使用时才生成：导入本模块不加载 Qt、不检测系统主题
+    if name == 'DELETE_BUTTON_STYLE':
+        from .theme import get_delete_button_style
+        value = globals()[name] = get_delete_button_style()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+外部编辑器工具
+在 Xcode / VSCode 等编辑器中打开文件并跳转到指定行
+"""
+
+import shutil
+import subprocess
+
+
+def open_in_editor(file_path: str, line_num: int):
+    """在外部编辑器中打开文件并跳转到指定行
+
+    优先在已打开的 Xcode 中打开文件
+    """
+    try:
+        # 优先尝试在已打开的 Xcode 中打开
+        if open_in_xcode(file_path, line_num):
+            return
+
+        # 如果 Xcode 方式失败，尝试其他编辑器
+        editors = [
+            # VSCode
+            ('code', lambda: subprocess.run(['code', '-g', f'{file_path}:{line_num}'], check=False)),
+            # Sublime Text
+            ('subl', lambda: subprocess.run(['subl', f'{file_path}:{line_num}'], check=False)),
+            # Atom
+            ('atom', lambda: subprocess.run(['atom', f'{file_path}:{line_num}'], check=False)),
+        ]
+
+        # 查找可用的编辑器
+        for cmd, open_func in editors:
+            if shutil.which(cmd):
+                open_func()
+                return
+
+        # 如果没有找到专用编辑器，尝试用系统默认方式打开
+        # macOS
+        subprocess.run(['open', file_path], check=False)
+
+    except Exception as e:
+        print(f"打开编辑器失败: {e}")
+
+
+def open_in_xcode(file_path: str, line_num: int) -> bool:
+    """在 Xcode 中打开文件并跳转到指定行
+
+    优先使用 xed 命令（简单直接）
+
+    Returns:
+        bool: 成功返回 True，失败返回 False
+    """
+    try:
+        # 方法1: 使用 xed 命令（Xcode 自带）
+        # -l 参数指定行号
+        result = subprocess.run(
+            ['xed', '--line', str(line_num), file_path],
+            capture_output=True,
+            timeout=3
+        )
+
+        if result.returncode == 0:
+            return True
+
+        # 方法2: 如果上面失败，尝试不带行号参数
+        subprocess.run(['xed', file_path], check=False)
+        return True
+
+    except subprocess.TimeoutExpired:
+        # 超时，尝试不等待
+        try:
+            subprocess.Popen(['xed', '--line', str(line_num), file_path])
+            return True
+        except:
+            return False
+    except FileNotFoundError:
+        # xed 命令不存在
+        return False
+    except Exception as e:
+        print(f"Xcode 打开失败: {e}")
+        return False
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git 工具
+通过本地 git 命令获取相对某个 ref 的变更文件列表
+"""
+
+import os
+import subprocess
+from typing import List, Optional, Set
+
+
+def run_git(project_path: str, args: List[str], timeout: int = 30) -> Optional[str]:
+    """在项目目录下执行 git 命令，失败返回 None"""
+    try:
+        result = subprocess.run(
+            ['git', '-C', project_path] + args,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            timeout=timeout
+        )
+        if result.returncode != 0:
+            print(f"git {' '.join(args)} 失败: {result.stderr.strip()}")
+            return None
+        return result.stdout
+    except FileNotFoundError:
+        print("未找到 git 命令")
+        return None
+    except Exception as e:
+        print(f"执行 git 命令出错: {e}")
+        return None
+
+
+def _split_paths(project_path: str, output: str) -> List[str]:
+    """解析 -z 输出的相对路径列表，转为绝对路径"""
+    return [os.path.join(project_path, p) for p in output.split('\0') if p]
+
+
+def is_git_repo(project_path: str) -> bool:
+    """判断路径是否在 git 仓库中"""
+    output = run_git(project_path, ['rev-parse', '--is-inside-work-tree'])
+    return output is not None and output.strip() == 'true'
+
+
+def get_changed_files(project_path: str, ref: str) -> Optional[Set[str]]:
+    """获取相对 ref 有变化的文件（含未提交修改和未跟踪的新文件）
+
+    Returns:
+        绝对路径集合；不是 git 仓库或 ref 无效时返回 None
+    """
+    # 工作区 vs ref（包含已暂存和未暂存的修改），路径相对于 project_path
+    diff_output = run_git(project_path, ['diff', '--name-only', '--relative', '-z', ref, '--'])
+    if diff_output is None:
+        return None
+
+    # 未跟踪的新文件
+    untracked_output = run_git(project_path, ['ls-files', '--others', '--exclude-standard', '-z'])
+    if untracked_output is None:
+        return None
+
+    changed = set(_split_paths(project_path, diff_output))
+    changed.update(_split_paths(project_path, untracked_output))
+    return changed
+
+
+def list_files(project_path: str, extensions: tuple, ignore_folders: List[str] = None) -> Optional[List[str]]:
+    """用 git ls-files 列出项目中的文件（已跟踪 + 未跟踪未忽略），替代 os.walk
+
+    Returns:
+        绝对路径列表；不是 git 仓库时返回 None
+    """
+    output = run_git(project_path, ['ls-files', '--cached', '--others', '--exclude-standard', '-z'])
+    if output is None:
+        return None
+
+    ignore = set(ignore_folders or [])
+    files = []
+    for rel_path in output.split('\0'):
+        if not rel_path or not rel_path.endswith(extensions):
+            continue
+        # 排除忽略的目录（与 os.walk 的目录过滤保持一致）
+        if ignore and any(part in ignore for part in rel_path.split('/')[:-1]):
+            continue
+        files.append(os.path.join(project_path, rel_path))
+    return files
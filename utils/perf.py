@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能计时
+轻量的计时 span（walk / read / parse / compute / emit / render），带字节数、条目数等计数，
+可导出为 Chrome Trace / Perfetto 可打开的 JSON，也可按名称汇总。
+调试时可开启 tracemalloc 内存分析：每个 span 结束（即阶段边界）拍一次快照，记录当前/峰值内存和主要分配位置
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# 最多保留的 span 数量，超出后丢弃最早的
+MAX_SPANS = 20000
+
+# 最多保留的内存快照记录数
+MAX_MEMORY_RECORDS = 1000
+
+# 环境变量 L10N_TRACEMALLOC=1 时启动即开启内存分析
+MEMORY_PROFILE_ENV = 'L10N_TRACEMALLOC'
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PerfRecorder:
+    """进程内的 span 记录器（线程安全，开销为两次计时 + 一次 deque 追加）"""
+
+    _lock = threading.Lock()
+    _spans = deque(maxlen=MAX_SPANS)  # [(name, category, start_ns, duration_ns, thread_id, counters)]
+    _origin_ns = time.perf_counter_ns()
+    enabled = True
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, category: str = '', **counters) -> Iterator[dict]:
+        """记录一段耗时，yield 出的 dict 可在 span 内继续累加计数
+
+        with PerfRecorder.span('parse', 'LocalizationParser', file=name) as counters:
+            ...
+            counters['entries'] = len(result)
+        """
+        if not cls.enabled:
+            yield counters
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield counters
+        finally:
+            duration = time.perf_counter_ns() - start
+            with cls._lock:
+                cls._spans.append((name, category, start, duration, threading.get_ident(), counters))
+            if MemoryProfiler.active:
+                MemoryProfiler.record(name, category, start + duration)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._spans.clear()
+
+    @classmethod
+    def snapshot(cls) -> list:
+        with cls._lock:
+            return list(cls._spans)
+
+    @classmethod
+    def summarize(cls) -> 'OrderedDict[str, dict]':
+        """按 span 名称汇总：{name: {'count', 'total_ms', 'max_ms', 'counters'}}，按总耗时倒序"""
+        summary: Dict[str, dict] = {}
+        for name, category, _, duration, _, counters in cls.snapshot():
+            label = f"{category}.{name}" if category else name
+            item = summary.get(label)
+            if item is None:
+                item = summary[label] = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'counters': {}}
+            duration_ms = duration / 1e6
+            item['count'] += 1
+            item['total_ms'] += duration_ms
+            item['max_ms'] = max(item['max_ms'], duration_ms)
+            for key, value in counters.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    item['counters'][key] = item['counters'].get(key, 0) + value
+
+        return OrderedDict(sorted(summary.items(), key=lambda x: x[1]['total_ms'], reverse=True))
+
+    @classmethod
+    def export_chrome_trace(cls, file_path: str) -> int:
+        """导出 Chrome Trace Event 格式（chrome://tracing、ui.perfetto.dev 可直接打开），返回 span 数量"""
+        pid = os.getpid()
+        events = []
+        # 池线程不在 threading.enumerate() 中，且会被不同 worker 复用，按出现顺序命名（worker 类名在 cat 中）
+        thread_names = {threading.main_thread().ident: 'UI'}
+        for name, category, start, duration, thread_id, counters in cls.snapshot():
+            if thread_id not in thread_names:
+                thread_names[thread_id] = f'worker-{len(thread_names)}'
+            events.append({
+                'name': name,
+                'cat': category or 'app',
+                'ph': 'X',
+                'ts': (start - cls._origin_ns) / 1000,  # 微秒
+                'dur': duration / 1000,
+                'pid': pid,
+                'tid': thread_id,
+                'args': {key: value for key, value in counters.items() if isinstance(value, (int, float, str))},
+            })
+
+        span_count = len(events)
+        for record in MemoryProfiler.records():
+            events.append({
+                'name': 'memory',
+                'ph': 'C',
+                'ts': (record['ts'] - cls._origin_ns) / 1000,
+                'pid': pid,
+                'args': {'current_mb': record['current'] / (1024 * 1024), 'peak_mb': record['peak'] / (1024 * 1024)},
+            })
+
+        for thread_id, thread_name in thread_names.items():
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': thread_id,
+                'args': {'name': thread_name},
+            })
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return span_count
+
+
+class MemoryProfiler:
+    """tracemalloc 内存分析（调试用，开启后明显变慢）
+
+    每次 span 结束时记录：当前内存、距上一次记录以来的峰值，以及与上一次快照相比增长最多的分配位置
+    """
+
+    TOP_ALLOCATORS = 10
+
+    _lock = threading.Lock()
+    _records = deque(maxlen=MAX_MEMORY_RECORDS)
+    _previous = None  # 上一次快照
+    active = False
+
+    # 不统计 tracemalloc 自身和导入机制的分配
+    SNAPSHOT_FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    )
+
+    @classmethod
+    def start(cls, frames: int = 1):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        with cls._lock:
+            cls._previous = None
+        cls.active = True
+
+    @classmethod
+    def stop(cls):
+        cls.active = False
+        with cls._lock:
+            cls._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._records.clear()
+            cls._previous = None
+
+    @classmethod
+    def records(cls) -> list:
+        with cls._lock:
+            return list(cls._records)
+
+    @staticmethod
+    def _location(frame) -> str:
+        filename = frame.filename
+        if filename.startswith(PROJECT_ROOT):
+            filename = os.path.relpath(filename, PROJECT_ROOT)
+        return f"{filename}:{frame.lineno}"
+
+    @classmethod
+    def record(cls, phase: str, operation: str = '', timestamp_ns: Optional[int] = None):
+        """在阶段边界记录一次内存快照"""
+        if not tracemalloc.is_tracing():
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+；更早的版本峰值为进程内累计峰值
+            tracemalloc.reset_peak()  # 下一条记录的峰值只统计这之后的分配
+        snapshot = tracemalloc.take_snapshot().filter_traces(cls.SNAPSHOT_FILTERS)
+
+        with cls._lock:
+            previous, cls._previous = cls._previous, snapshot
+
+        if previous is None:
+            top = [(cls._location(stat.traceback[0]), stat.size, stat.count)
+                   for stat in snapshot.statistics('lineno')[:cls.TOP_ALLOCATORS]]
+        else:
+            top = [(cls._location(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                   for stat in snapshot.compare_to(previous, 'lineno')[:cls.TOP_ALLOCATORS]]
+
+        with cls._lock:
+            cls._records.append({
+                'operation': operation or 'app',
+                'phase': phase,
+                'ts': timestamp_ns if timestamp_ns is not None else time.perf_counter_ns(),
+                'current': current,
+                'peak': peak,
+                'top': top,  # [(file:line, 增长字节数, 增长分配次数)]
+            })
+
+    @classmethod
+    def summarize(cls) -> 'OrderedDict[str, dict]':
+        """按操作（worker / 视图）汇总：{operation: {'peak', 'current', 'snapshots', 'peak_phase'}}，按峰值倒序"""
+        summary: Dict[str, dict] = {}
+        for record in cls.records():
+            item = summary.get(record['operation'])
+            if item is None:
+                item = summary[record['operation']] = {'peak': 0, 'current': 0, 'snapshots': 0, 'peak_phase': ''}
+            item['snapshots'] += 1
+            item['current'] = record['current']
+            if record['peak'] >= item['peak']:
+                item['peak'] = record['peak']
+                item['peak_phase'] = record['phase']
+        return OrderedDict(sorted(summary.items(), key=lambda x: x[1]['peak'], reverse=True))
+
+    @classmethod
+    def export_report(cls, file_path: str) -> int:
+        """导出 JSON 报告（汇总 + 每次快照的主要分配位置），便于长期对比各功能的内存，返回记录数"""
+        records = cls.records()
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'summary': cls.summarize(),
+                'records': records,
+            }, f, indent=2, ensure_ascii=False)
+        return len(records)
+
+
+if os.environ.get(MEMORY_PROFILE_ENV) == '1':
+    MemoryProfiler.start()
+
+
+def span(name: str, category: str = '', **counters):
+    """PerfRecorder.span 的简写"""
+    return PerfRecorder.span(name, category, **counters)
+
+
+def format_counters(counters: Optional[dict]) -> str:
+    """计数显示为 "bytes=1.2 MB  entries=300" """
+    if not counters:
+        return ""
+    parts = []
+    for key, value in counters.items():
+        if key == 'bytes':
+            parts.append(f"bytes={value / (1024 * 1024):.1f} MB")
+        else:
+            parts.append(f"{key}={value}")
+    return "  ".join(parts)
@@ -6,12 +6,14 @@
 """
 
 import sys
+from functools import lru_cache
 from PyQt6.QtCore import QSettings
 from PyQt6.QtGui import QPalette, QColor
 
 
+@lru_cache(maxsize=None)
 def is_dark_mode() -> bool:
-    """检测系统是否处于暗黑模式"""
+    """检测系统是否处于暗黑模式（macOS 上要启动 defaults 子进程，结果缓存，只检测一次）"""
     if sys.platform == 'darwin':  # macOS
         try:
             import subprocess
@@ -1,8 +1,21 @@
 # Views module
+# Tab 模块按需导入（见 MainWindow.ensure_tab），这里也只在第一次访问时导入
 from .main_window import MainWindow
-from .replace_tab import ReplaceTab
-from .compare_tab import CompareTab
-from .length_compare_tab import LengthCompareTab
 
-__all__ = ['MainWindow', 'ReplaceTab', 'CompareTab', 'LengthCompareTab']
+_LAZY_EXPORTS = {
+    'ReplaceTab': '.replace_tab',
+    'CompareTab': '.compare_tab',
+    'LengthCompareTab': '.length_compare_tab',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+__all__ = ['MainWindow', 'ReplaceTab', 'CompareTab', 'LengthCompareTab']
@@ -7,13 +7,15 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QComboBox, QPushButton, QGroupBox, QTextEdit,
+    QComboBox, QPushButton, QGroupBox, QCheckBox,
     QTableWidget, QTableWidgetItem, QSplitter,
     QHeaderView
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QBrush, QFont
+from models.serializers import PACKAGE_SERIALIZERS
 from utils.theme import get_theme_colors
+from views.log_view import LogView
 
 
 class CompareTab(QWidget):
@@ -22,6 +24,10 @@ class CompareTab(QWidget):
     def __init__(self):
         super().__init__()
         self.colors = get_theme_colors()
+        self.missing_keys = {}      # 最近一次对比的结果 {lang_code: [key, ...]}
+        self.base_lang = None       # 最近一次对比使用的基准语言
+        self.fill_candidates = {}   # 翻译记忆给出的候选 {lang_code: [candidate, ...]}
+        self.shown_candidates = []  # 候选表格中显示的 [(lang_code, candidate)]
         self.init_ui()
     
     def init_ui(self):
@@ -100,15 +106,45 @@ class CompareTab(QWidget):
         self.compare_btn.setEnabled(False)
         buttons_layout.addWidget(self.compare_btn)
         
+        # 翻译记忆：缺失 key 的基准文案已在别的 key 下翻译过时直接复用
+        self.fill_btn = QPushButton("🧠 从翻译记忆补全")
+        self.fill_btn.setMinimumHeight(40)
+        self.fill_btn.setEnabled(False)
+        self.fill_btn.setToolTip("用基准文案相同（忽略大小写、标点）的已有翻译为缺失的 key 生成候选译文")
+        buttons_layout.addWidget(self.fill_btn)
+        
+        self.write_fill_btn = QPushButton("✍️ 写入候选译文")
+        self.write_fill_btn.setMinimumHeight(40)
+        self.write_fill_btn.setEnabled(False)
+        buttons_layout.addWidget(self.write_fill_btn)
+        
         left_layout.addLayout(buttons_layout)
         
+        # 待翻译包：直接用对比结果导出各语言缺失的 key（附带基准语言的值）
+        package_group = QGroupBox("待翻译包")
+        package_layout = QVBoxLayout()
+        package_layout.setSpacing(8)
+        
+        self.package_format_combo = QComboBox()
+        self.package_format_combo.setMinimumHeight(28)
+        for format_id, serializer in PACKAGE_SERIALIZERS.items():
+            self.package_format_combo.addItem(f"{serializer.display_name}（zip）", format_id)
+        package_layout.addWidget(self.package_format_combo)
+        
+        self.export_missing_btn = QPushButton("📦 导出缺失的 key")
+        self.export_missing_btn.setMinimumHeight(36)
+        self.export_missing_btn.setEnabled(False)
+        package_layout.addWidget(self.export_missing_btn)
+        
+        package_group.setLayout(package_layout)
+        left_layout.addWidget(package_group)
+        
         # 对比日志
         log_group = QGroupBox("对比日志")
         log_layout = QVBoxLayout()
         log_layout.setContentsMargins(8, 8, 8, 8)
         
-        self.compare_log_text = QTextEdit()
-        self.compare_log_text.setReadOnly(True)
+        self.compare_log_text = LogView()
         self.compare_log_text.setPlaceholderText("点击上方按钮开始对比...")
         self.compare_log_text.setStyleSheet("font-size: 11px;")
         log_layout.addWidget(self.compare_log_text)
@@ -191,7 +227,45 @@ class CompareTab(QWidget):
         self.result_container_layout.addWidget(self.empty_widget)
         self.result_table.setVisible(False)
         
-        right_layout.addWidget(self.result_container)
+        right_layout.addWidget(self.result_container, 1)
+        
+        # 翻译记忆候选（补全后显示）
+        self.fill_group = QGroupBox("翻译记忆候选")
+        fill_layout = QVBoxLayout()
+        fill_layout.setSpacing(8)
+        
+        fill_header = QHBoxLayout()
+        self.fill_stats_label = QLabel("")
+        self.fill_stats_label.setStyleSheet(f"font-size: 12px; color: {self.colors['text_secondary']};")
+        fill_header.addWidget(self.fill_stats_label)
+        fill_header.addStretch()
+        
+        # 只写入基准文案完全相同的（在内存中过滤，不重新补全）
+        self.exact_only_checkbox = QCheckBox("只用基准文案完全相同的译文")
+        self.exact_only_checkbox.setChecked(True)
+        self.exact_only_checkbox.toggled.connect(self.apply_fill_filter)
+        fill_header.addWidget(self.exact_only_checkbox)
+        fill_layout.addLayout(fill_header)
+        
+        self.fill_table = QTableWidget()
+        self.fill_table.setColumnCount(5)
+        self.fill_table.setHorizontalHeaderLabels(["语言", "Key", "基准文案", "候选译文", "来源 Key"])
+        self.fill_table.setAlternatingRowColors(True)
+        self.fill_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.fill_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        fill_header_view = self.fill_table.horizontalHeader()
+        fill_header_view.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        fill_header_view.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        fill_header_view.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        fill_header_view.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        fill_header_view.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        self.fill_table.setColumnWidth(1, 180)
+        self.fill_table.setColumnWidth(4, 180)
+        fill_layout.addWidget(self.fill_table)
+        
+        self.fill_group.setLayout(fill_layout)
+        self.fill_group.setVisible(False)
+        right_layout.addWidget(self.fill_group, 1)
         
         # 添加到分割器
         splitter.addWidget(left_widget)
@@ -212,12 +286,19 @@ class CompareTab(QWidget):
             index = languages.index('en')
             self.base_lang_combo.setCurrentIndex(index)
     
-    def update_results(self, missing_keys: dict):
+    def update_results(self, missing_keys: dict, base_lang: str = None):
         """更新对比结果显示
         
         Args:
             missing_keys: {lang_code: [key1, key2, ...]}
+            base_lang: 对比使用的基准语言（从翻译记忆补全时使用）
         """
+        self.missing_keys = missing_keys
+        self.base_lang = base_lang
+        self.fill_btn.setEnabled(bool(missing_keys))
+        self.export_missing_btn.setEnabled(bool(missing_keys))
+        self.update_fill_candidates({})
+        
         if not missing_keys:
             # 无缺失项
             self.result_table.setVisible(False)
@@ -275,4 +356,64 @@ class CompareTab(QWidget):
         # 设置行高
         for i in range(len(missing_keys)):
             self.result_table.setRowHeight(i, 40)
-
+    
+    def update_fill_candidates(self, candidates: dict):
+        """更新翻译记忆给出的候选译文
+        
+        Args:
+            candidates: TranslationMemory.fill 的结果 {lang_code: [candidate, ...]}
+        """
+        self.fill_candidates = candidates
+        self.fill_group.setVisible(bool(candidates))
+        self.apply_fill_filter()
+    
+    def apply_fill_filter(self):
+        """按「只用基准文案完全相同的译文」过滤并填充候选表格"""
+        exact_only = self.exact_only_checkbox.isChecked()
+        self.shown_candidates = [
+            (lang_code, item)
+            for lang_code, items in sorted(self.fill_candidates.items())
+            for item in items
+            if item['exact'] or not exact_only
+        ]
+        self.write_fill_btn.setEnabled(bool(self.shown_candidates))
+        
+        total = sum(len(items) for items in self.fill_candidates.values())
+        self.fill_stats_label.setText(f"共 {total} 个候选，将写入 {len(self.shown_candidates)} 个")
+        
+        self.fill_table.setRowCount(0)
+        self.fill_table.setRowCount(len(self.shown_candidates))
+        secondary = QBrush(QColor(self.colors['text_secondary']))
+        for row, (lang_code, item) in enumerate(self.shown_candidates):
+            self.fill_table.setItem(row, 0, QTableWidgetItem(lang_code))
+            
+            key_item = QTableWidgetItem(item['key'])
+            key_item.setToolTip(item['key'])
+            self.fill_table.setItem(row, 1, key_item)
+            
+            base_item = QTableWidgetItem(item['base_value'])
+            base_item.setToolTip(item['base_value'])
+            self.fill_table.setItem(row, 2, base_item)
+            
+            value_item = QTableWidgetItem(item['value'])
+            value_item.setToolTip(item['value'])
+            if not item['exact']:
+                # 基准文案仅大小写 / 标点不同，译文可能需要调整
+                value_item.setForeground(QBrush(QColor(self.colors['warning'])))
+                value_item.setToolTip(f"{item['value']}\n来源的基准文案与该 key 仅大小写 / 标点不同，请确认")
+            self.fill_table.setItem(row, 3, value_item)
+            
+            source_item = QTableWidgetItem(item['source_key'])
+            source_item.setForeground(secondary)
+            self.fill_table.setItem(row, 4, source_item)
+    
+    def get_package_format(self) -> str:
+        """待翻译包的格式 ID（见 PACKAGE_SERIALIZERS）"""
+        return self.package_format_combo.currentData()
+    
+    def selected_translations(self) -> dict:
+        """当前过滤条件下要写入的译文 {lang_code: {key: value}}"""
+        translations = {}
+        for lang_code, item in self.shown_candidates:
+            translations.setdefault(lang_code, {})[item['key']] = item['value']
+        return translations
@@ -8,7 +8,7 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QGroupBox, QTextEdit,
+    QLineEdit, QPushButton, QGroupBox,
     QTabWidget, QTableWidget, QTableWidgetItem, QSplitter,
     QHeaderView
 )
@@ -16,6 +16,9 @@ from PyQt6.QtCore import Qt
 
 from utils.constants import DELETE_BUTTON_STYLE, LARGE_BUTTON_STYLE
 from utils.toast import Toast
+from utils.editor import open_in_editor
+from views.key_usage_panel import KeyUsagePanel
+from views.log_view import LogView
 
 
 class DeduplicateTab(QWidget):
@@ -90,8 +93,7 @@ class DeduplicateTab(QWidget):
         log_layout = QVBoxLayout()
         log_layout.setContentsMargins(8, 8, 8, 8)
         
-        self.scan_log_text = QTextEdit()
-        self.scan_log_text.setReadOnly(True)
+        self.scan_log_text = LogView()
         self.scan_log_text.setPlaceholderText("点击上方按钮开始扫描...")
         self.scan_log_text.setStyleSheet("font-size: 11px;")
         log_layout.addWidget(self.scan_log_text)
@@ -147,6 +149,10 @@ class DeduplicateTab(QWidget):
         
         self.result_tabs.addTab(empty_widget, "等待扫描")
         
+        # 引用位置面板（查询共享的 Key 引用索引）
+        self.usage_panel = KeyUsagePanel()
+        right_layout.addWidget(self.usage_panel)
+        
         # 添加到分割器
         splitter.addWidget(left_widget)
         splitter.addWidget(right_widget)
@@ -340,8 +346,19 @@ class DeduplicateTab(QWidget):
         table.cellEntered.connect(lambda row, col: self.on_cell_entered(table, row, col))
         table.setMouseTracking(True)  # 启用鼠标追踪
         
+        # 连接选中改变事件 - 显示 key 的引用位置
+        table.currentCellChanged.connect(
+            lambda row, col, prev_row, prev_col: self.on_current_cell_changed(table, row)
+        )
+        
         return table
     
+    def on_current_cell_changed(self, table: QTableWidget, row: int):
+        """选中行改变时，在引用面板中显示该 key 的代码引用"""
+        item = table.item(row, 0)
+        if item:
+            self.usage_panel.show_key(item.text())
+    
     def on_cell_entered(self, table: QTableWidget, row: int, col: int):
         """处理鼠标进入单元格事件 - 改变光标样式"""
         from PyQt6.QtGui import QCursor
@@ -421,77 +438,5 @@ class DeduplicateTab(QWidget):
         QTimer.singleShot(200, lambda: item.setBackground(original_bg))
     
     def open_in_editor(self, file_path: str, line_num: int):
-        """在外部编辑器中打开文件并跳转到指定行
-        
-        优先在已打开的 Xcode 中打开文件
-        """
-        import subprocess
-        import shutil
-        
-        try:
-            # 优先尝试在已打开的 Xcode 中打开
-            if self.open_in_xcode(file_path, line_num):
-                return
-            
-            # 如果 Xcode 方式失败，尝试其他编辑器
-            editors = [
-                # VSCode
-                ('code', lambda: subprocess.run(['code', '-g', f'{file_path}:{line_num}'], check=False)),
-                # Sublime Text
-                ('subl', lambda: subprocess.run(['subl', f'{file_path}:{line_num}'], check=False)),
-                # Atom
-                ('atom', lambda: subprocess.run(['atom', f'{file_path}:{line_num}'], check=False)),
-            ]
-            
-            # 查找可用的编辑器
-            for cmd, open_func in editors:
-                if shutil.which(cmd):
-                    open_func()
-                    return
-            
-            # 如果没有找到专用编辑器，尝试用系统默认方式打开
-            # macOS
-            subprocess.run(['open', file_path], check=False)
-            
-        except Exception as e:
-            print(f"打开编辑器失败: {e}")
-    
-    def open_in_xcode(self, file_path: str, line_num: int) -> bool:
-        """在 Xcode 中打开文件并跳转到指定行
-        
-        优先使用 xed 命令（简单直接）
-        
-        Returns:
-            bool: 成功返回 True，失败返回 False
-        """
-        import subprocess
-        
-        try:
-            # 方法1: 使用 xed 命令（Xcode 自带）
-            # -l 参数指定行号
-            result = subprocess.run(
-                ['xed', '--line', str(line_num), file_path],
-                capture_output=True,
-                timeout=3
-            )
-            
-            if result.returncode == 0:
-                return True
-            
-            # 方法2: 如果上面失败，尝试不带行号参数
-            subprocess.run(['xed', file_path], check=False)
-            return True
-                
-        except subprocess.TimeoutExpired:
-            # 超时，尝试不等待
-            try:
-                subprocess.Popen(['xed', '--line', str(line_num), file_path])
-                return True
-            except:
-                return False
-        except FileNotFoundError:
-            # xed 命令不存在
-            return False
-        except Exception as e:
-            print(f"Xcode 打开失败: {e}")
-            return False
+        """在外部编辑器中打开文件并跳转到指定行（优先 Xcode）"""
+        open_in_editor(file_path, line_num)
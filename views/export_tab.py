@@ -6,9 +6,13 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QGroupBox, QCheckBox, QPushButton, QTextEdit
+    QGroupBox, QCheckBox, QPushButton, QTextEdit,
+    QListWidget, QListWidgetItem
 )
+from PyQt6.QtCore import Qt
+from models.serializers import available_formats
 from utils.theme import get_theme_colors
+from views.log_view import LogView
 
 
 class ExportTab(QWidget):
@@ -25,7 +29,7 @@ class ExportTab(QWidget):
         layout.setSpacing(16)
         
         # 说明文字 - 简化为一句话
-        desc_label = QLabel("导出指定的多语言 key，支持导出为 .strings 或 .xml 格式")
+        desc_label = QLabel("导出指定的多语言 key，支持 .strings / .xml / .xliff / .json / .csv 格式")
         desc_label.setStyleSheet(
             f"color: {self.colors['text_secondary']}; font-size: 12px; padding: 4px 0;"
         )
@@ -83,13 +87,16 @@ class ExportTab(QWidget):
         checkbox_layout = QHBoxLayout()
         checkbox_layout.setSpacing(24)
         
-        self.strings_checkbox = QCheckBox("导出为 .strings")
-        self.strings_checkbox.setChecked(True)
-        checkbox_layout.addWidget(self.strings_checkbox)
+        # 按注册的序列化器生成复选框 {format_id: QCheckBox}
+        self.format_checkboxes = {}
+        for serializer in available_formats():
+            checkbox = QCheckBox(f"导出为 {serializer.display_name}")
+            checkbox.setChecked(serializer.format_id in ('strings', 'xml'))
+            checkbox_layout.addWidget(checkbox)
+            self.format_checkboxes[serializer.format_id] = checkbox
         
-        self.xml_checkbox = QCheckBox("导出为 .xml")
-        self.xml_checkbox.setChecked(True)
-        checkbox_layout.addWidget(self.xml_checkbox)
+        self.strings_checkbox = self.format_checkboxes['strings']
+        self.xml_checkbox = self.format_checkboxes['xml']
         
         checkbox_layout.addStretch()
         format_layout.addLayout(checkbox_layout)
@@ -97,6 +104,24 @@ class ExportTab(QWidget):
         format_group.setLayout(format_layout)
         layout.addWidget(format_group)
         
+        # 导出语言选择（不勾选任何语言时导出全部）
+        lang_group = QGroupBox("导出语言")
+        lang_layout = QVBoxLayout()
+        lang_layout.setSpacing(8)
+        
+        lang_hint = QLabel("勾选要导出的语言，不勾选则导出全部：")
+        lang_hint.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        lang_layout.addWidget(lang_hint)
+        
+        self.lang_list = QListWidget()
+        self.lang_list.setFlow(QListWidget.Flow.LeftToRight)
+        self.lang_list.setWrapping(True)
+        self.lang_list.setMaximumHeight(90)
+        lang_layout.addWidget(self.lang_list)
+        
+        lang_group.setLayout(lang_layout)
+        layout.addWidget(lang_group)
+        
         # 导出按钮 - 更大更突出
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -107,6 +132,13 @@ class ExportTab(QWidget):
         self.export_btn.setEnabled(False)
         button_layout.addWidget(self.export_btn)
         
+        # 全量对照表（key × 语言），可编辑后从导入页导回
+        self.export_sheet_btn = QPushButton("📊 导出对照表")
+        self.export_sheet_btn.setMinimumHeight(40)
+        self.export_sheet_btn.setEnabled(False)
+        self.export_sheet_btn.setToolTip("导出所有 key × 所有语言的 Excel 表格，编辑后可在导入页导回")
+        button_layout.addWidget(self.export_sheet_btn)
+        
         button_layout.addStretch()
         layout.addLayout(button_layout)
         
@@ -115,11 +147,10 @@ class ExportTab(QWidget):
         log_layout = QVBoxLayout()
         log_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.export_log_text = QTextEdit()
-        self.export_log_text.setReadOnly(True)
+        self.export_log_text = LogView()
         self.export_log_text.setMinimumHeight(250)
         self.export_log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: 'SF Mono', Menlo, Monaco, 'Courier New', monospace;
                 font-size: 11px;
                 padding: 8px;
@@ -138,4 +169,26 @@ class ExportTab(QWidget):
         # 按行分割，去除空行和空白
         keys = [line.strip() for line in text.split('\n') if line.strip()]
         return keys
-
+    
+    def get_selected_formats(self) -> list:
+        """获取选中的导出格式 ID 列表"""
+        return [format_id for format_id, checkbox in self.format_checkboxes.items() if checkbox.isChecked()]
+    
+    def update_languages(self, languages: list):
+        """更新可选语言列表（保留已勾选状态）"""
+        checked = set(self.get_selected_languages())
+        self.lang_list.clear()
+        for lang in sorted(languages):
+            item = QListWidgetItem(lang)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if lang in checked else Qt.CheckState.Unchecked)
+            self.lang_list.addItem(item)
+    
+    def get_selected_languages(self) -> list:
+        """获取勾选的语言列表（为空表示全部）"""
+        languages = []
+        for i in range(self.lang_list.count()):
+            item = self.lang_list.item(i)
+            if item.checkState() == Qt.CheckState.Checked:
+                languages.append(item.text())
+        return languages
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+格式符检查标签页
+对比各语言同一个 key 的格式符，找出与基准语言不一致、运行时可能崩溃的翻译
+"""
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QComboBox, QPushButton, QGroupBox, QCheckBox,
+    QTableWidget, QTableWidgetItem, QSplitter,
+    QHeaderView, QApplication
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QBrush, QFont
+from models.format_specifier import signature_text
+from utils.theme import get_theme_colors
+from views.log_view import LogView
+
+
+class FormatCheckTab(QWidget):
+    """格式符检查标签页"""
+
+    def __init__(self):
+        super().__init__()
+        self.colors = get_theme_colors()
+        self.mismatches = []  # 全部检查结果
+        self.shown = []       # 当前表格中显示的结果
+        self.init_ui()
+
+    def init_ui(self):
+        # 主布局 - 水平分割
+        main_layout = QHBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(16)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # ============ 左侧：配置区域 ============
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setSpacing(16)
+
+        desc_label = QLabel(
+            "检查各语言中同一个 key 的格式符（%@、%d、%1$@、%lld 等）是否与基准语言一致。"
+            "多出参数或类型不同会在运行时读取错误的参数，可能导致崩溃。"
+        )
+        desc_label.setStyleSheet(
+            f"color: {self.colors['text_secondary']}; font-size: 12px; padding: 8px 0;"
+        )
+        desc_label.setWordWrap(True)
+        left_layout.addWidget(desc_label)
+
+        # 基准语言选择
+        base_lang_group = QGroupBox("基准语言")
+        base_lang_layout = QVBoxLayout()
+        base_lang_layout.setSpacing(8)
+
+        base_lang_hint = QLabel("以该语言的格式符为准（基准语言没有的 key 以多数语言为准）：")
+        base_lang_hint.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        base_lang_hint.setWordWrap(True)
+        base_lang_layout.addWidget(base_lang_hint)
+
+        self.base_lang_combo = QComboBox()
+        self.base_lang_combo.setMinimumHeight(28)
+        self.base_lang_combo.setStyleSheet(f"""
+            QComboBox {{
+                padding: 8px 12px;
+                border: 2px solid {self.colors['border']};
+                border-radius: 8px;
+                background: {self.colors['bg_card']};
+                color: {self.colors['text_primary']};
+                font-size: 13px;
+            }}
+            QComboBox:hover {{
+                border: 2px solid {self.colors['border_focus']};
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                width: 30px;
+            }}
+            QComboBox QAbstractItemView {{
+                border: 2px solid {self.colors['border']};
+                border-radius: 8px;
+                background: {self.colors['bg_card']};
+                color: {self.colors['text_primary']};
+                selection-background-color: {self.colors['button_bg']};
+                selection-color: white;
+            }}
+        """)
+        base_lang_layout.addWidget(self.base_lang_combo)
+
+        base_lang_group.setLayout(base_lang_layout)
+        left_layout.addWidget(base_lang_group)
+
+        # 检查按钮
+        self.check_btn = QPushButton("🧩 开始检查")
+        self.check_btn.setMinimumHeight(40)
+        self.check_btn.setEnabled(False)
+        left_layout.addWidget(self.check_btn)
+
+        # 检查日志
+        log_group = QGroupBox("检查日志")
+        log_layout = QVBoxLayout()
+        log_layout.setContentsMargins(8, 8, 8, 8)
+
+        self.check_log_text = LogView()
+        self.check_log_text.setPlaceholderText("点击上方按钮开始检查...")
+        self.check_log_text.setStyleSheet("font-size: 11px;")
+        log_layout.addWidget(self.check_log_text)
+
+        log_group.setLayout(log_layout)
+        left_layout.addWidget(log_group, 1)
+
+        # ============ 右侧：检查结果区域 ============
+        right_widget = QWidget()
+        right_layout = QVBoxLayout(right_widget)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout.setSpacing(8)
+
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(12)
+
+        result_label = QLabel("检查结果")
+        result_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {self.colors['text_primary']};")
+        header_layout.addWidget(result_label)
+
+        self.stats_label = QLabel("尚未检查")
+        self.stats_label.setStyleSheet(
+            f"font-size: 12px; color: {self.colors['text_secondary']}; padding: 6px 12px; "
+            f"background: {self.colors['bg_secondary']}; border-radius: 4px;"
+        )
+        header_layout.addWidget(self.stats_label)
+        header_layout.addStretch()
+
+        # 只看可能崩溃的（在内存中过滤，不重新检查）
+        self.errors_only_checkbox = QCheckBox("只看可能崩溃的")
+        self.errors_only_checkbox.toggled.connect(self.apply_filter)
+        header_layout.addWidget(self.errors_only_checkbox)
+
+        right_layout.addLayout(header_layout)
+
+        # 结果表格
+        self.result_table = QTableWidget()
+        self.result_table.setColumnCount(6)
+        self.result_table.setHorizontalHeaderLabels(["Key", "语言", "基准格式符", "译文格式符", "问题", "译文"])
+        self.result_table.setAlternatingRowColors(True)
+        self.result_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.result_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.result_table.setStyleSheet(f"""
+            QTableWidget {{
+                font-size: 12px;
+                gridline-color: {self.colors['table_grid']};
+            }}
+            QTableWidget::item {{
+                padding: 8px;
+                color: {self.colors['text_primary']};
+            }}
+            QTableWidget::item:selected {{
+                background: {self.colors['table_selected']};
+                color: white;
+            }}
+        """)
+        self.result_table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+
+        header = self.result_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        self.result_table.setColumnWidth(0, 200)
+        self.result_table.setColumnWidth(4, 200)
+
+        # 表格 / 提示信息容器
+        self.result_container = QWidget()
+        self.result_container_layout = QVBoxLayout(self.result_container)
+        self.result_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.result_container_layout.addWidget(self.result_table)
+
+        self.empty_widget = QWidget()
+        empty_layout = QVBoxLayout(self.empty_widget)
+        empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.empty_label = QLabel("🧩\n\n点击左侧「开始检查」按钮\n查看检查结果")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 14px; line-height: 24px;")
+        empty_layout.addWidget(self.empty_label)
+
+        self.result_container_layout.addWidget(self.empty_widget)
+        self.result_table.setVisible(False)
+
+        right_layout.addWidget(self.result_container)
+
+        splitter.addWidget(left_widget)
+        splitter.addWidget(right_widget)
+        splitter.setSizes([300, 700])
+
+        main_layout.addWidget(splitter)
+
+    def update_languages(self, languages: list):
+        """更新语言列表"""
+        self.base_lang_combo.clear()
+        self.base_lang_combo.addItems(languages)
+
+        # 默认选择 en（如果存在）
+        if 'en' in languages:
+            self.base_lang_combo.setCurrentIndex(languages.index('en'))
+
+    def get_base_lang(self) -> str:
+        """获取基准语言"""
+        return self.base_lang_combo.currentText()
+
+    def on_cell_double_clicked(self, row: int, col: int):
+        """双击复制单元格内容（译文列复制完整 value）"""
+        if not 0 <= row < len(self.shown):
+            return
+        item = self.shown[row]
+        text = item['value'] if col == 5 else self.result_table.item(row, col).text()
+        QApplication.clipboard().setText(text)
+
+    def update_results(self, mismatches: list):
+        """更新检查结果显示
+
+        Args:
+            mismatches: FormatSpecifierChecker.check 的结果
+        """
+        self.mismatches = mismatches
+
+        if not mismatches:
+            self.shown = []
+            self.result_table.setVisible(False)
+            self.empty_widget.setVisible(True)
+            self.empty_label.setText("✅\n\n所有语言的格式符都一致！")
+            self.empty_label.setStyleSheet(f"color: {self.colors['success']}; font-size: 16px; line-height: 28px;")
+            self.stats_label.setText("✅ 格式符全部一致")
+            self.stats_label.setStyleSheet(
+                f"font-size: 13px; color: {self.colors['success']}; padding: 10px; "
+                f"background: {self.colors['bg_secondary']}; border-radius: 6px; font-weight: 500;"
+            )
+            return
+
+        errors = sum(1 for item in mismatches if item['severity'] == 'error')
+        self.stats_label.setText(f"⚠️ {len(mismatches)} 处不一致 • {errors} 处可能崩溃")
+        self.stats_label.setStyleSheet(
+            f"font-size: 13px; color: {self.colors['warning']}; padding: 10px; "
+            f"background: {self.colors['bg_secondary']}; border-radius: 6px; font-weight: 500;"
+        )
+        self.empty_widget.setVisible(False)
+        self.result_table.setVisible(True)
+        self.apply_filter()
+
+    def apply_filter(self):
+        """按「只看可能崩溃的」过滤并填充表格"""
+        if self.errors_only_checkbox.isChecked():
+            self.shown = [item for item in self.mismatches if item['severity'] == 'error']
+        else:
+            self.shown = list(self.mismatches)
+
+        self.result_table.setRowCount(0)
+        self.result_table.setRowCount(len(self.shown))
+
+        bold = QFont()
+        bold.setBold(True)
+        for row, item in enumerate(self.shown):
+            color = self.colors['error'] if item['severity'] == 'error' else self.colors['warning']
+
+            key_item = QTableWidgetItem(item['key'])
+            key_item.setToolTip(item['key'])
+            self.result_table.setItem(row, 0, key_item)
+
+            lang_item = QTableWidgetItem(item['lang'])
+            lang_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.result_table.setItem(row, 1, lang_item)
+
+            base_item = QTableWidgetItem(f"{signature_text(item['base_signature'])}（{item['base_lang']}）")
+            base_item.setToolTip(item['base_value'])
+            base_item.setForeground(QBrush(QColor(self.colors['text_secondary'])))
+            self.result_table.setItem(row, 2, base_item)
+
+            signature_item = QTableWidgetItem(signature_text(item['signature']))
+            signature_item.setForeground(QBrush(QColor(color)))
+            signature_item.setFont(bold)
+            self.result_table.setItem(row, 3, signature_item)
+
+            problem_item = QTableWidgetItem(item['problem'])
+            problem_item.setToolTip(item['problem'])
+            problem_item.setForeground(QBrush(QColor(color)))
+            self.result_table.setItem(row, 4, problem_item)
+
+            value_preview = item['value']
+            if len(value_preview) > 80:
+                value_preview = value_preview[:80] + "..."
+            value_item = QTableWidgetItem(value_preview)
+            value_item.setToolTip(item['value'])
+            self.result_table.setItem(row, 5, value_item)
+
+        for i in range(len(self.shown)):
+            self.result_table.setRowHeight(i, 40)
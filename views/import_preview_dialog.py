@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入预演结果对话框
+使用 QTableView + 自定义 Model，只渲染可见行，几十万行的差异也能流畅滚动
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QComboBox, QPushButton, QTableView, QHeaderView
+)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+from utils.theme import get_theme_colors
+
+# 状态 → (显示文字, 颜色)
+STATUS_INFO = {
+    'new': ("新增", "#34C759"),
+    'changed': ("修改", "#FF9500"),
+    'unchanged': ("未变", "#8E8E93"),
+    'duplicates': ("将重复", "#FF3B30"),
+}
+
+# 单元格里只显示第一行的前 N 个字符，完整内容在 tooltip 中
+PREVIEW_TEXT_LENGTH = 120
+
+
+class ImportDiffTableModel(QAbstractTableModel):
+    """导入差异表格 Model（行数据只存元组，按需生成显示内容）"""
+
+    HEADERS = ["语言", "状态", "Key", "当前值", "导入值"]
+
+    def __init__(self, diff_results: dict, parent=None):
+        super().__init__(parent)
+        self.all_rows = []  # [(lang, status, key, old_value, new_value)]
+        for lang, diff in diff_results.items():
+            for key, value in diff['new']:
+                self.all_rows.append((lang, 'new', key, '', value))
+            for key, old_value, value in diff['changed']:
+                self.all_rows.append((lang, 'changed', key, old_value, value))
+            for key in diff['duplicates']:
+                self.all_rows.append((lang, 'duplicates', key, '', ''))
+            for key, value in diff['unchanged']:
+                self.all_rows.append((lang, 'unchanged', key, value, value))
+        self.rows = self.all_rows
+
+    def set_filter(self, lang: str = None, status: str = None):
+        """按语言 / 状态过滤（None 表示全部）"""
+        self.beginResetModel()
+        if lang is None and status is None:
+            self.rows = self.all_rows
+        else:
+            self.rows = [
+                row for row in self.all_rows
+                if (lang is None or row[0] == lang) and (status is None or row[1] == status)
+            ]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        lang, status, key, old_value, new_value = self.rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return lang
+            if column == 1:
+                return STATUS_INFO[status][0]
+            if column == 2:
+                return key
+            text = old_value if column == 3 else new_value
+            first_line = text.split('\n', 1)[0]
+            if len(first_line) > PREVIEW_TEXT_LENGTH or first_line != text:
+                return first_line[:PREVIEW_TEXT_LENGTH] + "..."
+            return text
+
+        if role == Qt.ItemDataRole.ToolTipRole and column >= 2:
+            return (key, old_value, new_value)[column - 2]
+
+        if role == Qt.ItemDataRole.ForegroundRole and column == 1:
+            return QColor(STATUS_INFO[status][1])
+
+        return None
+
+
+class ImportPreviewDialog(QDialog):
+    """导入预演结果，确认后再真正导入"""
+
+    def __init__(self, diff_results: dict, merge_mode: bool, parent=None):
+        super().__init__(parent)
+        self.diff_results = diff_results
+        self.merge_mode = merge_mode
+        self.colors = get_theme_colors()
+        self.model = ImportDiffTableModel(diff_results, self)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle("导入预览")
+        self.setMinimumSize(900, 600)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        mode_text = "合并模式" if self.merge_mode else "追加模式"
+        title_label = QLabel(f"导入预览（{mode_text}，尚未写入任何文件）")
+        title_label.setStyleSheet(f"font-size: 16px; font-weight: 600; color: {self.colors['text_primary']};")
+        layout.addWidget(title_label)
+
+        # 每个语言一行统计
+        summary_lines = []
+        for lang, diff in self.diff_results.items():
+            summary_lines.append(
+                f"{lang}:  新增 {len(diff['new'])}  ·  修改 {len(diff['changed'])}  ·  "
+                f"未变 {len(diff['unchanged'])}  ·  将重复 {len(diff['duplicates'])}"
+            )
+        summary_label = QLabel("\n".join(summary_lines))
+        summary_label.setStyleSheet(
+            f"color: {self.colors['text_secondary']}; font-size: 12px; padding: 8px; "
+            f"background: {self.colors['bg_secondary']}; border-radius: 6px;"
+        )
+        summary_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(summary_label)
+
+        # 过滤
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("语言:"))
+        self.lang_combo = QComboBox()
+        self.lang_combo.addItem("全部", None)
+        for lang in self.diff_results:
+            self.lang_combo.addItem(lang, lang)
+        self.lang_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.lang_combo)
+
+        filter_layout.addWidget(QLabel("状态:"))
+        self.status_combo = QComboBox()
+        self.status_combo.addItem("全部", None)
+        for status, (text, _) in STATUS_INFO.items():
+            self.status_combo.addItem(text, status)
+        self.status_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.status_combo)
+
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        filter_layout.addWidget(self.count_label)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        # 虚拟化表格
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setWordWrap(False)
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(24)
+        header = self.table_view.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        self.table_view.setColumnWidth(0, 110)
+        self.table_view.setColumnWidth(1, 60)
+        self.table_view.setColumnWidth(2, 220)
+        layout.addWidget(self.table_view, 1)
+
+        # 按钮
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        cancel_btn = QPushButton("取消")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+
+        confirm_btn = QPushButton("确认导入")
+        confirm_btn.setDefault(True)
+        confirm_btn.clicked.connect(self.accept)
+        button_layout.addWidget(confirm_btn)
+
+        layout.addLayout(button_layout)
+
+        self.update_count_label()
+
+    def apply_filter(self):
+        self.model.set_filter(self.lang_combo.currentData(), self.status_combo.currentData())
+        self.update_count_label()
+
+    def update_count_label(self):
+        self.count_label.setText(f"{self.model.rowCount()} 行")
@@ -9,10 +9,13 @@ from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QListWidget,
-    QListWidgetItem, QSizePolicy
+    QListWidgetItem, QSizePolicy, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 
+from models.zip_index import ZipIndex
+from workers.worker_pool import WorkerPool
+from workers.zip_index_worker import ZipIndexWorker
 from utils.constants import LARGE_BUTTON_STYLE
 from utils.config import ConfigManager
 from utils.theme import get_theme_colors
@@ -21,12 +24,35 @@ from utils.theme import get_theme_colors
 class ImportTab(QWidget):
     """导入多语言标签页"""
     
+    # 配置变化（ConfigManager 在修改配置的线程中通知，经信号转到 UI 线程）
+    config_changed = pyqtSignal(str, object)
+    
     def __init__(self):
         super().__init__()
         # 从配置中加载上次的文件夹路径
         self.current_folder = ConfigManager.get_last_import_folder()
         self.colors = get_theme_colors()
+        self.index_worker = None
+        self.zip_items = {}  # {path: QListWidgetItem}
         self.init_ui()
+        
+        # 导入文件夹在别处修改时同步显示
+        def listener(key, value):
+            self.config_changed.emit(key, value)
+        self.config_changed.connect(self.on_config_changed)
+        ConfigManager.subscribe(listener)
+        self.destroyed.connect(lambda: ConfigManager.unsubscribe(listener))
+    
+    def on_config_changed(self, key: str, value):
+        if key == 'last_import_folder' and value and value != self.current_folder:
+            self.set_folder(value)
+    
+    def set_folder(self, folder: str):
+        """切换导入文件夹：更新显示、保存到配置并重新加载文件列表"""
+        self.current_folder = folder
+        self.folder_input.setText(folder)
+        ConfigManager.save_last_import_folder(folder)
+        self.load_zip_files()
     
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -34,7 +60,7 @@ class ImportTab(QWidget):
         layout.setSpacing(20)
         
         # 说明文字 - 更简洁
-        desc_label = QLabel("选择 ZIP 文件，自动解压并导入到项目")
+        desc_label = QLabel("选择 ZIP 或 XLIFF 文件，自动解析并导入到项目")
         desc_label.setStyleSheet(
             f"color: {self.colors['text_secondary']}; font-size: 12px; padding: 4px 0;"
         )
@@ -151,7 +177,7 @@ class ImportTab(QWidget):
         list_header_layout = QHBoxLayout()
         list_header_layout.setSpacing(8)
         
-        list_title = QLabel("ZIP 文件列表")
+        list_title = QLabel("ZIP / XLIFF 文件列表")
         list_title.setStyleSheet(f"font-size: 13px; font-weight: 600; color: {self.colors['text_primary']};")
         list_header_layout.addWidget(list_title)
         
@@ -192,6 +218,8 @@ class ImportTab(QWidget):
             }}
         """)
         self.zip_list.setAlternatingRowColors(False)
+        # 支持 Cmd/Shift 多选，批量导入
+        self.zip_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         self.zip_list.itemSelectionChanged.connect(self.on_selection_changed)
         list_layout.addWidget(self.zip_list)
         
@@ -231,6 +259,11 @@ class ImportTab(QWidget):
         """)
         version_layout.addWidget(self.version_input)
         
+        self.merge_checkbox = QCheckBox("合并模式：已有的 key 原地更新，只追加新 key")
+        self.merge_checkbox.setChecked(True)
+        self.merge_checkbox.setToolTip("关闭后按旧方式把导入文件整体追加到版本号注释块中")
+        version_layout.addWidget(self.merge_checkbox)
+        
         layout.addWidget(version_container)
         
         # 导入按钮 - 固定在底部，更突出
@@ -243,73 +276,113 @@ class ImportTab(QWidget):
         self.import_btn.setEnabled(False)
         button_layout.addWidget(self.import_btn)
         
+        # 导回编辑后的对照表（导出页生成的 key × 语言表格）
+        self.import_sheet_btn = QPushButton("📊 导入对照表")
+        self.import_sheet_btn.setFixedHeight(40)
+        self.import_sheet_btn.setEnabled(False)
+        button_layout.addWidget(self.import_sheet_btn)
+        
         button_layout.addStretch()
         layout.addLayout(button_layout)
     
     def load_zip_files(self):
-        """加载当前文件夹下的所有 ZIP 文件"""
-        self.zip_list.clear()
-        
+        """加载当前文件夹下的所有 ZIP / XLIFF 文件
+
+        先用索引缓存立即显示，再由后台线程扫描文件夹、补全新增文件的语言信息。
+        上一次的索引任务不等待结束（排队中的直接移出队列），之后它发出的信号被忽略
+        """
+        if self.index_worker is not None and self.index_worker.isRunning():
+            WorkerPool.instance().cancel(self.index_worker)
+        self.index_worker = None
+
+        self.populate_zip_list(ZipIndex.cached_folder(self.current_folder), loading=True)
+
         if not os.path.exists(self.current_folder):
+            self.populate_zip_list([])
             return
-        
-        try:
-            # 查找所有 .zip 文件
-            zip_files = []
-            for file in os.listdir(self.current_folder):
-                if file.endswith('.zip'):
-                    file_path = os.path.join(self.current_folder, file)
-                    # 获取文件信息
-                    stat = os.stat(file_path)
-                    zip_files.append({
-                        'name': file,
-                        'path': file_path,
-                        'size': stat.st_size,
-                        'mtime': stat.st_mtime
-                    })
-            
-            # 按修改时间倒序排列（最新的在前面）
-            zip_files.sort(key=lambda x: x['mtime'], reverse=True)
-            
-            # 添加到列表
-            for file_info in zip_files:
-                # 格式化文件信息
-                size_mb = file_info['size'] / (1024 * 1024)
-                mtime = datetime.fromtimestamp(file_info['mtime']).strftime('%Y-%m-%d %H:%M:%S')
-                
-                # 显示格式：文件名 | 大小 | 修改时间
-                display_text = f"{file_info['name']}  |  {size_mb:.2f} MB  |  {mtime}"
-                
-                item = QListWidgetItem(display_text)
-                item.setData(Qt.ItemDataRole.UserRole, file_info['path'])  # 保存完整路径
-                
-                # 第一个（最新的）文件用不同颜色标记
-                if len(self.zip_list) == 0:
-                    item.setForeground(Qt.GlobalColor.blue)
-                
-                self.zip_list.addItem(item)
-            
+
+        worker = ZipIndexWorker(self.current_folder)
+        worker.listed.connect(lambda zip_files: self.on_zip_listed(worker, zip_files))
+        worker.entry_indexed.connect(lambda file_info: self.update_zip_item(worker, file_info))
+        worker.finished.connect(lambda *args: self.on_index_finished(worker, *args))
+        self.index_worker = worker
+        worker.start(owner=self)
+
+    def on_zip_listed(self, worker: ZipIndexWorker, zip_files: list):
+        """索引任务列出文件夹后重建列表（已被新任务取代时忽略）"""
+        if worker is self.index_worker:
+            self.populate_zip_list(zip_files)
+
+    def populate_zip_list(self, zip_files: list, loading: bool = False):
+        """重建文件列表（zip_files 已按修改时间倒序），保留当前选择"""
+        selected_paths = set(self.get_selected_zip_paths())
+        self.zip_list.clear()
+        self.zip_items = {}
+
+        for file_info in zip_files:
+            item = QListWidgetItem(self.format_zip_item(file_info))
+            item.setData(Qt.ItemDataRole.UserRole, file_info['path'])  # 保存完整路径
+
+            # 第一个（最新的）文件用不同颜色标记
+            if len(self.zip_list) == 0:
+                item.setForeground(Qt.GlobalColor.blue)
+
+            self.zip_list.addItem(item)
+            self.zip_items[file_info['path']] = item
+            if file_info['path'] in selected_paths:
+                item.setSelected(True)
+
+        if self.zip_list.count() > 0:
             # 默认选中第一个（最新的）
-            if self.zip_list.count() > 0:
+            if not self.zip_list.selectedItems():
                 self.zip_list.setCurrentRow(0)
-                self.import_btn.setEnabled(True)
-                # 更新文件数量标签
-                self.file_count_label.setText(f"{len(zip_files)} 个文件")
-            else:
-                self.import_btn.setEnabled(False)
-                self.file_count_label.setText("0 个文件")
-                
-                # 显示空状态提示
-                empty_item = QListWidgetItem("📭 当前文件夹没有 ZIP 文件")
-                empty_item.setForeground(Qt.GlobalColor.gray)
-                empty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                empty_item.setFlags(Qt.ItemFlag.NoItemFlags)  # 不可选中
-                self.zip_list.addItem(empty_item)
-                
-        except Exception as e:
-            print(f"加载 ZIP 文件列表失败: {e}")
+            self.import_btn.setEnabled(True)
+            # 更新文件数量标签
+            self.file_count_label.setText(f"{len(zip_files)} 个文件")
+        elif loading:
+            self.import_btn.setEnabled(False)
+            self.file_count_label.setText("正在扫描...")
+        else:
+            self.import_btn.setEnabled(False)
+            self.file_count_label.setText("0 个文件")
+
+            # 显示空状态提示
+            empty_item = QListWidgetItem("📭 当前文件夹没有 ZIP / XLIFF 文件")
+            empty_item.setForeground(Qt.GlobalColor.gray)
+            empty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            empty_item.setFlags(Qt.ItemFlag.NoItemFlags)  # 不可选中
+            self.zip_list.addItem(empty_item)
+
+    @staticmethod
+    def format_zip_item(file_info: dict) -> str:
+        """显示格式：文件名 | 大小 | 修改时间 | 语言"""
+        size_mb = file_info['size'] / (1024 * 1024)
+        mtime = datetime.fromtimestamp(file_info['mtime']).strftime('%Y-%m-%d %H:%M:%S')
+        languages = file_info.get('languages')
+        if languages is None:
+            lang_text = "索引中..."
+        elif len(languages) <= 4:
+            lang_text = ", ".join(languages) if languages else "无语言文件"
+        else:
+            lang_text = f"{len(languages)} 个语言"
+        return f"{file_info['name']}  |  {size_mb:.2f} MB  |  {mtime}  |  {lang_text}"
+
+    def update_zip_item(self, worker: ZipIndexWorker, file_info: dict):
+        """单个文件索引完成后只更新对应的行"""
+        if worker is not self.index_worker:
+            return
+        item = self.zip_items.get(file_info['path'])
+        if item is not None:
+            item.setText(self.format_zip_item(file_info))
+            item.setToolTip(", ".join(file_info['languages'] or []))
+
+    def on_index_finished(self, worker: ZipIndexWorker, success: bool, message: str, indexed_count: int):
+        if worker is not self.index_worker:
+            return
+        if not success and message != "操作已取消":
+            print(f"加载 ZIP 文件列表失败: {message}")
             self.file_count_label.setText("加载失败")
-    
+
     def on_selection_changed(self):
         """选择改变时的处理"""
         # 更新导入按钮状态
@@ -329,6 +402,17 @@ class ImportTab(QWidget):
             return path if path else ""
         return ""
     
+    def get_selected_zip_paths(self) -> list:
+        """获取所有选中的文件路径（按列表顺序，即从新到旧）"""
+        paths = []
+        for i in range(self.zip_list.count()):
+            item = self.zip_list.item(i)
+            if item.isSelected():
+                path = item.data(Qt.ItemDataRole.UserRole)
+                if path:
+                    paths.append(path)
+        return paths
+    
     def set_version(self, version: str):
         """设置版本号"""
         if version and version != 'Unknown':
@@ -341,4 +425,7 @@ class ImportTab(QWidget):
             # 如果没有输入，使用默认的日期时间格式
             return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         return version
-
+    
+    def is_merge_mode(self) -> bool:
+        """是否使用合并模式导入"""
+        return self.merge_checkbox.isChecked()
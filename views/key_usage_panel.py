@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Key 引用面板
+显示选中 key 在代码中的所有引用位置（file:line），点击可在编辑器中打开
+"""
+
+import os
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QListWidget, QListWidgetItem
+)
+from PyQt6.QtCore import Qt
+
+from utils.theme import get_theme_colors
+from utils.editor import open_in_editor
+
+
+class KeyUsagePanel(QWidget):
+    """Key 引用面板（查询共享的 KeyUsageIndex，不触发扫描）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.colors = get_theme_colors()
+        self.usage_index = None
+        self.project_path = None
+        self.current_key = None
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 8, 0, 0)
+        layout.setSpacing(6)
+
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(8)
+
+        title_label = QLabel("引用位置")
+        title_label.setStyleSheet(f"font-size: 13px; font-weight: 600; color: {self.colors['text_primary']};")
+        header_layout.addWidget(title_label)
+
+        self.summary_label = QLabel("选中一个 key 查看代码中的引用")
+        self.summary_label.setStyleSheet(f"font-size: 12px; color: {self.colors['text_tertiary']};")
+        header_layout.addWidget(self.summary_label)
+        header_layout.addStretch()
+
+        layout.addLayout(header_layout)
+
+        self.location_list = QListWidget()
+        self.location_list.setMaximumHeight(140)
+        self.location_list.setToolTip("💡 双击可在编辑器中打开并跳转到对应行")
+        self.location_list.setStyleSheet(f"""
+            QListWidget {{
+                border: 1px solid {self.colors['border']};
+                border-radius: 6px;
+                background: {self.colors['bg_card']};
+                font-family: 'SF Mono', 'Menlo', monospace;
+                font-size: 11px;
+            }}
+            QListWidget::item {{
+                padding: 4px 8px;
+                color: {self.colors['text_primary']};
+            }}
+            QListWidget::item:selected {{
+                background: {self.colors['table_selected']};
+                color: white;
+            }}
+        """)
+        self.location_list.itemDoubleClicked.connect(self.on_item_double_clicked)
+        layout.addWidget(self.location_list)
+
+    def set_index(self, usage_index, project_path: str):
+        """设置共享索引"""
+        self.usage_index = usage_index
+        self.project_path = project_path
+        self.refresh()
+
+    def show_key(self, key: str):
+        """显示指定 key 的引用位置"""
+        if key == self.current_key:
+            return
+        self.current_key = key
+        self.refresh()
+
+    def refresh(self):
+        """根据当前 key 重新查询索引（索引刷新完成后也会调用）"""
+        self.location_list.clear()
+
+        if not self.current_key:
+            self.summary_label.setText("选中一个 key 查看代码中的引用")
+            return
+
+        if self.usage_index is None or self.usage_index.file_count == 0:
+            self.summary_label.setText("引用索引尚未建立")
+            return
+
+        locations = self.usage_index.lookup(self.current_key)
+        if not locations:
+            self.summary_label.setText(f"{self.current_key} · 代码中未找到引用")
+            return
+
+        self.summary_label.setText(f"{self.current_key} · {len(locations)} 处引用")
+        for file_path, line_num in locations:
+            display_path = file_path
+            if self.project_path:
+                display_path = os.path.relpath(file_path, self.project_path)
+            item = QListWidgetItem(f"{display_path}:{line_num}")
+            item.setData(Qt.ItemDataRole.UserRole, (file_path, line_num))
+            item.setToolTip(file_path)
+            self.location_list.addItem(item)
+
+    def on_item_double_clicked(self, item: QListWidgetItem):
+        """双击在编辑器中打开"""
+        location = item.data(Qt.ItemDataRole.UserRole)
+        if location:
+            open_in_editor(*location)
@@ -5,8 +5,6 @@
 用于配置 ZIP 文件中的语言代码与项目语言代码的映射关系
 """
 
-import os
-import zipfile
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QTableWidget, QTableWidgetItem, QComboBox,
@@ -15,6 +13,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
+from models.zip_index import ZipIndex
 from utils.theme import get_theme_colors
 from utils.config import ConfigManager
 from PyQt6.QtGui import QColor, QFont
@@ -48,17 +47,18 @@ LANGUAGE_ALIASES = {
 class LanguageMappingDialog(QDialog):
     """语言映射对话框"""
     
-    def __init__(self, zip_path: str, project_languages: dict, parent=None):
+    def __init__(self, zip_path, project_languages: dict, parent=None):
         """
         初始化对话框
         
         Args:
-            zip_path: ZIP 文件路径
+            zip_path: ZIP 文件路径（批量导入时为路径列表）
             project_languages: 项目中的语言 {lang_code: lproj_path}
             parent: 父窗口
         """
         super().__init__(parent)
-        self.zip_path = zip_path
+        self.zip_paths = [zip_path] if isinstance(zip_path, str) else list(zip_path)
+        self.zip_path = self.zip_paths[0]
         self.project_languages = project_languages
         self.colors = get_theme_colors()
         self.mappings = {}  # {zip_lang: project_lang}
@@ -73,21 +73,19 @@ class LanguageMappingDialog(QDialog):
         self.apply_smart_matching()
     
     def parse_zip_languages(self) -> list:
-        """解析 ZIP 文件中的语言列表"""
+        """解析所有 ZIP 文件中的语言列表（去重）"""
         languages = []
-        try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                for name in zf.namelist():
-                    if name.endswith('.strings'):
-                        # 提取语言代码（去掉路径和扩展名）
-                        basename = os.path.basename(name)
-                        lang_code = os.path.splitext(basename)[0]
-                        if lang_code and lang_code not in languages:
-                            languages.append(lang_code)
-        except Exception as e:
-            print(f"解析 ZIP 失败: {e}")
+        for zip_path in self.zip_paths:
+            for lang_code in self.parse_languages(zip_path):
+                if lang_code not in languages:
+                    languages.append(lang_code)
         return sorted(languages)
     
+    @staticmethod
+    def parse_languages(zip_path: str) -> list:
+        """单个 ZIP / XLIFF 文件中的语言列表（导入列表已索引过的文件直接读缓存）"""
+        return ZipIndex.get_languages(zip_path)
+    
     def init_ui(self):
         """初始化 UI"""
         self.setWindowTitle("语言映射确认")
@@ -114,7 +112,11 @@ class LanguageMappingDialog(QDialog):
         """)
         title_layout.addWidget(title_label)
         
-        subtitle_label = QLabel(f"检测到 ZIP 中包含 {len(self.zip_languages)} 个语言文件，请确认映射关系")
+        subtitle_label = QLabel(
+            f"检测到 {len(self.zip_paths)} 个文件中包含 {len(self.zip_languages)} 个语言，请确认映射关系"
+            if len(self.zip_paths) > 1 else
+            f"检测到 ZIP 中包含 {len(self.zip_languages)} 个语言文件，请确认映射关系"
+        )
         subtitle_label.setStyleSheet(f"""
             font-size: 13px;
             color: {self.colors['text_secondary']};
@@ -8,18 +8,19 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QComboBox, QPushButton, QTextEdit,
+    QComboBox, QPushButton,
     QTableWidget, QTableWidgetItem,
     QHeaderView, QCheckBox, QDoubleSpinBox,
     QDialog, QDialogButtonBox, QScrollArea,
     QFrame, QApplication, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from bisect import bisect_right
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor, QBrush, QFont
 from utils.theme import get_theme_colors
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
+from views.key_usage_panel import KeyUsagePanel
+from views.log_view import LogView
+from workers.length_export_worker import LengthResultExportWorker
 
 
 class LanguageSelectorDialog(QDialog):
@@ -155,8 +156,11 @@ class LengthCompareTab(QWidget):
         self.colors = get_theme_colors()
         self.languages = []
         self.selected_languages = []
+        self.all_results = []       # 全部变长字段（未按阈值过滤），按差异百分比从大到小排序
+        self.all_percents = []      # 与 all_results 对应的 -diff_percent（升序），用于二分查找阈值
         self.results = {}
         self.sorted_results = []
+        self.export_worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -294,6 +298,13 @@ class LengthCompareTab(QWidget):
         """)
         config_layout.addWidget(self.min_diff_spinbox)
         
+        # 阈值只在内存中过滤已有结果，连续调整时合并为一次重绘
+        self.threshold_timer = QTimer(self)
+        self.threshold_timer.setSingleShot(True)
+        self.threshold_timer.setInterval(150)
+        self.threshold_timer.timeout.connect(self.apply_threshold)
+        self.min_diff_spinbox.valueChanged.connect(self.threshold_timer.start)
+        
         config_layout.addStretch()
         
         # 开始对比按钮
@@ -432,12 +443,17 @@ class LengthCompareTab(QWidget):
         self.result_table.setColumnWidth(6, 90)   # 差异
         
         self.result_table.setVisible(False)
+        self.result_table.currentCellChanged.connect(self.on_current_cell_changed)
         result_layout.addWidget(self.result_table)
         
+        # 引用位置面板（查询共享的 Key 引用索引）
+        self.usage_panel = KeyUsagePanel()
+        result_layout.addWidget(self.usage_panel)
+        
         main_layout.addWidget(self.result_container, 1)
         
         # 隐藏的日志（保留接口兼容）
-        self.compare_log_text = QTextEdit()
+        self.compare_log_text = LogView()
         self.compare_log_text.setVisible(False)
     
     def show_language_selector(self):
@@ -499,127 +515,84 @@ class LengthCompareTab(QWidget):
         """获取最小差异百分比"""
         return self.min_diff_spinbox.value()
     
+    def on_current_cell_changed(self, row: int, col: int, prev_row: int, prev_col: int):
+        """选中行改变时，在引用面板中显示该 key 的代码引用"""
+        if 0 <= row < len(self.sorted_results):
+            self.usage_panel.show_key(self.sorted_results[row][1]['key'])
+    
     def export_to_excel(self):
-        """导出结果到 Excel"""
+        """导出结果到 Excel / CSV / JSONL（后台线程流式写出）"""
         if not self.sorted_results:
             return
         
+        if self.export_worker and self.export_worker.isRunning():
+            return
+        
         # 让用户选择保存位置
         file_path, _ = QFileDialog.getSaveFileName(
             self,
-            "导出 Excel",
+            "导出结果",
             "长度对比结果.xlsx",
-            "Excel Files (*.xlsx);;All Files (*)"
+            "Excel Files (*.xlsx);;CSV Files (*.csv);;JSON Lines (*.jsonl);;All Files (*)"
         )
         
         if not file_path:
             return
         
-        try:
-            # 创建 Workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "长度对比结果"
-            
-            # 设置表头
-            headers = ["Key", "英文 Value", "Value", "语言", "长度", "基准", "差异%"]
-            ws.append(headers)
-            
-            # 设置表头样式
-            header_fill = PatternFill(start_color="F5F5F7", end_color="F5F5F7", fill_type="solid")
-            header_font = Font(bold=True, size=12, color="1D1D1F")
-            
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 填充数据
-            for _, data in self.sorted_results:
-                base_len = data['base_length']
-                if isinstance(base_len, float) and base_len.is_integer():
-                    base_str = int(base_len)
-                else:
-                    base_str = round(base_len, 1)
-                
-                diff_percent = data['diff_percent']
-                
-                # 获取英文 Value
-                en_value = ""
-                if 'all_values' in data:
-                    # 优先查找 'en'，如果没有则查找以 'en' 开头的语言代码
-                    if 'en' in data['all_values']:
-                        en_value = data['all_values']['en']['value']
-                    else:
-                        for lang_code in data['all_values'].keys():
-                            if lang_code.startswith('en'):
-                                en_value = data['all_values'][lang_code]['value']
-                                break
-                
-                row = [
-                    data['key'],
-                    en_value,
-                    data['target_value'],
-                    data['target_lang'],
-                    data['target_length'],
-                    base_str,
-                    f"+{diff_percent:.1f}%"
-                ]
-                ws.append(row)
-                
-                # 设置差异列的颜色（根据严重程度）
-                diff_cell = ws.cell(row=ws.max_row, column=7)
-                if diff_percent >= 100:
-                    diff_cell.fill = PatternFill(start_color="FFEBEE", end_color="FFEBEE", fill_type="solid")
-                    diff_cell.font = Font(bold=True, color="FF3B30")
-                elif diff_percent >= 50:
-                    diff_cell.fill = PatternFill(start_color="FFF3E0", end_color="FFF3E0", fill_type="solid")
-                    diff_cell.font = Font(bold=True, color="FF6B35")
-                else:
-                    diff_cell.fill = PatternFill(start_color="FFF8E1", end_color="FFF8E1", fill_type="solid")
-                    diff_cell.font = Font(bold=True, color="FF9500")
-                
-                diff_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 设置列宽
-            ws.column_dimensions['A'].width = 30  # Key
-            ws.column_dimensions['B'].width = 40  # 英文 Value
-            ws.column_dimensions['C'].width = 40  # Value
-            ws.column_dimensions['D'].width = 12  # 语言
-            ws.column_dimensions['E'].width = 10  # 长度
-            ws.column_dimensions['F'].width = 10  # 基准
-            ws.column_dimensions['G'].width = 12  # 差异%
-            
-            # 设置数据行对齐和格式
-            for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-                for col_num, cell in enumerate(row, 1):
-                    if col_num in [4, 5, 6, 7]:  # 语言、长度、基准、差异列居中
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                    elif col_num in [2, 3]:  # 英文 Value 和 Value 列左对齐，自动换行
-                        cell.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-                    elif col_num == 1:  # Key 列左对齐
-                        cell.alignment = Alignment(horizontal="left", vertical="center")
-            
-            # 保存文件
-            wb.save(file_path)
-            
+        self.copy_btn.setEnabled(False)
+        self.copy_btn.setText("导出中...")
+        
+        self.export_worker = LengthResultExportWorker(list(self.sorted_results), file_path)
+        self.export_worker.progress.connect(self.on_export_message)
+        self.export_worker.progress_state.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.start(owner=self)
+    
+    def on_export_message(self, message: str):
+        """导出阶段提示（如保存中）"""
+        self.copy_btn.setText(f"导出中 {message}")
+    
+    def on_export_progress(self, state: dict):
+        """导出进度更新（已限频）"""
+        if state['total']:
+            self.copy_btn.setText(f"导出中 {state['done'] * 100 // state['total']}%")
+    
+    def on_export_finished(self, success: bool, message: str, file_path: str):
+        """导出完成"""
+        from PyQt6.QtCore import QTimer
+        from utils.toast import Toast
+        
+        self.copy_btn.setEnabled(True)
+        if success:
             # 更新按钮文字提示
             self.copy_btn.setText("已导出 ✓")
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(2000, lambda: self.copy_btn.setText("导出 Excel"))
-            
-            # 显示成功提示
-            from utils.toast import Toast
             Toast.show_toast(self, f"✅ 已导出到 {file_path}", 2000)
-            
-        except Exception as e:
-            from utils.toast import Toast
-            Toast.show_toast(self, f"❌ 导出失败: {str(e)}", 3000)
+        else:
+            self.copy_btn.setText("导出 Excel")
+            Toast.show_toast(self, f"❌ {message}", 3000)
         
     def update_results(self, results: dict):
-        """更新对比结果显示"""
-        self.results = results
+        """更新对比结果（未按阈值过滤），按当前阈值显示"""
+        self.all_results = sorted(
+            results.items(),
+            key=lambda x: x[1]['diff_percent'],
+            reverse=True
+        )
+        self.all_percents = [-data['diff_percent'] for _, data in self.all_results]
+        self.apply_threshold()
+    
+    def apply_threshold(self):
+        """按阈值过滤已有结果并重绘，不重新对比"""
+        # all_results 按差异从大到小排序，满足阈值的正好是前缀
+        count = bisect_right(self.all_percents, -self.get_min_diff_percent())
+        self.render_results(self.all_results[:count])
+    
+    def render_results(self, sorted_results: list):
+        """显示已排序的结果 [(result_key, data)]"""
+        self.sorted_results = sorted_results
+        self.results = dict(sorted_results)
+        results = self.results
         
         if not results:
             # 无结果
@@ -642,13 +615,6 @@ class LengthCompareTab(QWidget):
         self.result_table.setVisible(True)
         self.result_table.setRowCount(0)
         
-        # 按差异百分比排序（从大到小）
-        self.sorted_results = sorted(
-            results.items(),
-            key=lambda x: x[1]['diff_percent'],
-            reverse=True
-        )
-        
         # 更新统计
         total_count = len(results)
         max_diff = max(r['diff_percent'] for r in results.values())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日志视图
+有界的环形日志：只保留最近 LOG_MAX_LINES 行，append 先进入缓冲区，
+由定时器合并后一次性写入文档，worker 高频输出时也不会逐行重绘
+"""
+
+from collections import deque
+from PyQt6.QtWidgets import QPlainTextEdit
+from PyQt6.QtCore import QTimer
+
+from utils.constants import LOG_MAX_LINES, PROGRESS_EMIT_INTERVAL
+
+
+def format_progress_state(state: dict) -> str:
+    """结构化进度 → 一行文字，如 "扫描代码文件 120/800 (15%) · 1.2 MB · 剩余 8 秒" """
+    parts = [state['phase']]
+    done, total = state['done'], state['total']
+    if total:
+        parts.append(f"{done}/{total} ({done * 100 // total}%)")
+    else:
+        parts.append(str(done))
+    text = " ".join(parts)
+
+    if state.get('bytes'):
+        text += f" · {state['bytes'] / (1024 * 1024):.1f} MB"
+    eta = state.get('eta')
+    if eta is not None:
+        text += f" · 剩余 {int(eta) + 1} 秒" if eta < 60 else f" · 剩余 {int(eta // 60) + 1} 分钟"
+    return text
+
+
+class LogView(QPlainTextEdit):
+    """只读日志视图（接口与 QTextEdit.append / clear 兼容）"""
+
+    def __init__(self, parent=None, max_lines: int = LOG_MAX_LINES):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)  # 文档超过上限时自动丢弃最早的行
+        self.pending = deque(maxlen=max_lines)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(int(PROGRESS_EMIT_INTERVAL * 1000))
+        self.flush_timer.timeout.connect(self.flush)
+
+    def append(self, text: str):
+        """追加一行（合并到下一次刷新）"""
+        self.pending.append(text)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        if not self.pending:
+            return
+        lines = "\n".join(self.pending)
+        self.pending.clear()
+        self.appendPlainText(lines)
+
+    def clear(self):
+        self.pending.clear()
+        self.flush_timer.stop()
+        super().clear()
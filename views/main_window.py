@@ -5,49 +5,97 @@
 管理所有标签页和事件处理
 """
 
+import importlib
 import os
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QFileDialog, QTabWidget
+    QLabel, QPushButton, QFileDialog, QLineEdit
 )
-from PyQt6.QtCore import Qt, QThread
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QPixmap, QKeySequence, QShortcut
 
-from views.info_tab import InfoTab
-from views.deduplicate_tab import DeduplicateTab
-from views.import_tab import ImportTab
-from views.export_tab import ExportTab
-from views.compare_tab import CompareTab
-from views.length_compare_tab import LengthCompareTab
-from views.replace_tab import ReplaceTab
-from views.extract_keys_tab import ExtractKeysTab
-from views.language_mapping_dialog import LanguageMappingDialog
+from views.log_view import format_progress_state
 
-from workers import (
-    ScanDuplicatesWorker, DeduplicateWorker, ImportWorker,
-    ExportWorker, CompareWorker, ScanStringsWorker, ReplaceStringsWorker,
-    LengthCompareWorker
-)
-from workers.extract_keys_worker import ExtractKeysWorker
+# worker 在各处理函数中按需导入（export_worker 等会带入较重的依赖），启动时只加载线程池
+from workers.worker_pool import WorkerPool
 
 from models.project_info import ProjectInfoExtractor
+from models.key_usage_index import KeyUsageIndex
+from models.xcstrings_parser import XCStringsParser
 from utils.theme import get_main_style
 from utils.config import ConfigManager
 from utils.toast import Toast
+from utils.perf import span
+
+# 导航顺序的 Tab：(属性名, 模块, 类名)。除首页外，第一次切换到（或第一次被访问）时才导入模块并创建
+TAB_SPECS = [
+    ('info_tab', 'views.info_tab', 'InfoTab'),
+    ('deduplicate_tab', 'views.deduplicate_tab', 'DeduplicateTab'),
+    ('import_tab', 'views.import_tab', 'ImportTab'),
+    ('export_tab', 'views.export_tab', 'ExportTab'),
+    ('compare_tab', 'views.compare_tab', 'CompareTab'),
+    ('length_compare_tab', 'views.length_compare_tab', 'LengthCompareTab'),
+    ('format_check_tab', 'views.format_check_tab', 'FormatCheckTab'),
+    ('similar_values_tab', 'views.similar_values_tab', 'SimilarValuesTab'),
+    ('replace_tab', 'views.replace_tab', 'ReplaceTab'),
+    ('extract_keys_tab', 'views.extract_keys_tab', 'ExtractKeysTab'),
+]
+TAB_NAMES = [name for name, _, _ in TAB_SPECS]
 
 
 class MainWindow(QMainWindow):
     """主窗口"""
     
+    # 第一次绘制完成（启动耗时基准以此为首帧时间）
+    first_painted = pyqtSignal()
+    
+    # 配置变化（ConfigManager 在修改配置的线程中通知，经信号转到 UI 线程）
+    config_changed = pyqtSignal(str, object)
+    
     def __init__(self):
         super().__init__()
         self.project_path = None
         self.languages = []
         
+        # Key 引用索引（全局共享，按文件增量刷新）
+        self.key_usage_index = KeyUsageIndex()
+        self.key_usage_worker = None
+        self.perf_panel = None
+        self.project_version = None
+        self.created_tabs = {}  # {属性名: Tab}，已创建的 Tab
+        self.painted = False
+        
         # 初始化 UI
         self.init_ui()
         
-        # 加载上次的项目路径
+        # 首帧绘制之后再加载上次的项目（遍历项目、读取图标都比较慢）
+        self.first_painted.connect(self.restore_last_project, Qt.ConnectionType.QueuedConnection)
+        
+        # Git 基线在别处修改时同步到输入框
+        def listener(key, value):
+            self.config_changed.emit(key, value)
+        self.config_changed.connect(self.on_config_changed)
+        ConfigManager.subscribe(listener)
+        self.destroyed.connect(lambda: ConfigManager.unsubscribe(listener))
+    
+    def __getattr__(self, name):
+        # 尚未创建的 Tab 在第一次被访问时创建
+        if name in TAB_NAMES and 'created_tabs' in self.__dict__:
+            return self.ensure_tab(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_painted.emit()
+    
+    def on_config_changed(self, key: str, value):
+        if key == 'git_base_ref' and (value or '') != self.git_ref_input.text().strip():
+            self.git_ref_input.setText(value or '')
+    
+    def restore_last_project(self):
+        """加载上次的项目路径"""
         last_path = ConfigManager.get_last_project_path()
         if last_path:
             self.set_project_path(last_path)
@@ -88,27 +136,12 @@ class MainWindow(QMainWindow):
         from PyQt6.QtWidgets import QStackedWidget
         self.content_stack = QStackedWidget()
         
-        # 创建各个 Tab
-        self.info_tab = InfoTab()
-        self.deduplicate_tab = DeduplicateTab()
-        self.import_tab = ImportTab()
-        self.export_tab = ExportTab()
-        self.compare_tab = CompareTab()
-        self.length_compare_tab = LengthCompareTab()
-        self.replace_tab = ReplaceTab()
-        self.extract_keys_tab = ExtractKeysTab()
-        
-        # 添加到堆叠窗口
-        self.content_stack.addWidget(self.info_tab)
-        self.content_stack.addWidget(self.deduplicate_tab)
-        self.content_stack.addWidget(self.import_tab)
-        self.content_stack.addWidget(self.export_tab)
-        self.content_stack.addWidget(self.compare_tab)
-        self.content_stack.addWidget(self.length_compare_tab)
-        self.content_stack.addWidget(self.replace_tab)
-        self.content_stack.addWidget(self.extract_keys_tab)
+        # 先放占位 widget，Tab 在第一次切换到时由 ensure_tab 创建并替换
+        for _ in TAB_SPECS:
+            self.content_stack.addWidget(QWidget())
         
         # 设置默认显示第一个
+        self.ensure_tab('info_tab')
         self.content_stack.setCurrentIndex(0)
         
         # 现在创建左侧导航栏（此时 content_stack 已存在）
@@ -120,11 +153,13 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(content_container, 1)
         
-        # 连接事件
-        self.connect_events()
-        
-        # 初始化导入标签页（加载 ZIP 文件列表并启用按钮）
-        self.init_import_tab()
+        # 状态栏：后台任务运行时显示取消按钮（Esc 同样可以取消）
+        self.cancel_btn = QPushButton("取消任务")
+        self.cancel_btn.setVisible(False)
+        self.cancel_btn.clicked.connect(self.cancel_running_jobs)
+        self.statusBar().addPermanentWidget(self.cancel_btn)
+        QShortcut(QKeySequence(Qt.Key.Key_Escape), self, activated=self.cancel_running_jobs)
+        WorkerPool.instance().active_changed.connect(self.on_active_jobs_changed)
     
     def create_toolbar(self):
         """创建顶部工具栏"""
@@ -159,14 +194,47 @@ class MainWindow(QMainWindow):
         """)
         layout.addWidget(self.path_label, 1)
         
+        # Git 基线：填写后查重、对比、字符串扫描只处理相对该 ref 变更的文件
+        git_ref_label = QLabel("Git 基线:")
+        git_ref_label.setStyleSheet("font-size: 13px; font-weight: 500; color: #1D1D1F;")
+        layout.addWidget(git_ref_label)
+        
+        self.git_ref_input = QLineEdit()
+        self.git_ref_input.setText(ConfigManager.get_git_base_ref())
+        self.git_ref_input.setPlaceholderText("如 main，留空全量扫描")
+        self.git_ref_input.setToolTip("只扫描相对该 git ref（分支 / tag / commit）有变更的文件，其余复用缓存结果")
+        self.git_ref_input.setFixedWidth(180)
+        self.git_ref_input.setFixedHeight(36)
+        self.git_ref_input.editingFinished.connect(
+            lambda: ConfigManager.save_git_base_ref(self.git_ref_input.text().strip())
+        )
+        layout.addWidget(self.git_ref_input)
+        
         # 选择按钮
         self.select_btn = QPushButton("选择项目")
         self.select_btn.setFixedHeight(36)
         self.select_btn.clicked.connect(self.select_project)
         layout.addWidget(self.select_btn)
         
+        # 性能面板
+        self.perf_btn = QPushButton("⏱")
+        self.perf_btn.setFixedSize(36, 36)
+        self.perf_btn.setToolTip("性能面板：各阶段耗时汇总，可导出 Chrome Trace")
+        self.perf_btn.clicked.connect(self.show_perf_panel)
+        layout.addWidget(self.perf_btn)
+        
         return toolbar
     
+    def show_perf_panel(self):
+        """打开性能面板（已打开时刷新并置前）"""
+        if self.perf_panel is None:
+            from views.perf_panel import PerfPanel
+            self.perf_panel = PerfPanel(self)
+        else:
+            self.perf_panel.refresh()
+        self.perf_panel.show()
+        self.perf_panel.raise_()
+    
     def create_sidebar(self):
         """创建左侧导航栏"""
         from PyQt6.QtWidgets import QListWidget, QListWidgetItem
@@ -207,8 +275,10 @@ class MainWindow(QMainWindow):
             ("📤 导出多语言", 3),
             ("🔎 对比多语言", 4),
             ("📏 长度对比", 5),
-            ("🔄 字符串替换", 6),
-            ("🔑 提取 Key", 7),
+            ("🧩 格式符检查", 6),
+            ("🧬 相似文案", 7),
+            ("🔄 字符串替换", 8),
+            ("🔑 提取 Key", 9),
         ]
         
         for text, index in nav_items:
@@ -228,44 +298,121 @@ class MainWindow(QMainWindow):
         """导航项切换"""
         # 添加安全检查
         if hasattr(self, 'content_stack') and 0 <= index < self.content_stack.count():
+            self.ensure_tab(TAB_NAMES[index])
             self.content_stack.setCurrentIndex(index)
+            # 排队中的任务优先执行当前可见 Tab 发起的
+            WorkerPool.instance().set_visible_owner(self.content_stack.currentWidget())
     
-    def connect_events(self):
-        """连接所有事件"""
-        # 查重去重
-        self.deduplicate_tab.scan_btn.clicked.connect(self.scan_duplicates)
-        self.deduplicate_tab.confirm_delete_btn.clicked.connect(self.delete_duplicates)
-        
-        # 导入多语言
-        self.import_tab.change_folder_btn.clicked.connect(self.change_import_folder)
-        self.import_tab.refresh_btn.clicked.connect(self.refresh_import_list)
-        self.import_tab.import_btn.clicked.connect(self.import_strings)
-        
-        # 导出多语言
-        self.export_tab.export_btn.clicked.connect(self.export_strings)
-        
-        # 对比多语言
-        self.compare_tab.compare_btn.clicked.connect(self.compare_languages)
-        
-        # 长度对比
-        self.length_compare_tab.compare_btn.clicked.connect(self.compare_lengths)
-        
-        # 字符串替换
-        self.replace_tab.scan_btn.clicked.connect(self.scan_strings)
-        self.replace_tab.replace_btn.clicked.connect(self.replace_strings)
+    def ensure_tab(self, name: str) -> QWidget:
+        """返回 Tab，尚未创建时导入模块、创建并替换占位 widget"""
+        tab = self.created_tabs.get(name)
+        if tab is not None:
+            return tab
+        
+        index = TAB_NAMES.index(name)
+        _, module_name, class_name = TAB_SPECS[index]
+        with span('build', 'MainWindow', tab=class_name):
+            tab_class = getattr(importlib.import_module(module_name), class_name)
+            tab = tab_class()
+        
+        current_index = self.content_stack.currentIndex()
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, tab)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.content_stack.setCurrentIndex(current_index)
+        
+        self.created_tabs[name] = tab
+        setattr(self, name, tab)
+        self.init_tab(name, tab)
+        self.sync_tab(name, tab)
+        return tab
+    
+    def init_tab(self, name: str, tab: QWidget):
+        """Tab 创建后连接事件、做一次性初始化"""
+        if name == 'deduplicate_tab':
+            # 查重去重
+            tab.scan_btn.clicked.connect(self.scan_duplicates)
+            tab.confirm_delete_btn.clicked.connect(self.delete_duplicates)
+        elif name == 'import_tab':
+            # 导入多语言
+            tab.change_folder_btn.clicked.connect(self.change_import_folder)
+            tab.refresh_btn.clicked.connect(self.refresh_import_list)
+            tab.import_btn.clicked.connect(self.import_strings)
+            tab.import_sheet_btn.clicked.connect(self.import_catalog_sheet)
+            
+            # 如果有保存的文件夹路径，加载文件列表并启用按钮
+            if tab.current_folder and os.path.exists(tab.current_folder):
+                tab.load_zip_files()
+                tab.change_folder_btn.setEnabled(True)
+                tab.refresh_btn.setEnabled(True)
+        elif name == 'export_tab':
+            # 导出多语言
+            tab.export_btn.clicked.connect(self.export_strings)
+            tab.export_sheet_btn.clicked.connect(self.export_catalog_sheet)
+        elif name == 'compare_tab':
+            # 对比多语言
+            tab.compare_btn.clicked.connect(self.compare_languages)
+            tab.fill_btn.clicked.connect(self.fill_from_translation_memory)
+            tab.write_fill_btn.clicked.connect(self.write_filled_translations)
+            tab.export_missing_btn.clicked.connect(self.export_missing_keys)
+        elif name == 'length_compare_tab':
+            # 长度对比
+            tab.compare_btn.clicked.connect(self.compare_lengths)
+        elif name == 'format_check_tab':
+            # 格式符检查
+            tab.check_btn.clicked.connect(self.check_format_specifiers)
+        elif name == 'similar_values_tab':
+            # 相似文案
+            tab.find_btn.clicked.connect(self.find_similar_values)
+        elif name == 'replace_tab':
+            # 字符串替换
+            tab.scan_btn.clicked.connect(self.scan_strings)
+            tab.replace_btn.clicked.connect(self.replace_strings)
+        elif name == 'extract_keys_tab':
+            # 提取 Key
+            tab.extract_btn.clicked.connect(self.extract_keys)
+            tab.copy_btn.clicked.connect(self.copy_extracted_keys)
+            tab.save_btn.clicked.connect(self.save_extracted_keys)
+    
+    def sync_tab(self, name: str, tab: QWidget):
+        """把当前项目状态（语言列表、版本号、引用索引、按钮可用性）同步到 Tab"""
+        if not self.project_path:
+            return
         
-        # 提取 Key
-        self.extract_keys_tab.extract_btn.clicked.connect(self.extract_keys)
-        self.extract_keys_tab.copy_btn.clicked.connect(self.copy_extracted_keys)
-        self.extract_keys_tab.save_btn.clicked.connect(self.save_extracted_keys)
+        if name == 'deduplicate_tab':
+            tab.usage_panel.set_index(self.key_usage_index, self.project_path)
+            tab.scan_btn.setEnabled(True)
+        elif name == 'import_tab':
+            if self.project_version:
+                tab.set_version(self.project_version)
+            tab.import_sheet_btn.setEnabled(True)
+        elif name == 'export_tab':
+            tab.update_languages(self.languages)
+            tab.export_btn.setEnabled(True)
+            tab.export_sheet_btn.setEnabled(True)
+        elif name == 'compare_tab':
+            tab.update_languages(self.languages)
+            tab.compare_btn.setEnabled(True)
+        elif name == 'length_compare_tab':
+            tab.update_languages(self.languages)
+            tab.usage_panel.set_index(self.key_usage_index, self.project_path)
+            tab.compare_btn.setEnabled(True)
+        elif name == 'format_check_tab':
+            tab.update_languages(self.languages)
+            tab.check_btn.setEnabled(True)
+        elif name == 'similar_values_tab':
+            tab.update_languages(self.languages)
+            tab.usage_panel.set_index(self.key_usage_index, self.project_path)
+            tab.find_btn.setEnabled(True)
+        elif name == 'replace_tab':
+            tab.scan_btn.setEnabled(True)
+        elif name == 'extract_keys_tab':
+            tab.update_languages(self.languages)
     
-    def init_import_tab(self):
-        """初始化导入标签页"""
-        # 如果有保存的文件夹路径，加载文件列表并启用按钮
-        if self.import_tab.current_folder and os.path.exists(self.import_tab.current_folder):
-            self.import_tab.load_zip_files()
-            self.import_tab.change_folder_btn.setEnabled(True)
-            self.import_tab.refresh_btn.setEnabled(True)
+    def get_git_ref(self) -> str:
+        """获取增量扫描的 git 基线（空表示全量扫描）"""
+        return self.git_ref_input.text().strip()
     
     def select_project(self):
         """选择项目路径"""
@@ -296,12 +443,15 @@ class MainWindow(QMainWindow):
         # 更新语言列表
         self.update_languages()
         
-        # 启用相关按钮
-        self.deduplicate_tab.scan_btn.setEnabled(True)
-        self.compare_tab.compare_btn.setEnabled(True)
-        self.length_compare_tab.compare_btn.setEnabled(True)
-        self.replace_tab.scan_btn.setEnabled(True)
-        self.export_tab.export_btn.setEnabled(True)
+        # 重建 Key 引用索引（先取消旧项目的刷新：排队中的直接移出队列，执行中的之后也不会再写入已重置的索引）
+        if self.key_usage_worker is not None:
+            WorkerPool.instance().cancel(self.key_usage_worker)
+        self.key_usage_index.reset(path)
+        self.refresh_key_usage_index()
+        
+        # 同步到已创建的 Tab（其余 Tab 创建时再同步）
+        for name, tab in self.created_tabs.items():
+            self.sync_tab(name, tab)
     
     def update_project_info(self):
         """更新项目信息 Tab"""
@@ -318,8 +468,8 @@ class MainWindow(QMainWindow):
             self.info_tab.version_label.setText(f"版本号: {version}")
             self.info_tab.bundle_id_label.setText(f"Bundle ID: {app_info.get('bundle_id', 'Unknown')}")
             
-            # 自动填充导入标签页的版本号
-            self.import_tab.set_version(version)
+            # 导入标签页的版本号在 sync_tab 中自动填充
+            self.project_version = version
             
             # 加载图标
             icon_path = ProjectInfoExtractor.find_app_icon(self.project_path)
@@ -345,13 +495,38 @@ class MainWindow(QMainWindow):
             lproj_folders = ProjectInfoExtractor.find_lproj_folders(self.project_path)
             self.languages = list(lproj_folders.keys())
             
-            # 更新各个 Tab 的语言列表
-            self.compare_tab.update_languages(self.languages)
-            self.length_compare_tab.update_languages(self.languages)
-            self.extract_keys_tab.update_languages(self.languages)
+            # String Catalog 中的语言
+            for catalog_file in XCStringsParser.find_xcstrings_files(self.project_path):
+                for lang in XCStringsParser.list_languages(catalog_file):
+                    if lang not in self.languages:
+                        self.languages.append(lang)
         except Exception as e:
             print(f"更新语言列表失败: {e}")
     
+    # ============ Key 引用索引相关方法 ============
+    
+    def refresh_key_usage_index(self):
+        """增量刷新 Key 引用索引（只重新扫描有变化的源文件）"""
+        if not self.project_path:
+            return
+        
+        from workers.key_usage_worker import KeyUsageIndexWorker
+        # 上一次刷新尚未结束时，调度器会把这次合并到正在进行的刷新（job_key 相同）
+        self.key_usage_worker = KeyUsageIndexWorker(self.project_path, self.key_usage_index)
+        self.key_usage_worker.finished.connect(self.on_key_usage_index_finished)
+        self.key_usage_worker.start()
+    
+    def on_key_usage_index_finished(self, success: bool, message: str, rescanned: int):
+        """引用索引刷新完成"""
+        print(message)
+        if success and rescanned:
+            for name in ('deduplicate_tab', 'length_compare_tab', 'similar_values_tab'):
+                if name in self.created_tabs:
+                    self.created_tabs[name].usage_panel.refresh()
+            # 相似文案的合并建议依赖引用次数
+            if 'similar_values_tab' in self.created_tabs:
+                self.similar_values_tab.apply_threshold()
+    
     # ============ 查重去重相关方法 ============
     
     def scan_duplicates(self):
@@ -370,11 +545,16 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.deduplicate_tab.scan_btn.setEnabled(False)
         
+        from workers.scan_worker import ScanDuplicatesWorker
         # 创建 Worker
-        self.scan_worker = ScanDuplicatesWorker(self.project_path, ignore_folders)
+        self.scan_worker = ScanDuplicatesWorker(self.project_path, ignore_folders, self.get_git_ref())
         self.scan_worker.progress.connect(self.on_scan_progress)
+        self.scan_worker.progress_state.connect(self.on_progress_state)
         self.scan_worker.finished.connect(self.on_scan_finished)
-        self.scan_worker.start()
+        self.scan_worker.start(owner=self.deduplicate_tab)
+        
+        # 同步刷新引用索引，结果表格直接查询
+        self.refresh_key_usage_index()
     
     def on_scan_progress(self, message: str):
         """扫描进度更新"""
@@ -386,7 +566,8 @@ class MainWindow(QMainWindow):
         self.deduplicate_tab.scan_log_text.append(message)
         
         if success:
-            self.deduplicate_tab.update_results(duplicates_info)
+            with span('render', 'DeduplicateTab', languages=len(duplicates_info)):
+                self.deduplicate_tab.update_results(duplicates_info)
             if duplicates_info:
                 self.deduplicate_tab.confirm_delete_btn.setVisible(True)
                 self.deduplicate_tab.confirm_delete_btn.setEnabled(True)
@@ -409,11 +590,13 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.deduplicate_tab.confirm_delete_btn.setEnabled(False)
         
+        from workers.deduplicate_worker import DeduplicateWorker
         # 创建 Worker
         self.deduplicate_worker = DeduplicateWorker(self.project_path, ignore_folders)
         self.deduplicate_worker.progress.connect(self.on_delete_progress)
+        self.deduplicate_worker.progress_state.connect(self.on_progress_state)
         self.deduplicate_worker.finished.connect(self.on_delete_finished)
-        self.deduplicate_worker.start()
+        self.deduplicate_worker.start(owner=self.deduplicate_tab)
     
     def on_delete_progress(self, message: str):
         """删除进度更新"""
@@ -441,10 +624,7 @@ class MainWindow(QMainWindow):
         )
         
         if folder:
-            self.import_tab.current_folder = folder
-            self.import_tab.folder_input.setText(folder)
-            ConfigManager.save_last_import_folder(folder)
-            self.import_tab.load_zip_files()
+            self.import_tab.set_folder(folder)
             self.import_tab.change_folder_btn.setEnabled(True)
             self.import_tab.refresh_btn.setEnabled(True)
     
@@ -454,10 +634,14 @@ class MainWindow(QMainWindow):
     
     def import_strings(self):
         """导入多语言"""
-        zip_path = self.import_tab.get_selected_zip_path()
-        if not zip_path or not self.project_path:
+        zip_paths = self.import_tab.get_selected_zip_paths()
+        if not zip_paths or not self.project_path:
             return
         
+        # 批量导入时旧文件在前，后导入的（更新的）覆盖同名 key
+        zip_paths.reverse()
+        zip_path = zip_paths[0] if len(zip_paths) == 1 else zip_paths
+        
         # 获取项目中的语言列表
         project_languages = ProjectInfoExtractor.find_lproj_folders(self.project_path)
         if not project_languages:
@@ -465,6 +649,7 @@ class MainWindow(QMainWindow):
             return
         
         # 弹出语言映射对话框
+        from views.language_mapping_dialog import LanguageMappingDialog
         dialog = LanguageMappingDialog(zip_path, project_languages, self)
         if dialog.exec() != dialog.DialogCode.Accepted:
             return
@@ -478,15 +663,59 @@ class MainWindow(QMainWindow):
         # 从输入框获取版本号（如果没有输入则使用日期时间）
         version = self.import_tab.get_version()
         
-        # 创建 Worker（传入语言映射）
-        self.import_worker = ImportWorker(zip_path, self.project_path, version, language_mappings)
-        self.import_worker.progress.connect(self.on_import_progress)
-        self.import_worker.finished.connect(self.on_import_finished)
-        self.import_worker.start()
+        # 先在后台预演，确认差异后再真正导入
+        self.pending_import = (zip_path, version, language_mappings, self.import_tab.is_merge_mode())
+        from workers.import_dry_run_worker import ImportDryRunWorker
+        self.import_dry_run_worker = ImportDryRunWorker(
+            zip_path, self.project_path, version, language_mappings,
+            merge_mode=self.import_tab.is_merge_mode()
+        )
+        self.import_dry_run_worker.progress.connect(self.on_import_progress)
+        self.import_dry_run_worker.progress_state.connect(self.on_progress_state)
+        self.import_dry_run_worker.finished.connect(self.on_import_dry_run_finished)
+        self.import_dry_run_worker.start(owner=self.import_tab)
         
         # 禁用按钮
         self.import_tab.import_btn.setEnabled(False)
     
+    def on_import_dry_run_finished(self, success: bool, message: str, diff_results: dict):
+        """导入预演完成，展示差异并等待确认"""
+        if not success:
+            self.import_tab.import_btn.setEnabled(True)
+            Toast.show_toast(self, message, 2000)
+            return
+        
+        zip_path, version, language_mappings, merge_mode = self.pending_import
+        from views.import_preview_dialog import ImportPreviewDialog
+        dialog = ImportPreviewDialog(diff_results, merge_mode, self)
+        if dialog.exec() != dialog.DialogCode.Accepted:
+            self.import_tab.import_btn.setEnabled(True)
+            return
+        
+        from workers.import_worker import ImportWorker
+        # 创建 Worker（传入语言映射）
+        self.import_worker = ImportWorker(
+            zip_path, self.project_path, version, language_mappings,
+            merge_mode=merge_mode
+        )
+        self.import_worker.progress.connect(self.on_import_progress)
+        self.import_worker.progress_state.connect(self.on_progress_state)
+        self.import_worker.finished.connect(self.on_import_finished)
+        self.import_worker.start(owner=self.import_tab)
+    
+    def on_progress_state(self, state: dict):
+        """所有 worker 的结构化进度（已在 worker 中限频）显示在状态栏"""
+        self.statusBar().showMessage(format_progress_state(state), 3000)
+    
+    def on_active_jobs_changed(self, count: int):
+        self.cancel_btn.setVisible(count > 0)
+        self.cancel_btn.setText(f"取消任务 ({count})" if count > 1 else "取消任务")
+    
+    def cancel_running_jobs(self):
+        """取消线程池中所有正在运行的任务（解析 / 扫描循环内会在 50ms 内响应）"""
+        if WorkerPool.instance().cancel_all():
+            self.statusBar().showMessage("正在取消...", 2000)
+    
     def on_import_progress(self, message: str):
         """导入进度更新"""
         # 这里可以添加导入日志显示
@@ -505,10 +734,9 @@ class MainWindow(QMainWindow):
             return
         
         key_list = self.export_tab.get_key_list()
-        export_strings = self.export_tab.strings_checkbox.isChecked()
-        export_xml = self.export_tab.xml_checkbox.isChecked()
+        formats = self.export_tab.get_selected_formats()
         
-        if not export_strings and not export_xml:
+        if not formats:
             Toast.show_toast(self, "请至少选择一种导出格式", 2000)
             return
         
@@ -519,16 +747,18 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.export_tab.export_btn.setEnabled(False)
         
+        from workers.export_worker import ExportWorker
         # 创建 Worker
         self.export_worker = ExportWorker(
             self.project_path,
-            export_strings,
-            export_xml,
-            key_list if key_list else None
+            formats,
+            key_list if key_list else None,
+            languages=self.export_tab.get_selected_languages() or None
         )
         self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.progress_state.connect(self.on_progress_state)
         self.export_worker.finished.connect(self.on_export_finished)
-        self.export_worker.start()
+        self.export_worker.start(owner=self.export_tab)
     
     def on_export_progress(self, message: str):
         """导出进度更新"""
@@ -540,6 +770,62 @@ class MainWindow(QMainWindow):
         self.export_tab.export_log_text.append(message)
         Toast.show_toast(self, message, 2000)
     
+    # ============ 全量对照表相关方法 ============
+    
+    def export_catalog_sheet(self):
+        """导出全量对照表（key × 语言）"""
+        if not self.project_path:
+            return
+        
+        default_path = os.path.join(ConfigManager.get_export_path(), "多语言对照表.xlsx")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出对照表", default_path, "Excel Files (*.xlsx)"
+        )
+        if not file_path:
+            return
+        
+        self.export_tab.export_log_text.clear()
+        self.export_tab.export_log_text.append("开始导出对照表...")
+        self.export_tab.export_sheet_btn.setEnabled(False)
+        
+        from workers.catalog_sheet_worker import CatalogSheetExportWorker
+        self.sheet_export_worker = CatalogSheetExportWorker(self.project_path, file_path)
+        self.sheet_export_worker.progress.connect(self.on_export_progress)
+        self.sheet_export_worker.progress_state.connect(self.on_progress_state)
+        self.sheet_export_worker.finished.connect(self.on_export_sheet_finished)
+        self.sheet_export_worker.start(owner=self.export_tab)
+    
+    def on_export_sheet_finished(self, success: bool, message: str, file_path: str):
+        """对照表导出完成"""
+        self.export_tab.export_sheet_btn.setEnabled(True)
+        self.export_tab.export_log_text.append(message)
+        Toast.show_toast(self, message, 2000)
+    
+    def import_catalog_sheet(self):
+        """导入编辑后的对照表"""
+        if not self.project_path:
+            return
+        
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "选择对照表", self.import_tab.current_folder, "Excel Files (*.xlsx)"
+        )
+        if not file_path:
+            return
+        
+        self.import_tab.import_sheet_btn.setEnabled(False)
+        
+        from workers.catalog_sheet_worker import CatalogSheetImportWorker
+        self.sheet_import_worker = CatalogSheetImportWorker(self.project_path, file_path)
+        self.sheet_import_worker.progress.connect(self.on_import_progress)
+        self.sheet_import_worker.progress_state.connect(self.on_progress_state)
+        self.sheet_import_worker.finished.connect(self.on_import_sheet_finished)
+        self.sheet_import_worker.start(owner=self.import_tab)
+    
+    def on_import_sheet_finished(self, success: bool, message: str, changes: dict):
+        """对照表导入完成"""
+        self.import_tab.import_sheet_btn.setEnabled(True)
+        Toast.show_toast(self, message, 2000)
+    
     # ============ 对比多语言相关方法 ============
     
     def compare_languages(self):
@@ -558,12 +844,17 @@ class MainWindow(QMainWindow):
         
         # 禁用按钮
         self.compare_tab.compare_btn.setEnabled(False)
+        self.compare_tab.fill_btn.setEnabled(False)
+        self.compare_tab.write_fill_btn.setEnabled(False)
+        self.compare_tab.export_missing_btn.setEnabled(False)
         
+        from workers.compare_worker import CompareWorker
         # 创建 Worker
-        self.compare_worker = CompareWorker(self.project_path, base_lang)
+        self.compare_worker = CompareWorker(self.project_path, base_lang, git_ref=self.get_git_ref())
         self.compare_worker.progress.connect(self.on_compare_progress)
+        self.compare_worker.progress_state.connect(self.on_progress_state)
         self.compare_worker.finished.connect(self.on_compare_finished)
-        self.compare_worker.start()
+        self.compare_worker.start(owner=self.compare_tab)
     
     def on_compare_progress(self, message: str):
         """对比进度更新"""
@@ -575,7 +866,204 @@ class MainWindow(QMainWindow):
         self.compare_tab.compare_log_text.append(message)
         
         if success:
-            self.compare_tab.update_results(missing_keys)
+            with span('render', 'CompareTab', languages=len(missing_keys)):
+                self.compare_tab.update_results(missing_keys, self.compare_worker.base_lang)
+    
+    def export_missing_keys(self):
+        """把对比结果中各语言缺失的 key 导出为待翻译包（不重新读取各语言）"""
+        if not self.project_path or not self.compare_tab.missing_keys:
+            return
+        
+        self.compare_tab.compare_log_text.append("开始导出待翻译包...")
+        self.compare_tab.export_missing_btn.setEnabled(False)
+        
+        from workers.export_worker import MissingKeysExportWorker
+        self.missing_keys_export_worker = MissingKeysExportWorker(
+            self.project_path,
+            self.compare_tab.base_lang,
+            self.compare_tab.missing_keys,
+            self.compare_tab.get_package_format()
+        )
+        self.missing_keys_export_worker.progress.connect(self.on_compare_progress)
+        self.missing_keys_export_worker.progress_state.connect(self.on_progress_state)
+        self.missing_keys_export_worker.finished.connect(self.on_export_missing_keys_finished)
+        self.missing_keys_export_worker.start(owner=self.compare_tab)
+    
+    def on_export_missing_keys_finished(self, success: bool, message: str, zip_path: str):
+        """待翻译包导出完成"""
+        self.compare_tab.export_missing_btn.setEnabled(True)
+        self.compare_tab.compare_log_text.append(message)
+        Toast.show_toast(self, message if success else f"❌ {message}", 2000)
+    
+    def fill_from_translation_memory(self):
+        """用翻译记忆为对比结果中缺失的 key 生成候选译文"""
+        if not self.project_path or not self.compare_tab.missing_keys:
+            return
+        
+        self.compare_tab.compare_log_text.append("开始从翻译记忆补全...")
+        self.compare_tab.fill_btn.setEnabled(False)
+        self.compare_tab.write_fill_btn.setEnabled(False)
+        
+        from workers.translation_memory_worker import TranslationMemoryWorker
+        self.translation_memory_worker = TranslationMemoryWorker(
+            self.project_path, self.compare_tab.base_lang, self.compare_tab.missing_keys
+        )
+        self.translation_memory_worker.progress.connect(self.on_compare_progress)
+        self.translation_memory_worker.progress_state.connect(self.on_progress_state)
+        self.translation_memory_worker.finished.connect(self.on_fill_from_translation_memory_finished)
+        self.translation_memory_worker.start(owner=self.compare_tab)
+    
+    def on_fill_from_translation_memory_finished(self, success: bool, message: str, candidates: dict):
+        """翻译记忆补全完成"""
+        self.compare_tab.fill_btn.setEnabled(True)
+        self.compare_tab.compare_log_text.append(message)
+        
+        if success:
+            with span('render', 'CompareTab', candidates=sum(len(items) for items in candidates.values())):
+                self.compare_tab.update_fill_candidates(candidates)
+            if not candidates:
+                Toast.show_toast(self, "翻译记忆中没有可用的译文", 2000)
+        else:
+            Toast.show_toast(self, f"❌ {message}", 2000)
+    
+    def write_filled_translations(self):
+        """把候选译文写回语言文件（每个语言一次）"""
+        translations = self.compare_tab.selected_translations()
+        if not self.project_path or not translations:
+            return
+        
+        total = sum(len(items) for items in translations.values())
+        self.compare_tab.compare_log_text.append(f"开始写入 {len(translations)} 个语言共 {total} 条译文...")
+        self.compare_tab.fill_btn.setEnabled(False)
+        self.compare_tab.write_fill_btn.setEnabled(False)
+        
+        from workers.translation_memory_worker import WriteTranslationsWorker
+        self.write_translations_worker = WriteTranslationsWorker(
+            self.project_path, translations, self.project_version
+        )
+        self.write_translations_worker.progress.connect(self.on_compare_progress)
+        self.write_translations_worker.progress_state.connect(self.on_progress_state)
+        self.write_translations_worker.finished.connect(self.on_write_translations_finished)
+        self.write_translations_worker.start(owner=self.compare_tab)
+    
+    def on_write_translations_finished(self, success: bool, message: str, changes: dict):
+        """候选译文写入完成"""
+        self.compare_tab.compare_log_text.append(message)
+        Toast.show_toast(self, message if success else f"❌ {message}", 2000)
+        if success:
+            # 语言文件已变化，重新对比刷新缺失列表
+            self.compare_languages()
+        else:
+            self.compare_tab.fill_btn.setEnabled(True)
+            self.compare_tab.apply_fill_filter()
+    
+    # ============ 格式符检查相关方法 ============
+    
+    def check_format_specifiers(self):
+        """检查各语言格式符是否一致"""
+        if not self.project_path:
+            return
+        
+        base_lang = self.format_check_tab.get_base_lang()
+        if not base_lang:
+            Toast.show_toast(self, "请选择基准语言", 2000)
+            return
+        
+        self.format_check_tab.check_log_text.clear()
+        self.format_check_tab.check_log_text.append(f"开始检查，基准语言: {base_lang}...")
+        self.format_check_tab.check_btn.setEnabled(False)
+        
+        from workers.format_check_worker import FormatCheckWorker
+        self.format_check_worker = FormatCheckWorker(self.project_path, base_lang)
+        self.format_check_worker.progress.connect(self.on_format_check_progress)
+        self.format_check_worker.progress_state.connect(self.on_progress_state)
+        self.format_check_worker.finished.connect(self.on_format_check_finished)
+        self.format_check_worker.start(owner=self.format_check_tab)
+    
+    def on_format_check_progress(self, message: str):
+        """格式符检查进度更新"""
+        self.format_check_tab.check_log_text.append(message)
+    
+    def on_format_check_finished(self, success: bool, message: str, mismatches: list):
+        """格式符检查完成"""
+        self.format_check_tab.check_btn.setEnabled(True)
+        self.format_check_tab.check_log_text.append(message)
+        
+        if success:
+            with span('render', 'FormatCheckTab', rows=len(mismatches)):
+                self.format_check_tab.update_results(mismatches)
+            if mismatches:
+                Toast.show_toast(self, f"⚠️ {message}", 2000)
+            else:
+                Toast.show_toast(self, "✅ 所有语言的格式符都一致", 2000)
+        else:
+            Toast.show_toast(self, f"❌ {message}", 2000)
+    
+    # ============ 相似文案相关方法 ============
+    
+    def find_similar_values(self):
+        """查找基准语言中的相似（或完全相同）文案"""
+        if not self.project_path:
+            return
+        
+        base_lang = self.similar_values_tab.get_base_lang()
+        if not base_lang:
+            Toast.show_toast(self, "请选择基准语言", 2000)
+            return
+        
+        self.similar_values_tab.find_log_text.clear()
+        self.similar_values_tab.find_log_text.append(f"开始查找，基准语言: {base_lang}...")
+        self.similar_values_tab.find_btn.setEnabled(False)
+        
+        if self.similar_values_tab.is_exact_mode():
+            from workers.duplicate_values_worker import DuplicateValuesWorker
+            self.similar_values_worker = DuplicateValuesWorker(self.project_path, base_lang)
+            self.similar_values_worker.finished.connect(self.on_duplicate_values_finished)
+        else:
+            from workers.similar_values_worker import SimilarValuesWorker
+            self.similar_values_worker = SimilarValuesWorker(self.project_path, base_lang)
+            self.similar_values_worker.finished.connect(self.on_similar_values_finished)
+        self.similar_values_worker.progress.connect(self.on_similar_values_progress)
+        self.similar_values_worker.progress_state.connect(self.on_progress_state)
+        self.similar_values_worker.start(owner=self.similar_values_tab)
+        
+        # 同步刷新引用索引，合并建议按引用次数给出
+        self.refresh_key_usage_index()
+    
+    def on_similar_values_progress(self, message: str):
+        """相似文案查找进度更新"""
+        self.similar_values_tab.find_log_text.append(message)
+    
+    def on_similar_values_finished(self, success: bool, message: str, candidates: dict):
+        """相似文案查找完成"""
+        self.similar_values_tab.find_btn.setEnabled(True)
+        self.similar_values_tab.find_log_text.append(message)
+        
+        if success:
+            with span('render', 'SimilarValuesTab', pairs=len(candidates['pairs'])):
+                self.similar_values_tab.update_results(candidates)
+            groups = len(self.similar_values_tab.groups)
+            if groups:
+                Toast.show_toast(self, f"✅ 找到 {groups} 组相似文案", 2000)
+            else:
+                Toast.show_toast(self, "✅ 没有相似的文案", 2000)
+        else:
+            Toast.show_toast(self, f"❌ {message}", 2000)
+    
+    def on_duplicate_values_finished(self, success: bool, message: str, groups: list):
+        """重复文案（value 完全相同）查找完成"""
+        self.similar_values_tab.find_btn.setEnabled(True)
+        self.similar_values_tab.find_log_text.append(message)
+        
+        if success:
+            with span('render', 'SimilarValuesTab', groups=len(groups)):
+                self.similar_values_tab.update_exact_results(groups)
+            if groups:
+                Toast.show_toast(self, f"✅ 找到 {len(groups)} 组重复文案", 2000)
+            else:
+                Toast.show_toast(self, "✅ 没有重复的文案", 2000)
+        else:
+            Toast.show_toast(self, f"❌ {message}", 2000)
     
     # ============ 字符串替换相关方法 ============
     
@@ -600,17 +1088,20 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.replace_tab.scan_btn.setEnabled(False)
         
+        from workers.string_replace_worker import ScanStringsWorker
         # 创建 Worker
         self.scan_strings_worker = ScanStringsWorker(
             self.project_path,
             keys,
             scan_oc,
             scan_swift,
-            case_sensitive
+            case_sensitive,
+            git_ref=self.get_git_ref()
         )
         self.scan_strings_worker.progress.connect(self.on_scan_strings_progress)
+        self.scan_strings_worker.progress_state.connect(self.on_progress_state)
         self.scan_strings_worker.finished.connect(self.on_scan_strings_finished)
-        self.scan_strings_worker.start()
+        self.scan_strings_worker.start(owner=self.replace_tab)
     
     def on_scan_strings_progress(self, message: str):
         """扫描字符串进度更新"""
@@ -622,43 +1113,39 @@ class MainWindow(QMainWindow):
         self.replace_tab.scan_btn.setEnabled(True)
         
         if success:
-            self.replace_tab.update_results(results)
+            with span('render', 'ReplaceTab', rows=len(results)):
+                self.replace_tab.update_results(results)
             if mismatch_keys:
                 self.replace_tab.mismatch_text.setPlainText('\n'.join(mismatch_keys))
+            ambiguous_count = self.replace_tab.ambiguous_count()
+            if ambiguous_count:
+                Toast.show_toast(self, f"⚠ {ambiguous_count} 处 value 对应多个 Key，替换前请核对标记 ⚠ 的行", 3000)
         else:
             Toast.show_toast(self, message, 2000)
     
     def replace_strings(self):
-        """替换字符串"""
+        """替换字符串（使用最近一次的扫描结果）"""
         if not self.project_path:
             return
         
-        # 获取 Key 列表
-        key_text = self.replace_tab.key_input.toPlainText()
-        keys = [k.strip() for k in key_text.split('\n') if k.strip()]
-        
-        if not keys:
+        results = self.replace_tab.results
+        if not results:
             return
         
-        # 获取配置
-        scan_oc = self.replace_tab.scan_oc_checkbox.isChecked()
-        scan_swift = self.replace_tab.scan_swift_checkbox.isChecked()
-        case_sensitive = self.replace_tab.case_sensitive_checkbox.isChecked()
+        ambiguous_count = self.replace_tab.ambiguous_count()
+        if ambiguous_count:
+            print(f"⚠ {ambiguous_count} 处 value 对应多个 Key，按 Key 列表中靠前的 Key 替换")
         
         # 禁用按钮
         self.replace_tab.replace_btn.setEnabled(False)
         
+        from workers.string_replace_worker import ReplaceStringsWorker
         # 创建 Worker
-        self.replace_strings_worker = ReplaceStringsWorker(
-            self.project_path,
-            keys,
-            scan_oc,
-            scan_swift,
-            case_sensitive
-        )
+        self.replace_strings_worker = ReplaceStringsWorker(results)
         self.replace_strings_worker.progress.connect(self.on_replace_strings_progress)
+        self.replace_strings_worker.progress_state.connect(self.on_progress_state)
         self.replace_strings_worker.finished.connect(self.on_replace_strings_finished)
-        self.replace_strings_worker.start()
+        self.replace_strings_worker.start(owner=self.replace_tab)
     
     def on_replace_strings_progress(self, message: str):
         """替换进度更新"""
@@ -668,6 +1155,10 @@ class MainWindow(QMainWindow):
         """替换完成"""
         self.replace_tab.replace_btn.setEnabled(True)
         Toast.show_toast(self, message, 2000)
+        if success:
+            # 文件已修改，旧的扫描结果（行号）不再有效，需要重新扫描后再替换
+            self.replace_tab.results = []
+            self.replace_tab.replace_btn.setVisible(False)
     
     # ============ 提取 Key 相关方法 ============
     
@@ -684,11 +1175,13 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.extract_keys_tab.extract_btn.setEnabled(False)
         
+        from workers.extract_keys_worker import ExtractKeysWorker
         # 创建 Worker
         self.extract_keys_worker = ExtractKeysWorker(self.project_path, language)
         self.extract_keys_worker.progress.connect(self.on_extract_keys_progress)
+        self.extract_keys_worker.progress_state.connect(self.on_progress_state)
         self.extract_keys_worker.finished.connect(self.on_extract_keys_finished)
-        self.extract_keys_worker.start()
+        self.extract_keys_worker.start(owner=self.extract_keys_tab)
     
     def on_extract_keys_progress(self, message: str):
         """提取进度更新"""
@@ -750,7 +1243,6 @@ class MainWindow(QMainWindow):
         
         compare_mode = self.length_compare_tab.get_compare_mode()
         base_lang = self.length_compare_tab.get_base_lang() if compare_mode == "base_lang" else None
-        min_diff_percent = self.length_compare_tab.get_min_diff_percent()
         
         # 清空日志
         self.length_compare_tab.compare_log_text.clear()
@@ -759,17 +1251,21 @@ class MainWindow(QMainWindow):
         # 禁用按钮
         self.length_compare_tab.compare_btn.setEnabled(False)
         
-        # 创建 Worker
+        from workers.length_compare_worker import LengthCompareWorker
+        # 创建 Worker（返回全部变长字段，阈值由 Tab 在内存中过滤，调整阈值不必重新对比）
         self.length_compare_worker = LengthCompareWorker(
             self.project_path,
             target_languages,
             compare_mode,
-            base_lang,
-            min_diff_percent
+            base_lang
         )
         self.length_compare_worker.progress.connect(self.on_length_compare_progress)
+        self.length_compare_worker.progress_state.connect(self.on_progress_state)
         self.length_compare_worker.finished.connect(self.on_length_compare_finished)
-        self.length_compare_worker.start()
+        self.length_compare_worker.start(owner=self.length_compare_tab)
+        
+        # 同步刷新引用索引，结果表格直接查询
+        self.refresh_key_usage_index()
     
     def on_length_compare_progress(self, message: str):
         """长度对比进度更新"""
@@ -781,9 +1277,11 @@ class MainWindow(QMainWindow):
         self.length_compare_tab.compare_log_text.append(message)
         
         if success:
-            self.length_compare_tab.update_results(results)
-            if results:
-                Toast.show_toast(self, f"✅ {message}", 2000)
+            with span('render', 'LengthCompareTab', rows=len(results)):
+                self.length_compare_tab.update_results(results)
+            shown = len(self.length_compare_tab.results)
+            if shown:
+                Toast.show_toast(self, f"✅ 对比完成，发现 {shown} 个变长的字段", 2000)
             else:
                 Toast.show_toast(self, "✅ 未发现变长的字段", 2000)
         else:
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能面板
+按 span 汇总耗时（次数 / 总耗时 / 最大耗时 / 计数），可导出 Chrome Trace；
+开启内存分析后按操作显示峰值内存和主要分配位置
+"""
+
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QTabWidget, QWidget
+)
+from PyQt6.QtCore import Qt
+
+from utils.config import ConfigManager
+from utils.perf import MemoryProfiler, PerfRecorder, format_counters
+from utils.theme import get_theme_colors
+from utils.toast import Toast
+
+
+class PerfPanel(QDialog):
+    """性能面板（非模态，可以一边操作一边刷新）"""
+
+    HEADERS = ["Span", "次数", "总耗时 (ms)", "最大 (ms)", "计数"]
+    MEMORY_HEADERS = ["操作", "峰值 (MB)", "峰值阶段", "当前 (MB)", "快照数"]
+    ALLOCATOR_HEADERS = ["分配位置", "增长 (KB)", "分配次数"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.colors = get_theme_colors()
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        self.setWindowTitle("性能")
+        self.setMinimumSize(760, 420)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(10)
+
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet(f"color: {self.colors['text_secondary']}; font-size: 12px;")
+        layout.addWidget(self.summary_label)
+
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs, 1)
+
+        # 耗时
+        self.table = self.create_table(self.HEADERS, stretch_column=4)
+        self.tabs.addTab(self.table, "耗时")
+
+        # 内存：上面按操作汇总，下面是选中操作峰值时的主要分配位置
+        memory_tab = QWidget()
+        memory_layout = QVBoxLayout(memory_tab)
+        memory_layout.setContentsMargins(0, 8, 0, 0)
+        self.memory_checkbox = QCheckBox("开启内存分析（tracemalloc，每个阶段结束时拍快照，运行会明显变慢）")
+        self.memory_checkbox.setChecked(MemoryProfiler.active)
+        self.memory_checkbox.toggled.connect(self.toggle_memory_profiling)
+        memory_layout.addWidget(self.memory_checkbox)
+        self.memory_table = self.create_table(self.MEMORY_HEADERS, stretch_column=2)
+        self.memory_table.itemSelectionChanged.connect(self.show_allocators)
+        memory_layout.addWidget(self.memory_table, 1)
+        self.allocator_table = self.create_table(self.ALLOCATOR_HEADERS, stretch_column=0)
+        memory_layout.addWidget(self.allocator_table, 1)
+        self.tabs.addTab(memory_tab, "内存")
+
+        button_layout = QHBoxLayout()
+        clear_btn = QPushButton("清空")
+        clear_btn.clicked.connect(self.clear)
+        button_layout.addWidget(clear_btn)
+
+        button_layout.addStretch()
+
+        export_memory_btn = QPushButton("导出内存报告")
+        export_memory_btn.clicked.connect(self.export_memory_report)
+        button_layout.addWidget(export_memory_btn)
+
+        refresh_btn = QPushButton("刷新")
+        refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_btn)
+
+        export_btn = QPushButton("导出 Chrome Trace")
+        export_btn.clicked.connect(self.export_trace)
+        button_layout.addWidget(export_btn)
+        layout.addLayout(button_layout)
+
+    @staticmethod
+    def create_table(headers: list, stretch_column: int) -> QTableWidget:
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table.verticalHeader().setVisible(False)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(stretch_column, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    @staticmethod
+    def fill_row(table: QTableWidget, row: int, values: list, numeric_columns: tuple):
+        for column, value in enumerate(values):
+            cell = QTableWidgetItem(value)
+            if column in numeric_columns:
+                cell.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            table.setItem(row, column, cell)
+
+    def refresh(self):
+        self.refresh_timing()
+        self.refresh_memory()
+
+    def refresh_timing(self):
+        summary = PerfRecorder.summarize()
+        self.table.setRowCount(len(summary))
+        for row, (label, item) in enumerate(summary.items()):
+            values = [
+                label,
+                str(item['count']),
+                f"{item['total_ms']:.1f}",
+                f"{item['max_ms']:.1f}",
+                format_counters(item['counters']),
+            ]
+            self.fill_row(self.table, row, values, (1, 2, 3))
+
+        span_count = sum(item['count'] for item in summary.values())
+        self.summary_label.setText(f"共 {span_count} 个 span，{len(summary)} 类（按总耗时排序）")
+
+    def refresh_memory(self):
+        self.memory_summary = MemoryProfiler.summarize()
+        self.memory_table.setRowCount(len(self.memory_summary))
+        for row, (operation, item) in enumerate(self.memory_summary.items()):
+            values = [
+                operation,
+                f"{item['peak'] / (1024 * 1024):.1f}",
+                item['peak_phase'],
+                f"{item['current'] / (1024 * 1024):.1f}",
+                str(item['snapshots']),
+            ]
+            self.fill_row(self.memory_table, row, values, (1, 3, 4))
+        self.allocator_table.setRowCount(0)
+
+    def show_allocators(self):
+        """显示选中操作峰值那次快照的主要分配位置"""
+        self.allocator_table.setRowCount(0)
+        row = self.memory_table.currentRow()
+        if row < 0:
+            return
+        operation = self.memory_table.item(row, 0).text()
+        item = self.memory_summary.get(operation)
+        if not item:
+            return
+
+        record = None
+        for candidate in MemoryProfiler.records():
+            if candidate['operation'] == operation and candidate['phase'] == item['peak_phase'] \
+                    and candidate['peak'] == item['peak']:
+                record = candidate
+        if record is None:
+            return
+
+        self.allocator_table.setRowCount(len(record['top']))
+        for top_row, (location, size, count) in enumerate(record['top']):
+            self.fill_row(self.allocator_table, top_row, [location, f"{size / 1024:+.1f}", f"{count:+d}"], (1, 2))
+
+    def toggle_memory_profiling(self, checked: bool):
+        if checked:
+            MemoryProfiler.start()
+        else:
+            MemoryProfiler.stop()
+
+    def clear(self):
+        PerfRecorder.clear()
+        MemoryProfiler.clear()
+        self.refresh()
+
+    def export_trace(self):
+        default_path = os.path.join(ConfigManager.get_export_path(), "trace.json")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出 Chrome Trace", default_path, "Trace JSON (*.json)"
+        )
+        if not file_path:
+            return
+
+        try:
+            count = PerfRecorder.export_chrome_trace(file_path)
+            Toast.show_toast(self, f"✅ 已导出 {count} 个 span，可在 ui.perfetto.dev 打开", 2500)
+        except Exception as e:
+            Toast.show_toast(self, f"导出失败: {e}", 2000)
+
+    def export_memory_report(self):
+        if not MemoryProfiler.records():
+            Toast.show_toast(self, "没有内存记录，请先开启内存分析并执行操作", 2000)
+            return
+
+        default_path = os.path.join(ConfigManager.get_export_path(), "memory_report.json")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出内存报告", default_path, "JSON (*.json)"
+        )
+        if not file_path:
+            return
+
+        try:
+            count = MemoryProfiler.export_report(file_path)
+            Toast.show_toast(self, f"✅ 已导出 {count} 条内存记录", 2000)
+        except Exception as e:
+            Toast.show_toast(self, f"导出失败: {e}", 2000)
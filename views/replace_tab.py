@@ -20,6 +20,7 @@ class ReplaceTab(QWidget):
     def __init__(self):
         super().__init__()
         self.colors = get_theme_colors()
+        self.results = []  # 最近一次扫描结果，替换时使用
         self.init_ui()
     
     def init_ui(self):
@@ -205,14 +206,20 @@ class ReplaceTab(QWidget):
         
         main_layout.addWidget(splitter)
     
+    def ambiguous_count(self) -> int:
+        """扫描结果中 value 对应多个 key 的数量"""
+        return sum(1 for item in self.results if item.get('ambiguous_keys'))
+    
     def update_results(self, results: list):
         """更新扫描结果
         
         Args:
             results: [{'file': path, 'line': num, 'original': str, 'key': str}, ...]
+                value 对应多个 key 时还有 'ambiguous_keys': [其他候选 key]
         """
         from PyQt6.QtGui import QColor, QBrush
         
+        self.results = results or []
         self.result_table.setRowCount(0)
         
         if not results:
@@ -225,7 +232,11 @@ class ReplaceTab(QWidget):
             return
         
         # 显示统计
-        self.result_stats.setText(f"⚠️ 发现 {len(results)} 处需要替换")
+        ambiguous_count = self.ambiguous_count()
+        if ambiguous_count:
+            self.result_stats.setText(f"⚠️ 发现 {len(results)} 处需要替换 • {ambiguous_count} 处 value 对应多个 Key")
+        else:
+            self.result_stats.setText(f"⚠️ 发现 {len(results)} 处需要替换")
         self.result_stats.setStyleSheet(
             f"font-size: 12px; color: {self.colors['warning']}; padding: 6px 12px; "
             f"background: {self.colors['bg_secondary']}; border-radius: 4px; font-weight: 500;"
@@ -255,6 +266,13 @@ class ReplaceTab(QWidget):
             key_item = QTableWidgetItem(item.get('key', ''))
             key_item.setBackground(QBrush(QColor("#E8F5E9")))
             key_item.setForeground(QBrush(QColor("#2E7D32")))
+            ambiguous_keys = item.get('ambiguous_keys')
+            if ambiguous_keys:
+                # 多个 key 的 value 相同，替换结果取决于 Key 列表的顺序，需要人工确认
+                key_item.setText(f"⚠ {item.get('key', '')}")
+                key_item.setBackground(QBrush(QColor("#FFF3E0")))
+                key_item.setForeground(QBrush(QColor("#E65100")))
+                key_item.setToolTip("该 value 还对应：" + "、".join(ambiguous_keys))
             self.result_table.setItem(row, 3, key_item)
         
         # 显示替换按钮
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相似文案标签页
+列出基准语言中完全相同，或仅大小写、标点、个别单词不同的 value，按引用次数给出合并建议
+"""
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QComboBox, QPushButton, QGroupBox, QSpinBox,
+    QTreeWidget, QTreeWidgetItem, QSplitter,
+    QHeaderView, QApplication
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor, QBrush, QFont
+from models.near_duplicates import MIN_SIMILARITY, NearDuplicateFinder
+from utils.theme import get_theme_colors
+from views.key_usage_panel import KeyUsagePanel
+from views.log_view import LogView
+
+
+class SimilarValuesTab(QWidget):
+    """相似文案标签页"""
+
+    def __init__(self):
+        super().__init__()
+        self.colors = get_theme_colors()
+        self.candidates = None    # SimilarValuesWorker 的结果 {'nodes', 'pairs'}
+        self.exact_groups = None  # DuplicateValuesWorker 的结果（value 完全相同的分组）
+        self.groups = []          # 当前显示的分组
+        self.init_ui()
+
+    def init_ui(self):
+        # 主布局 - 水平分割
+        main_layout = QHBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(16)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # ============ 左侧：配置区域 ============
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setSpacing(16)
+
+        desc_label = QLabel(
+            "查找基准语言中 value 完全相同，或仅大小写、标点、个别单词不同（如 \"Cancel\"、\"cancel\"、\"Cancel.\"）的 key，"
+            "这些 key 通常可以合并。每组中引用最多的 key 标记为建议保留。"
+        )
+        desc_label.setStyleSheet(
+            f"color: {self.colors['text_secondary']}; font-size: 12px; padding: 8px 0;"
+        )
+        desc_label.setWordWrap(True)
+        left_layout.addWidget(desc_label)
+
+        # 配置
+        config_group = QGroupBox("查找配置")
+        config_layout = QVBoxLayout()
+        config_layout.setSpacing(8)
+
+        base_lang_hint = QLabel("基准语言：")
+        base_lang_hint.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        config_layout.addWidget(base_lang_hint)
+
+        self.base_lang_combo = QComboBox()
+        self.base_lang_combo.setMinimumHeight(28)
+        config_layout.addWidget(self.base_lang_combo)
+
+        mode_hint = QLabel("查找方式：")
+        mode_hint.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        config_layout.addWidget(mode_hint)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["相似（忽略大小写、标点、个别单词）", "完全相同"])
+        self.mode_combo.setMinimumHeight(28)
+        self.mode_combo.currentIndexChanged.connect(self.on_mode_changed)
+        config_layout.addWidget(self.mode_combo)
+
+        threshold_hint = QLabel("相似度阈值（调整后立即重新分组，不必重新查找）：")
+        threshold_hint.setStyleSheet(f"color: {self.colors['text_tertiary']}; font-size: 11px;")
+        threshold_hint.setWordWrap(True)
+        config_layout.addWidget(threshold_hint)
+
+        self.threshold_spinbox = QSpinBox()
+        self.threshold_spinbox.setRange(int(MIN_SIMILARITY * 100), 100)
+        self.threshold_spinbox.setValue(80)
+        self.threshold_spinbox.setSuffix("%")
+        self.threshold_spinbox.setMinimumHeight(28)
+        config_layout.addWidget(self.threshold_spinbox)
+
+        config_group.setLayout(config_layout)
+        left_layout.addWidget(config_group)
+
+        # 连续调整阈值时合并为一次重新分组
+        self.threshold_timer = QTimer(self)
+        self.threshold_timer.setSingleShot(True)
+        self.threshold_timer.setInterval(150)
+        self.threshold_timer.timeout.connect(self.apply_threshold)
+        self.threshold_spinbox.valueChanged.connect(self.threshold_timer.start)
+
+        # 查找按钮
+        self.find_btn = QPushButton("🧬 开始查找")
+        self.find_btn.setMinimumHeight(40)
+        self.find_btn.setEnabled(False)
+        left_layout.addWidget(self.find_btn)
+
+        # 日志
+        log_group = QGroupBox("查找日志")
+        log_layout = QVBoxLayout()
+        log_layout.setContentsMargins(8, 8, 8, 8)
+
+        self.find_log_text = LogView()
+        self.find_log_text.setPlaceholderText("点击上方按钮开始查找...")
+        self.find_log_text.setStyleSheet("font-size: 11px;")
+        log_layout.addWidget(self.find_log_text)
+
+        log_group.setLayout(log_layout)
+        left_layout.addWidget(log_group, 1)
+
+        # ============ 右侧：结果区域 ============
+        right_widget = QWidget()
+        right_layout = QVBoxLayout(right_widget)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout.setSpacing(8)
+
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(12)
+
+        result_label = QLabel("合并候选")
+        result_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {self.colors['text_primary']};")
+        header_layout.addWidget(result_label)
+
+        self.stats_label = QLabel("尚未查找")
+        self.stats_label.setStyleSheet(
+            f"font-size: 12px; color: {self.colors['text_secondary']}; padding: 6px 12px; "
+            f"background: {self.colors['bg_secondary']}; border-radius: 4px;"
+        )
+        header_layout.addWidget(self.stats_label)
+        header_layout.addStretch()
+
+        right_layout.addLayout(header_layout)
+
+        # 分组结果：组 → key
+        self.result_tree = QTreeWidget()
+        self.result_tree.setColumnCount(3)
+        self.result_tree.setHeaderLabels(["Key", "Value", "引用次数"])
+        self.result_tree.setAlternatingRowColors(True)
+        self.result_tree.setToolTip("💡 双击复制 Key / Value")
+        header = self.result_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.result_tree.setColumnWidth(0, 260)
+        self.result_tree.currentItemChanged.connect(self.on_current_item_changed)
+        self.result_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        right_layout.addWidget(self.result_tree, 1)
+
+        # 选中 key 的代码引用
+        self.usage_panel = KeyUsagePanel()
+        right_layout.addWidget(self.usage_panel)
+
+        splitter.addWidget(left_widget)
+        splitter.addWidget(right_widget)
+        splitter.setSizes([300, 700])
+
+        main_layout.addWidget(splitter)
+
+    def update_languages(self, languages: list):
+        """更新语言列表"""
+        self.base_lang_combo.clear()
+        self.base_lang_combo.addItems(languages)
+
+        # 默认选择 en（如果存在）
+        if 'en' in languages:
+            self.base_lang_combo.setCurrentIndex(languages.index('en'))
+
+    def get_base_lang(self) -> str:
+        """获取基准语言"""
+        return self.base_lang_combo.currentText()
+
+    def is_exact_mode(self) -> bool:
+        """是否只查找 value 完全相同的 key"""
+        return self.mode_combo.currentIndex() == 1
+
+    def on_mode_changed(self, index: int):
+        """切换查找方式：阈值只对相似查找有效，显示该方式上一次的结果"""
+        self.threshold_spinbox.setEnabled(not self.is_exact_mode())
+        if (self.exact_groups if self.is_exact_mode() else self.candidates) is None:
+            self.groups = []
+            self.result_tree.clear()
+            self.stats_label.setText("尚未查找")
+            self.stats_label.setStyleSheet(
+                f"font-size: 12px; color: {self.colors['text_secondary']}; padding: 6px 12px; "
+                f"background: {self.colors['bg_secondary']}; border-radius: 4px;"
+            )
+            return
+        self.apply_threshold()
+
+    def usage_count(self, key: str) -> int:
+        """key 在代码中的引用次数（引用索引尚未建立时为 0）"""
+        usage_index = self.usage_panel.usage_index
+        return usage_index.usage_count(key) if usage_index is not None else 0
+
+    def update_results(self, candidates: dict):
+        """更新相似查找结果（未分组的候选），按当前阈值分组显示"""
+        self.candidates = candidates
+        self.apply_threshold()
+
+    def update_exact_results(self, groups: list):
+        """更新完全相同的查找结果"""
+        self.exact_groups = groups
+        self.apply_threshold()
+
+    def apply_threshold(self):
+        """按当前查找方式和阈值在内存中重新分组并显示（引用索引刷新后也会调用以更新引用次数）"""
+        if self.is_exact_mode():
+            if self.exact_groups is None:
+                return
+            self.groups = self.exact_groups
+        else:
+            if not self.candidates:
+                return
+            threshold = self.threshold_spinbox.value() / 100
+            self.groups = NearDuplicateFinder.group(self.candidates['nodes'], self.candidates['pairs'], threshold)
+        self.render_groups()
+
+    def render_groups(self):
+        """填充分组树"""
+        self.result_tree.clear()
+
+        if not self.groups:
+            self.stats_label.setText("✅ 没有重复的文案" if self.is_exact_mode() else "✅ 没有相似的文案")
+            self.stats_label.setStyleSheet(
+                f"font-size: 13px; color: {self.colors['success']}; padding: 10px; "
+                f"background: {self.colors['bg_secondary']}; border-radius: 6px; font-weight: 500;"
+            )
+            return
+
+        key_count = sum(len(group['items']) for group in self.groups)
+        self.stats_label.setText(f"⚠️ {len(self.groups)} 组 • {key_count} 个 key 可合并")
+        self.stats_label.setStyleSheet(
+            f"font-size: 13px; color: {self.colors['warning']}; padding: 10px; "
+            f"background: {self.colors['bg_secondary']}; border-radius: 6px; font-weight: 500;"
+        )
+
+        bold = QFont()
+        bold.setBold(True)
+        secondary = QBrush(QColor(self.colors['text_secondary']))
+        for group in self.groups:
+            counts = {key: self.usage_count(key) for key, _ in group['items']}
+            keep = max(group['items'], key=lambda item: (counts[item[0]], -len(item[0])))[0]
+
+            if self.is_exact_mode():
+                title = f"{len(group['items'])} 个 key · value 完全相同"
+            elif group['similarity'] >= 1.0:
+                title = f"{len(group['items'])} 个 key · 仅大小写 / 标点不同"
+            else:
+                title = f"{len(group['items'])} 个 key · 相似度 ≥ {group['similarity'] * 100:.0f}%"
+            group_item = QTreeWidgetItem([title, "", str(sum(counts.values()))])
+            group_item.setFont(0, bold)
+            group_item.setForeground(1, secondary)
+
+            for key, value in group['items']:
+                child = QTreeWidgetItem([key, value, str(counts[key])])
+                child.setData(0, Qt.ItemDataRole.UserRole, key)
+                child.setToolTip(1, value)
+                child.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
+                if key == keep:
+                    child.setText(0, f"★ {key}")
+                    child.setToolTip(0, "建议保留：组内引用最多")
+                    child.setFont(0, bold)
+                    child.setForeground(0, QBrush(QColor(self.colors['success'])))
+                group_item.addChild(child)
+
+            self.result_tree.addTopLevelItem(group_item)
+            group_item.setExpanded(True)
+
+    def on_current_item_changed(self, current: QTreeWidgetItem, previous: QTreeWidgetItem):
+        """选中 key 时在引用面板中显示它的代码引用"""
+        if current is None:
+            return
+        key = current.data(0, Qt.ItemDataRole.UserRole)
+        if key:
+            self.usage_panel.show_key(key)
+
+    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+        """双击复制 Key / Value"""
+        key = item.data(0, Qt.ItemDataRole.UserRole)
+        if not key:
+            return
+        QApplication.clipboard().setText(key if column == 0 else item.text(column))
@@ -1,24 +1,39 @@
 # Workers module
-from .base_worker import BaseWorker
-from .scan_worker import ScanDuplicatesWorker
-from .deduplicate_worker import DeduplicateWorker
-from .import_worker import ImportWorker
-from .string_replace_worker import ScanStringsWorker, ReplaceStringsWorker
-from .export_worker import ExportWorker
-from .compare_worker import CompareWorker
-from .extract_keys_worker import ExtractKeysWorker
-from .length_compare_worker import LengthCompareWorker
+# 各 worker 模块（及其依赖的解析器、序列化器）在第一次访问时才导入，启动时不加载
+_LAZY_EXPORTS = {
+    'WorkerPool': '.worker_pool',
+    'BaseWorker': '.base_worker',
+    'ScanDuplicatesWorker': '.scan_worker',
+    'DeduplicateWorker': '.deduplicate_worker',
+    'ImportWorker': '.import_worker',
+    'ScanStringsWorker': '.string_replace_worker',
+    'ReplaceStringsWorker': '.string_replace_worker',
+    'ExportWorker': '.export_worker',
+    'MissingKeysExportWorker': '.export_worker',
+    'CompareWorker': '.compare_worker',
+    'ExtractKeysWorker': '.extract_keys_worker',
+    'LengthCompareWorker': '.length_compare_worker',
+    'FormatCheckWorker': '.format_check_worker',
+    'SimilarValuesWorker': '.similar_values_worker',
+    'DuplicateValuesWorker': '.duplicate_values_worker',
+    'KeyUsageIndexWorker': '.key_usage_worker',
+    'TranslationMemoryWorker': '.translation_memory_worker',
+    'WriteTranslationsWorker': '.translation_memory_worker',
+    'LengthResultExportWorker': '.length_export_worker',
+    'CatalogSheetExportWorker': '.catalog_sheet_worker',
+    'CatalogSheetImportWorker': '.catalog_sheet_worker',
+    'ImportDryRunWorker': '.import_dry_run_worker',
+    'ZipIndexWorker': '.zip_index_worker',
+}
 
-__all__ = [
-    'BaseWorker',
-    'ScanDuplicatesWorker', 
-    'DeduplicateWorker', 
-    'ImportWorker',
-    'ScanStringsWorker',
-    'ReplaceStringsWorker',
-    'ExportWorker',
-    'CompareWorker',
-    'ExtractKeysWorker',
-    'LengthCompareWorker'
-]
 
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_LAZY_EXPORTS)
@@ -2,30 +2,139 @@
 # -*- coding: utf-8 -*-
 """
 Worker 基类
-提供公共功能和统一的错误处理
+提供公共功能和统一的错误处理；在共享线程池（WorkerPool）上执行
 """
 
 import os
-from typing import List, Optional, Dict
-from PyQt6.QtCore import QThread, pyqtSignal
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Set, Tuple
+from PyQt6.QtCore import QObject, pyqtSignal
 
-from models import ProjectInfoExtractor
-from utils.constants import DEFAULT_IGNORE_FOLDERS
+from models import LocalizationParser, ProjectInfoExtractor, XCStringsParser, ValueIndex
+from models.analysis_cache import AnalysisCache
+from models.cancellation import OperationCancelled
+from models.scan_cache import ScanResultCache
+from utils.constants import DEFAULT_IGNORE_FOLDERS, PROGRESS_EMIT_INTERVAL
+from utils import git_utils
+from utils import perf
+from workers.worker_pool import PRIORITY_NORMAL, WorkerPool
 
 
-class BaseWorker(QThread):
-    """Worker 基类，提供公共功能"""
+class BaseWorker(QObject):
+    """Worker 基类，提供公共功能
     
-    # 统一的进度信号
+    保留 QThread 风格的 start() / isRunning() / wait() / stop()，
+    但 run() 在共享线程池的常驻线程上执行，不再每次新建线程。
+    只读的分析类 worker 实现 job_key()，相同任务执行中时合并为一个
+    """
+    
+    # 调度优先级（见 worker_pool），后台任务覆盖为 PRIORITY_BACKGROUND
+    PRIORITY = PRIORITY_NORMAL
+    
+    # 统一的进度信号：文字日志（阶段开始/结束、警告等，低频）
     progress = pyqtSignal(str)
     
+    # 结构化进度：{'phase', 'done', 'total', 'bytes', 'eta'}，由 report_progress 限频发送
+    progress_state = pyqtSignal(dict)
+    
     # 注意：finished 信号由各子类自己定义，因为不同 worker 需要不同的参数类型
+    # RESULT_TYPES 声明 finished 中 success、message 之后各参数的类型（emit_failed 用它们的空值补齐）
+    RESULT_TYPES = ()
     
-    def __init__(self, project_path: str = None, ignore_folders: List[str] = None):
+    def __init__(self, project_path: str = None, ignore_folders: List[str] = None, git_ref: str = None):
         super().__init__()
         self.project_path = project_path
         self.ignore_folders = ignore_folders or DEFAULT_IGNORE_FOLDERS.copy()
+        self.git_ref = git_ref.strip() if git_ref else None  # 只扫描相对该 ref 变更的文件
         self._should_stop = False
+        self._running = False
+        self._done = threading.Event()
+        self._progress_phase = None
+        self._progress_started = 0.0
+        self._progress_emitted = 0.0
+    
+    def run(self):
+        """子类实现具体工作，在池线程中执行"""
+        raise NotImplementedError
+    
+    def start(self, owner=None, priority: Optional[int] = None):
+        """提交到共享线程池排队执行
+        
+        Args:
+            owner: 发起任务的 Tab，可见时优先执行
+            priority: 默认取 PRIORITY
+        """
+        self._running = True
+        self._done.clear()
+        WorkerPool.instance().submit(self, owner, priority)
+    
+    def job_key(self) -> Optional[tuple]:
+        """任务标识：相同标识的任务在排队 / 执行中时不重复执行，结果共享给所有发起者
+        
+        默认 None 表示不合并（会修改文件的 worker 保持默认）
+        """
+        return None
+    
+    def base_job_key(self, *params) -> tuple:
+        """job_key 的公共部分：worker 类型 + 项目路径 + git ref + 忽略目录，再加上子类参数"""
+        return (type(self).__name__, self.project_path, self.git_ref, tuple(self.ignore_folders)) + params
+    
+    def execute(self):
+        """由线程池调用（基准测试等场景可直接同步调用 run()）"""
+        try:
+            self.run()
+        finally:
+            self.mark_finished()
+    
+    def mark_finished(self):
+        """标记执行结束（被合并的任务在共享的任务结束时由调度器调用）"""
+        self._running = False
+        self._done.set()
+    
+    def isRunning(self) -> bool:
+        return self._running
+    
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        """阻塞等待执行结束，返回是否已结束"""
+        if not self._running:
+            return True
+        return self._done.wait(None if msecs is None else msecs / 1000)
+    
+    def span(self, name: str, **counters):
+        """计时 span，分类为 worker 类名（walk / read / parse / compute / emit 等）"""
+        return perf.span(name, type(self).__name__, **counters)
+    
+    def report_progress(self, phase: str, done: int, total: int = 0, bytes_done: int = 0):
+        """报告结构化进度（可在循环中每次调用）
+        
+        同一阶段内最多每 PROGRESS_EMIT_INTERVAL 秒发送一次，中间的调用直接丢弃；
+        阶段切换和完成（done >= total）时立即发送，保证 UI 最终显示的是准确值
+        """
+        now = time.monotonic()
+        if phase != self._progress_phase:
+            # 阶段切换即阶段边界：内存分析开启时记录上一阶段结束时的内存
+            if self._progress_phase is not None and perf.MemoryProfiler.active:
+                perf.MemoryProfiler.record(self._progress_phase, type(self).__name__)
+            self._progress_phase = phase
+            self._progress_started = now
+        elif now - self._progress_emitted < PROGRESS_EMIT_INTERVAL and not (total and done >= total):
+            return
+        self._progress_emitted = now
+        
+        eta = None
+        if total and 0 < done < total:
+            elapsed = now - self._progress_started
+            eta = elapsed / done * (total - done)
+        
+        self.progress_state.emit({
+            'phase': phase,
+            'done': done,
+            'total': total,
+            'bytes': bytes_done,
+            'eta': eta,
+        })
     
     def validate_project_path(self) -> bool:
         """验证项目路径（子类需要自己调用 finished.emit）"""
@@ -43,10 +152,12 @@ class BaseWorker(QThread):
     def find_lproj_folders(self) -> Optional[Dict[str, str]]:
         """查找所有 .lproj 文件夹（不带错误处理，由子类处理）"""
         try:
-            lproj_folders = ProjectInfoExtractor.find_lproj_folders(
-                self.project_path, 
-                self.ignore_folders
-            )
+            with self.span('walk') as counters:
+                lproj_folders = ProjectInfoExtractor.find_lproj_folders(
+                    self.project_path, 
+                    self.ignore_folders
+                )
+                counters['folders'] = len(lproj_folders)
             
             if not lproj_folders:
                 return None
@@ -56,16 +167,137 @@ class BaseWorker(QThread):
         except Exception as e:
             return None
     
+    def find_catalog_files(self) -> List[str]:
+        """查找所有 String Catalog（.xcstrings）文件"""
+        try:
+            with self.span('walk', target='xcstrings') as counters:
+                catalog_files = XCStringsParser.find_xcstrings_files(self.project_path, self.ignore_folders)
+                counters['files'] = len(catalog_files)
+            return catalog_files
+        except Exception as e:
+            return []
+    
+    def load_catalog_data(self, catalog_files: List[str]) -> Dict[str, OrderedDict]:
+        """流式读取所有 catalog，合并为 {lang_code: OrderedDict(key: value)}"""
+        catalog_data = {}
+        for catalog_file in catalog_files:
+            if self.check_stopped():
+                break
+            
+            self.progress.emit(f"正在读取 {os.path.basename(catalog_file)}...")
+            for lang_code, lang_data in XCStringsParser.load_languages(catalog_file, self.check_stopped).items():
+                merged = catalog_data.get(lang_code)
+                if merged is None:
+                    catalog_data[lang_code] = lang_data
+                else:
+                    merged.update(lang_data)
+        return catalog_data
+    
+    def load_all_lang_data(self, lproj_folders: Dict[str, str], catalog_files: List[str]) -> Tuple[tuple, Optional[Dict[str, dict]]]:
+        """读取所有语言的 strings 文件和 catalog，合并为 {lang_code: {key: value}}
+        
+        返回 (语言文件版本, 数据)，取消时数据为 None。语言文件没变时复用上次读取的数据
+        （长度对比、格式符检查等分析共享同一份），调用方只能读取不能修改
+        """
+        strings_files = [os.path.join(path, 'Localizable.strings') for path in lproj_folders.values()]
+        version = AnalysisCache.catalog_version(strings_files + list(catalog_files))
+        all_lang_data = AnalysisCache.get('lang_data', version)
+        if all_lang_data is not None:
+            self.progress.emit("✓ 语言文件未变化，复用已读取的数据")
+            return version, all_lang_data
+        
+        self.progress.emit("正在读取所有语言文件...")
+        all_lang_data = self.load_catalog_data(catalog_files)
+        
+        for lang_code, lproj_path in lproj_folders.items():
+            if self.check_stopped():
+                return version, None
+            
+            strings_file = os.path.join(lproj_path, 'Localizable.strings')
+            if os.path.exists(strings_file):
+                lang_data = LocalizationParser.parse_strings_file(strings_file, self.check_stopped)
+                if lang_code in all_lang_data:
+                    all_lang_data[lang_code].update(lang_data)
+                else:
+                    all_lang_data[lang_code] = lang_data
+                self.progress.emit(f"✓ 已读取 {lang_code}: {len(lang_data)} 个 key")
+        
+        if self.check_stopped():
+            return version, None
+        
+        # value → keys 索引随数据一起建立（重复文案分组直接使用，不再逐语言首次查询时建立）
+        with self.span('value_index', languages=len(all_lang_data)):
+            for lang_code, lang_data in all_lang_data.items():
+                index = ValueIndex(lang_data, should_stop=self.check_stopped)
+                AnalysisCache.put('value_index', version, lang_code, index, limit=len(all_lang_data))
+        
+        # 读取的数据占内存较多，只保留最新版本
+        AnalysisCache.put('lang_data', version, (), all_lang_data, limit=1)
+        return version, all_lang_data
+    
+    def load_value_index(self, version: tuple, all_lang_data: Dict[str, dict], lang_code: str) -> Optional[ValueIndex]:
+        """某个语言的 value → keys 索引（基于 load_all_lang_data 读取的数据）
+        
+        索引在 load_all_lang_data 读取数据时建立，这里通常直接命中缓存；
+        缓存被清空时补建。与读取的数据一样只保留最新版本；语言不存在时返回 None
+        """
+        lang_data = all_lang_data.get(lang_code)
+        if lang_data is None:
+            return None
+        index = AnalysisCache.get('value_index', version, lang_code)
+        if index is None:
+            with self.span('value_index', lang=lang_code, keys=len(lang_data)):
+                index = ValueIndex(lang_data, should_stop=self.check_stopped)
+            AnalysisCache.put('value_index', version, lang_code, index, limit=len(all_lang_data))
+        return index
+    
+    def resolve_changed_files(self) -> Optional[Set[str]]:
+        """解析相对 git_ref 变更的文件（绝对路径集合）
+        
+        未指定 git_ref 时返回 None（全量扫描）；git 不可用或 ref 无效时
+        抛出 ValueError，由子类统一走错误处理
+        """
+        if not self.git_ref:
+            return None
+        
+        self.progress.emit(f"正在获取相对 {self.git_ref} 的变更文件...")
+        changed_files = git_utils.get_changed_files(self.project_path, self.git_ref)
+        if changed_files is None:
+            raise ValueError(f"无法获取相对 {self.git_ref} 的变更（不是 git 仓库或 ref 无效）")
+        
+        self.progress.emit(f"✓ 相对 {self.git_ref} 共有 {len(changed_files)} 个变更文件")
+        return changed_files
+    
+    @staticmethod
+    def cached_file_result(namespace: str, file_path: str, changed_files: Optional[Set[str]]):
+        """按文件复用扫描结果（查重、对比、字符串扫描使用同一规则）
+        
+        - 缓存按 mtime/size 校验，文件没变时无论是否指定 git ref 都直接复用
+        - 指定 git ref 时，相对该 ref 有变更的文件总是重新解析，不使用缓存
+        
+        Returns:
+            缓存的结果，需要重新解析时返回 None（解析后由调用方写入 ScanResultCache）
+        """
+        if changed_files is not None and file_path in changed_files:
+            return None
+        return ScanResultCache.get(namespace, file_path)
+    
     def emit_error(self, operation: str, error: Exception):
         """统一的错误报告（子类需要自己实现 finished.emit）"""
+        if isinstance(error, OperationCancelled):
+            return str(error)
         error_msg = f"{operation}失败: {str(error)}"
         # 子类需要自己调用 finished.emit
         return error_msg
     
+    def emit_failed(self, message: str):
+        """发出失败的 finished，结果参数取 RESULT_TYPES 的空值"""
+        self.finished.emit(False, message, *(result_type() for result_type in self.RESULT_TYPES))
+    
     def stop(self):
         """停止工作线程"""
         self._should_stop = True
     
     def check_stopped(self) -> bool:
-        """检查是否应该停止"""
+        """检查是否应该停止（解析器 / 扫描器的内层循环也会定期调用）"""
         return self._should_stop
\ No newline at end of file
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+全量对照表工作线程
+导出：所有 key × 所有语言的一张表（openpyxl write-only）
+导入：read-only 流式读取编辑后的表，只收集有变化的值，每个语言文件按位置替换后一次写回
+"""
+
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import pyqtSignal
+
+from models import LocalizationParser
+from workers.base_worker import BaseWorker
+
+SHEET_TITLE = "多语言对照表"
+KEY_HEADER = "Key"
+
+
+class CatalogSheetExportWorker(BaseWorker):
+    """导出全量对照表"""
+    finished = pyqtSignal(bool, str, str)  # success, message, file_path
+    RESULT_TYPES = (str,)
+
+    def __init__(self, project_path: str, file_path: str, ignore_folders: list = None):
+        super().__init__(project_path, ignore_folders)
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            if not self.validate_project_path():
+                self.finished.emit(False, "项目路径无效", "")
+                return
+
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders()
+            if lproj_folders is None:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹", "")
+                return
+
+            # 1. 读取所有语言，key 按首次出现的顺序排列
+            languages = []
+            language_data = {}
+            all_keys = OrderedDict()
+            for lang_code in sorted(lproj_folders):
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", "")
+                    return
+
+                strings_file = os.path.join(lproj_folders[lang_code], 'Localizable.strings')
+                if not os.path.exists(strings_file):
+                    continue
+
+                data = LocalizationParser.parse_strings_file(strings_file, self.check_stopped)
+                languages.append(lang_code)
+                language_data[lang_code] = data
+                for key in data:
+                    all_keys[key] = None
+                self.progress.emit(f"✓ 已读取 {lang_code}: {len(data)} 个 key")
+
+            if not all_keys:
+                self.finished.emit(False, "没有可导出的多语言数据", "")
+                return
+
+            # 2. 逐行写出
+            self.progress.emit(f"正在写出 {len(all_keys)} 行...")
+            # openpyxl 导入较慢，只在导出 / 导入对照表时加载
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+            from openpyxl.utils import get_column_letter
+
+            wb = Workbook(write_only=True)
+            header_style = NamedStyle(name='sheet_header')
+            header_style.font = Font(bold=True, color="1D1D1F")
+            header_style.fill = PatternFill(start_color="F5F5F7", end_color="F5F5F7", fill_type="solid")
+            header_style.alignment = Alignment(horizontal="center", vertical="center")
+            wb.add_named_style(header_style)
+
+            ws = wb.create_sheet(SHEET_TITLE)
+            ws.freeze_panes = 'B2'
+            ws.column_dimensions['A'].width = 36
+            for col_num in range(2, len(languages) + 2):
+                ws.column_dimensions[get_column_letter(col_num)].width = 30
+
+            header = []
+            for title in [KEY_HEADER] + languages:
+                cell = WriteOnlyCell(ws, value=title)
+                cell.style = 'sheet_header'
+                header.append(cell)
+            ws.append(header)
+
+            for row_num, key in enumerate(all_keys, 1):
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", "")
+                    return
+                ws.append([key] + [language_data[lang].get(key) for lang in languages])
+                self.report_progress("写出对照表", row_num, len(all_keys))
+
+            self.progress.emit("正在保存...")
+            wb.save(self.file_path)
+
+            self.finished.emit(True, f"已导出 {len(all_keys)} 个 key × {len(languages)} 个语言", self.file_path)
+
+        except Exception as e:
+            error_msg = self.emit_error("导出对照表", e)
+            self.finished.emit(False, error_msg, "")
+
+
+class CatalogSheetImportWorker(BaseWorker):
+    """导入编辑后的对照表"""
+    finished = pyqtSignal(bool, str, dict)  # success, message, {lang_code: (updated, added)}
+    RESULT_TYPES = (dict,)
+
+    def __init__(self, project_path: str, file_path: str, ignore_folders: list = None):
+        super().__init__(project_path, ignore_folders)
+        self.file_path = file_path
+
+    def run(self):
+        wb = None
+        try:
+            if not self.validate_project_path():
+                self.finished.emit(False, "项目路径无效", {})
+                return
+
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders()
+            if lproj_folders is None:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹", {})
+                return
+
+            # read_only：按行流式读取，不在内存中构建整张表
+            from openpyxl import load_workbook
+            wb = load_workbook(self.file_path, read_only=True, data_only=True)
+            ws = wb.worksheets[0]
+            rows = ws.iter_rows(values_only=True)
+
+            header = next(rows, None)
+            if not header or str(header[0] or '').strip() != KEY_HEADER:
+                self.finished.emit(False, f"表格格式错误：第一列表头应为 {KEY_HEADER}", {})
+                return
+
+            # 表头语言列 → 项目语言文件
+            columns = []  # [(列序号, lang_code, strings_file)]
+            for col_index, title in enumerate(header[1:], 1):
+                lang_code = str(title or '').strip()
+                if not lang_code:
+                    continue
+                if lang_code not in lproj_folders:
+                    self.progress.emit(f"跳过: 项目中没有 {lang_code}.lproj")
+                    continue
+                strings_file = os.path.join(lproj_folders[lang_code], 'Localizable.strings')
+                if not os.path.exists(strings_file):
+                    self.progress.emit(f"跳过: {strings_file} 不存在")
+                    continue
+                columns.append((col_index, lang_code, strings_file))
+
+            if not columns:
+                self.finished.emit(False, "表格中没有与项目匹配的语言列", {})
+                return
+
+            # 当前值用于比对，只收集有变化的值
+            current_data = {}
+            for _, lang_code, strings_file in columns:
+                current_data[lang_code] = LocalizationParser.parse_strings_file(strings_file, self.check_stopped)
+
+            updates = {lang_code: OrderedDict() for _, lang_code, _ in columns}
+            row_count = 0
+            for row in rows:
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消，未写入任何文件", {})
+                    return
+
+                row_count += 1
+                self.report_progress("读取对照表", row_count)
+
+                if not row or row[0] is None:
+                    continue
+                key = str(row[0])
+
+                for col_index, lang_code, _ in columns:
+                    value = row[col_index] if col_index < len(row) else None
+                    # 空单元格表示不修改
+                    if value is None or value == '':
+                        continue
+                    value = str(value)
+                    if current_data[lang_code].get(key) != value:
+                        updates[lang_code][key] = value
+
+            # 每个文件只写一次
+            result = {}
+            for _, lang_code, strings_file in columns:
+                lang_updates = updates[lang_code]
+                if not lang_updates:
+                    continue
+                updated, added = LocalizationParser.patch_strings_file(strings_file, lang_updates)
+                result[lang_code] = (updated, added)
+                self.progress.emit(f"✓ {lang_code}: 修改 {updated} 条，新增 {added} 条")
+
+            if result:
+                total = sum(updated + added for updated, added in result.values())
+                message = f"导入完成，{len(result)} 个语言共 {total} 处变更"
+            else:
+                message = "导入完成，没有发现变更"
+            self.finished.emit(True, message, result)
+
+        except Exception as e:
+            error_msg = self.emit_error("导入对照表", e)
+            self.finished.emit(False, error_msg, {})
+        finally:
+            if wb is not None:
+                wb.close()
@@ -9,18 +9,56 @@ import os
 from typing import Dict, List
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser
+from models import LocalizationParser, XCStringsParser
+from models.analysis_cache import AnalysisCache
+from models.scan_cache import ScanResultCache
 from workers.base_worker import BaseWorker
-from PyQt6.QtCore import pyqtSignal
 
 
 class CompareWorker(BaseWorker):
     """对比工作线程"""
     finished = pyqtSignal(bool, str, dict)  # success, message, missing_keys
+    RESULT_TYPES = (dict,)
     
-    def __init__(self, project_path: str, base_lang: str, ignore_folders: List[str] = None):
-        super().__init__(project_path, ignore_folders)
+    def __init__(self, project_path: str, base_lang: str, ignore_folders: List[str] = None,
+                 git_ref: str = None):
+        super().__init__(project_path, ignore_folders, git_ref)
         self.base_lang = base_lang
+        self.changed_files = None
+        self.reused_count = 0
+    
+    def job_key(self):
+        return self.base_job_key(self.base_lang)
+    
+    def load_keys(self, strings_file: str) -> frozenset:
+        """读取语言文件的 key 集合
+        
+        缓存规则见 cached_file_result：切换基准语言时不必重新解析，
+        指定 git ref 时变更过的文件总是重新解析
+        """
+        cached = self.cached_file_result('keys', strings_file, self.changed_files)
+        if cached is not None:
+            self.reused_count += 1
+            return cached
+        
+        keys = frozenset(LocalizationParser.parse_strings_file(strings_file, self.check_stopped).keys())
+        ScanResultCache.put('keys', strings_file, keys)
+        return keys
+    
+    def load_catalog_keys(self, catalog_file: str) -> Dict[str, frozenset]:
+        """流式读取 String Catalog，返回 {lang_code: key 集合}（缓存规则同 load_keys）"""
+        cached = self.cached_file_result('catalog_keys', catalog_file, self.changed_files)
+        if cached is not None:
+            self.reused_count += 1
+            return cached
+        
+        lang_keys = {}
+        for key, values, _, _ in XCStringsParser.iter_entries(catalog_file, self.check_stopped):
+            for lang_code in values:
+                lang_keys.setdefault(lang_code, set()).add(key)
+        lang_keys = {lang_code: frozenset(keys) for lang_code, keys in lang_keys.items()}
+        ScanResultCache.put('catalog_keys', catalog_file, lang_keys)
+        return lang_keys
     
     def validate_inputs(self) -> bool:
         """验证输入参数"""
@@ -34,33 +72,65 @@ class CompareWorker(BaseWorker):
         
         return True
     
+    @staticmethod
+    def summary_message(missing_keys: Dict[str, list]) -> str:
+        """对比结果的汇总提示"""
+        if missing_keys:
+            total_missing = sum(len(keys) for keys in missing_keys.values())
+            return f"对比完成，发现 {len(missing_keys)} 个语言文件共缺失 {total_missing} 个 key"
+        return f"对比完成，所有语言都完整！"
+    
     def run(self):
         try:
             if not self.validate_inputs():
                 return
             
-            # 1. 查找所有 .lproj 文件夹
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
             self.progress.emit("正在查找语言文件夹...")
-            lproj_folders = self.find_lproj_folders()
-            if lproj_folders is None:
-                self.finished.emit(False, "项目中未找到 .lproj 文件夹", {})
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", {})
+                return
+            
+            # 语言文件没变且基准语言相同时直接返回上次的结果
+            strings_files = [os.path.join(path, 'Localizable.strings') for path in lproj_folders.values()]
+            version = AnalysisCache.catalog_version(strings_files + list(catalog_files))
+            cached = AnalysisCache.get('compare', version, self.base_lang)
+            if cached is not None:
+                self.progress.emit("✓ 语言文件未变化，复用上次的对比结果")
+                self.finished.emit(True, self.summary_message(cached), cached)
                 return
             
+            # 指定 git ref 时只重新解析变更过的文件
+            self.changed_files = self.resolve_changed_files()
+            
+            # catalog 中各语言的 key 与同语言 .lproj 中的 key 合并对比
+            catalog_keys = {}  # {lang_code: set}
+            for catalog_file in catalog_files:
+                self.progress.emit(f"正在读取 {os.path.basename(catalog_file)}...")
+                for lang_code, keys in self.load_catalog_keys(catalog_file).items():
+                    catalog_keys.setdefault(lang_code, set()).update(keys)
+            
+            languages = list(lproj_folders.keys())
+            languages.extend(lang for lang in catalog_keys if lang not in lproj_folders)
+            
             # 检查基准语言是否存在
-            if self.base_lang not in lproj_folders:
+            if self.base_lang not in languages:
                 self.finished.emit(False, f"基准语言 {self.base_lang} 不存在", {})
                 return
             
             # 2. 读取基准语言的所有 key
             self.progress.emit(f"正在读取基准语言 {self.base_lang}...")
-            base_lproj_path = lproj_folders[self.base_lang]
-            base_strings_file = os.path.join(base_lproj_path, 'Localizable.strings')
-            
-            if not os.path.exists(base_strings_file):
-                self.finished.emit(False, f"基准语言文件 {base_strings_file} 不存在", {})
-                return
+            base_keys = set(catalog_keys.get(self.base_lang, ()))
             
-            base_keys = set(LocalizationParser.parse_strings_file(base_strings_file).keys())
+            if self.base_lang in lproj_folders:
+                base_strings_file = os.path.join(lproj_folders[self.base_lang], 'Localizable.strings')
+                if os.path.exists(base_strings_file):
+                    base_keys.update(self.load_keys(base_strings_file))
+                elif not base_keys:
+                    self.finished.emit(False, f"基准语言文件 {base_strings_file} 不存在", {})
+                    return
             
             if not base_keys:
                 self.finished.emit(False, f"基准语言 {self.base_lang} 没有 key", {})
@@ -71,7 +141,7 @@ class CompareWorker(BaseWorker):
             # 3. 对比其他语言
             missing_keys = {}  # {lang_code: [key1, key2, ...]}
             
-            for lang_code, lproj_path in lproj_folders.items():
+            for lang_code in languages:
                 if self.check_stopped():
                     self.finished.emit(False, "操作已取消", {})
                     return
@@ -87,18 +157,22 @@ class CompareWorker(BaseWorker):
                 self.progress.emit(f"正在对比 {lang_code}...")
                 
                 # 读取该语言的所有 key
-                strings_file = os.path.join(lproj_path, 'Localizable.strings')
-                
-                if not os.path.exists(strings_file):
-                    # 如果文件不存在，所有 key 都缺失
-                    missing_keys[lang_code] = list(base_keys)
-                    self.progress.emit(f"⚠ {lang_code}: 文件不存在，缺失 {len(base_keys)} 个 key")
-                    continue
+                lang_keys = catalog_keys.get(lang_code, set())
                 
-                lang_keys = set(LocalizationParser.parse_strings_file(strings_file).keys())
+                if lang_code in lproj_folders:
+                    strings_file = os.path.join(lproj_folders[lang_code], 'Localizable.strings')
+                    
+                    if os.path.exists(strings_file):
+                        lang_keys = lang_keys | self.load_keys(strings_file)
+                    elif not lang_keys:
+                        # 如果文件不存在，所有 key 都缺失
+                        missing_keys[lang_code] = sorted(base_keys)
+                        self.progress.emit(f"⚠ {lang_code}: 文件不存在，缺失 {len(base_keys)} 个 key")
+                        continue
                 
                 # 找出缺失的 key
-                missing = base_keys - lang_keys
+                with self.span('compute', lang=lang_code, keys=len(lang_keys)):
+                    missing = base_keys - lang_keys
                 
                 if missing:
                     missing_keys[lang_code] = sorted(list(missing))
@@ -106,14 +180,15 @@ class CompareWorker(BaseWorker):
                 else:
                     self.progress.emit(f"✓ {lang_code}: 完整")
             
+            if self.reused_count:
+                self.progress.emit(f"✓ 复用 {self.reused_count} 个未变更文件的缓存结果")
+            
             # 4. 返回结果
-            if missing_keys:
-                total_missing = sum(len(keys) for keys in missing_keys.values())
-                message = f"对比完成，发现 {len(missing_keys)} 个语言文件共缺失 {total_missing} 个 key"
-            else:
-                message = f"对比完成，所有语言都完整！"
+            AnalysisCache.put('compare', version, self.base_lang, missing_keys)
+            message = self.summary_message(missing_keys)
             
-            self.finished.emit(True, message, missing_keys)
+            with self.span('emit', languages=len(missing_keys)):
+                self.finished.emit(True, message, missing_keys)
             
         except Exception as e:
             error_msg = self.emit_error("对比", e)
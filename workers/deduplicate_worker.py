@@ -8,7 +8,7 @@ import os
 from typing import List
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser
+from models import LocalizationParser, XCStringsParser
 from workers.base_worker import BaseWorker
 from PyQt6.QtCore import pyqtSignal
 
@@ -16,6 +16,7 @@ from PyQt6.QtCore import pyqtSignal
 class DeduplicateWorker(BaseWorker):
     """删除重复项工作线程"""
     finished = pyqtSignal(bool, str, int)  # success, message, total_removed
+    RESULT_TYPES = (int,)
     
     def run(self):
         try:
@@ -25,9 +26,10 @@ class DeduplicateWorker(BaseWorker):
             
             # 查找所有 .lproj 文件夹
             self.progress.emit("正在查找语言文件夹...")
-            lproj_folders = self.find_lproj_folders()
-            if lproj_folders is None:
-                self.finished.emit(False, "项目中未找到 .lproj 文件夹", 0)
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", 0)
                 return
             
             total_removed = 0
@@ -54,6 +56,21 @@ class DeduplicateWorker(BaseWorker):
                 
                 self.progress.emit(f"✓ {lang_code}: 删除了 {removed} 个重复项")
             
+            # String Catalog 中重复的 key 只保留最后一个
+            for catalog_file in catalog_files:
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", 0)
+                    return
+                
+                catalog_name = os.path.relpath(catalog_file, self.project_path)
+                self.progress.emit(f"正在处理 {catalog_name}...")
+                
+                removed = XCStringsParser.remove_duplicates(catalog_file)
+                total_removed += removed
+                processed_count += 1
+                
+                self.progress.emit(f"✓ {catalog_name}: 删除了 {removed} 个重复项")
+            
             self.finished.emit(True, f"成功处理 {processed_count} 个语言文件", total_removed)
             
         except Exception as e:
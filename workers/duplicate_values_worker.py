@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重复文案工作线程
+在基准语言中查找 value 完全相同的不同 key，作为合并 key 的候选
+"""
+
+from typing import List
+from PyQt6.QtCore import pyqtSignal
+
+from workers.base_worker import BaseWorker
+
+
+class DuplicateValuesWorker(BaseWorker):
+    """重复文案工作线程
+
+    分组直接来自 value → keys 索引，索引按语言文件版本缓存，语言文件没变时不再重建
+    """
+    finished = pyqtSignal(bool, str, list)  # success, message, groups
+    RESULT_TYPES = (list,)
+
+    def __init__(self, project_path: str, base_lang: str, ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.base_lang = base_lang
+
+    def job_key(self):
+        return self.base_job_key(self.base_lang)
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", [])
+            return False
+
+        if not self.base_lang or not self.base_lang.strip():
+            self.finished.emit(False, "基准语言不能为空", [])
+            return False
+
+        return True
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", [])
+                return
+
+            # 2. 读取所有语言（与其他分析共享已读取的数据）
+            version, all_lang_data = self.load_all_lang_data(lproj_folders, catalog_files)
+            if all_lang_data is None:
+                self.finished.emit(False, "操作已取消", [])
+                return
+
+            # 3. value → keys 索引中被多个 key 使用的 value
+            value_index = self.load_value_index(version, all_lang_data, self.base_lang)
+            if value_index is None or not value_index.keys_by_value:
+                self.finished.emit(False, f"基准语言 {self.base_lang} 不存在或没有 key", [])
+                return
+
+            groups = value_index.duplicate_groups()
+            key_count = sum(len(group['items']) for group in groups)
+            message = (f"查找完成，{len(all_lang_data[self.base_lang])} 个 key 中有 {len(groups)} 个 value "
+                       f"被 {key_count} 个 key 重复使用")
+            with self.span('emit', groups=len(groups)):
+                self.finished.emit(True, message, groups)
+
+        except Exception as e:
+            error_msg = self.emit_error("查找重复文案", e)
+            self.finished.emit(False, error_msg, [])
@@ -9,26 +9,42 @@ import zipfile
 import tempfile
 import shutil
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 from PyQt6.QtCore import pyqtSignal
 from collections import OrderedDict
 
-from models import LocalizationParser
+from models import LocalizationParser, XCStringsParser
+from models.analysis_cache import AnalysisCache
+from models.serializers import PACKAGE_SERIALIZERS, get_serializer, serialize_languages, serialize_translation_package
 from workers.base_worker import BaseWorker
 from utils.config import ConfigManager
 from PyQt6.QtCore import pyqtSignal
 
 
+def zip_directory(source_dir: str, zip_path: str):
+    """把目录下的所有文件打包为 zip（保留相对路径）"""
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for root, dirs, files in os.walk(source_dir):
+            for file in files:
+                file_path = os.path.join(root, file)
+                zipf.write(file_path, os.path.relpath(file_path, source_dir))
+
+
 class ExportWorker(BaseWorker):
     """导出工作线程"""
     finished = pyqtSignal(bool, str, str)  # success, message, zip_path
+    RESULT_TYPES = (str,)
     
-    def __init__(self, project_path: str, export_strings: bool, export_xml: bool, 
-                 key_list: list = None, ignore_folders: List[str] = None):
+    def __init__(self, project_path: str, formats: List[str], 
+                 key_list: list = None, ignore_folders: List[str] = None,
+                 source_lang: str = 'en', languages: List[str] = None,
+                 export_path: Optional[str] = None):
         super().__init__(project_path, ignore_folders)
-        self.export_strings = export_strings
-        self.export_xml = export_xml
+        self.formats = formats  # 导出格式 ID，见 models.serializers
+        self.source_lang = source_lang  # XLIFF 的 source 语言
+        self.languages = languages or []  # 如果提供 languages，只导出指定的语言
         self.key_list = key_list or []  # 如果提供 key_list，只导出指定的 key
+        self.export_path = export_path  # zip 保存目录，未提供时使用配置的导出路径
         self.temp_dir = None
     
     def run(self):
@@ -39,35 +55,48 @@ class ExportWorker(BaseWorker):
             
             # 1. 查找项目中的 .lproj 文件夹
             self.progress.emit("正在查找项目语言文件...")
-            lproj_folders = self.find_lproj_folders()
-            if lproj_folders is None:
-                self.finished.emit(False, "项目中未找到 .lproj 文件夹", "")
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", "")
                 return
             
-            self.progress.emit(f"✓ 找到 {len(lproj_folders)} 个语言文件夹")
+            self.progress.emit(f"✓ 找到 {len(lproj_folders)} 个语言文件夹，{len(catalog_files)} 个 String Catalog")
             
             # 2. 创建临时目录
             self.temp_dir = tempfile.mkdtemp()
             try:
                 # 3. 读取每个语言的多语言数据
                 language_data = {}  # {lang_code: OrderedDict}
+                catalog_data = self.load_catalog_data(catalog_files)
+                lang_codes = list(lproj_folders.keys())
+                lang_codes.extend(lang for lang in catalog_data if lang not in lproj_folders)
+                if self.languages:
+                    # 源语言即使未选中也要读取，作为 XLIFF 的 source
+                    lang_codes = [lang for lang in lang_codes
+                                  if lang in self.languages or lang == self.source_lang]
                 
-                for lang_code, lproj_path in lproj_folders.items():
+                for lang_code in lang_codes:
                     if self.check_stopped():
                         self.finished.emit(False, "操作已取消", "")
                         return
                     
                     self.progress.emit(f"正在读取 {lang_code} 语言...")
                     
-                    # 查找 Localizable.strings 文件
-                    strings_file = os.path.join(lproj_path, 'Localizable.strings')
+                    # catalog 中的数据在前，.lproj 中的同名 key 覆盖
+                    all_data = catalog_data.pop(lang_code, OrderedDict())
                     
-                    if not os.path.exists(strings_file):
-                        self.progress.emit(f"⚠ {lang_code}.lproj/Localizable.strings 不存在，跳过")
-                        continue
+                    # 查找 Localizable.strings 文件
+                    lproj_path = lproj_folders.get(lang_code)
+                    if lproj_path:
+                        strings_file = os.path.join(lproj_path, 'Localizable.strings')
+                        if os.path.exists(strings_file):
+                            # 解析语言文件
+                            all_data.update(LocalizationParser.parse_strings_file(strings_file, self.check_stopped))
+                        elif not all_data:
+                            self.progress.emit(f"⚠ {lang_code}.lproj/Localizable.strings 不存在，跳过")
+                            continue
                     
-                    # 解析语言文件
-                    all_data = LocalizationParser.parse_strings_file(strings_file)
                     if not all_data:
                         self.progress.emit(f"⚠ {lang_code}: 文件为空")
                         continue
@@ -97,71 +126,50 @@ class ExportWorker(BaseWorker):
                     self.finished.emit(False, "没有可导出的多语言数据", "")
                     return
                 
-                # 4. 根据选项导出文件
-                # 先导出 .strings 格式（如果选择了 XML，也需要先导出 .strings）
-                strings_dir = None
-                if self.export_strings or self.export_xml:
-                    self.progress.emit("\n正在导出 .strings 格式...")
-                    strings_dir = os.path.join(self.temp_dir, "Strings")
-                    os.makedirs(strings_dir, exist_ok=True)
-                    
-                    for lang_code, data in language_data.items():
-                        if self.check_stopped():
-                            self.finished.emit(False, "操作已取消", "")
-                            return
-                        
-                        output_file = os.path.join(strings_dir, f"{lang_code}.strings")
-                        LocalizationParser.write_strings_file(output_file, data)
-                        self.progress.emit(f"✓ 已导出: {lang_code}.strings")
-                
-                # 如果选择了 XML，根据导出的 .strings 文件导出 XML
-                if self.export_xml:
-                    self.progress.emit("\n正在根据 .strings 文件导出 .xml 格式...")
-                    xml_dir = os.path.join(self.temp_dir, "XML")
-                    os.makedirs(xml_dir, exist_ok=True)
-                    
-                    # 从导出的 .strings 文件读取数据，然后导出为 XML
-                    for lang_code in language_data.keys():
-                        if self.check_stopped():
-                            self.finished.emit(False, "操作已取消", "")
-                            return
-                        
-                        strings_file = os.path.join(strings_dir, f"{lang_code}.strings")
-                        if os.path.exists(strings_file):
-                            # 从 .strings 文件读取数据
-                            xml_data = LocalizationParser.parse_strings_file(strings_file)
-                            if xml_data:
-                                output_file = os.path.join(xml_dir, f"{lang_code}.xml")
-                                LocalizationParser.write_xml_file(output_file, xml_data)
-                                self.progress.emit(f"✓ 已导出: {lang_code}.xml")
+                # 4. 遍历一次数据，同时写出所有选中的格式
+                format_names = [get_serializer(f).display_name for f in self.formats if get_serializer(f)]
+                self.progress.emit(f"\n正在导出 {', '.join(format_names)} 格式...")
+                
+                source_lang = self.source_lang if self.source_lang in language_data else next(iter(language_data))
+                source_data = language_data[source_lang]
+                if self.languages:
+                    language_data = {lang: data for lang, data in language_data.items() if lang in self.languages}
+                    if not language_data:
+                        self.finished.emit(False, "选中的语言没有可导出的数据", "")
+                        return
+                
+                written = serialize_languages(
+                    language_data,
+                    self.formats,
+                    self.temp_dir,
+                    source_lang,
+                    self.check_stopped,
+                    source_data
+                )
+                
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", "")
+                    return
+                
+                for lang_code, files in written.items():
+                    self.progress.emit(f"✓ 已导出 {lang_code}: {', '.join(os.path.basename(f) for f in files)}")
                 
                 # 5. 打包成 zip 文件
                 self.progress.emit("\n正在打包...")
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 zip_filename = f"LocalizationExport_{timestamp}.zip"
                 
-                # 使用配置的导出路径
-                export_path = ConfigManager.get_export_path()
+                # 未指定保存目录时使用配置的导出路径
+                export_path = self.export_path or ConfigManager.get_export_path()
                 zip_path = os.path.join(export_path, zip_filename)
                 
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for root, dirs, files in os.walk(self.temp_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, self.temp_dir)
-                            zipf.write(file_path, arcname)
+                zip_directory(self.temp_dir, zip_path)
                 
                 self.progress.emit(f"✓ 导出完成: {zip_filename}")
                 self.progress.emit(f"✓ 保存位置: {zip_path}")
                 
                 # 统计信息
-                formats = []
-                if self.export_strings:
-                    formats.append(".strings")
-                if self.export_xml:
-                    formats.append(".xml")
-                
-                summary = f"成功导出 {len(language_data)} 个语言，格式: {', '.join(formats)}"
+                summary = f"成功导出 {len(language_data)} 个语言，格式: {', '.join(format_names)}"
                 self.finished.emit(True, summary, zip_path)
                 
             finally:
@@ -182,3 +190,104 @@ class ExportWorker(BaseWorker):
                 except:
                     pass
 
+
+class MissingKeysExportWorker(BaseWorker):
+    """导出待翻译包：直接使用对比结果中各语言缺失的 key，附带基准语言的值
+
+    只读取基准语言（其他分析已读取过全部语言时直接复用），不重新解析每个语言
+    """
+    finished = pyqtSignal(bool, str, str)  # success, message, zip_path
+    RESULT_TYPES = (str,)
+    
+    def __init__(self, project_path: str, base_lang: str, missing_keys: Dict[str, List[str]],
+                 format_id: str, ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.base_lang = base_lang
+        self.missing_keys = missing_keys or {}
+        self.format_id = format_id  # 见 models.serializers.PACKAGE_SERIALIZERS
+        self.temp_dir = None
+    
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", "")
+            return False
+        
+        if not self.missing_keys:
+            self.finished.emit(False, "没有缺失的 key", "")
+            return False
+        
+        if self.format_id not in PACKAGE_SERIALIZERS:
+            self.finished.emit(False, f"不支持的格式: {self.format_id}", "")
+            return False
+        
+        return True
+    
+    def load_base_data(self) -> Dict[str, str]:
+        """读取基准语言的 {key: value}（catalog 在前，.lproj 中的同名 key 覆盖）"""
+        lproj_folders = self.find_lproj_folders() or {}
+        catalog_files = self.find_catalog_files()
+        
+        strings_files = [os.path.join(path, 'Localizable.strings') for path in lproj_folders.values()]
+        version = AnalysisCache.catalog_version(strings_files + list(catalog_files))
+        all_lang_data = AnalysisCache.get('lang_data', version)
+        if all_lang_data is not None:
+            self.progress.emit("✓ 语言文件未变化，复用已读取的数据")
+            return all_lang_data.get(self.base_lang, {})
+        
+        base_data = OrderedDict()
+        for catalog_file in catalog_files:
+            self.progress.emit(f"正在读取 {os.path.basename(catalog_file)}...")
+            for key, values, _, _ in XCStringsParser.iter_entries(catalog_file, self.check_stopped):
+                if self.base_lang in values:
+                    base_data[key] = values[self.base_lang]
+        
+        strings_file = os.path.join(lproj_folders.get(self.base_lang, ''), 'Localizable.strings')
+        if self.base_lang in lproj_folders and os.path.exists(strings_file):
+            self.progress.emit(f"正在读取基准语言 {self.base_lang}...")
+            base_data.update(LocalizationParser.parse_strings_file(strings_file, self.check_stopped))
+        return base_data
+    
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+            
+            # 1. 基准语言的值作为翻译上下文
+            base_data = self.load_base_data()
+            if not base_data:
+                self.finished.emit(False, f"基准语言 {self.base_lang} 不存在或没有 key", "")
+                return
+            
+            # 2. 写出各语言的待翻译文件并打包
+            self.temp_dir = tempfile.mkdtemp()
+            try:
+                serializer_class = PACKAGE_SERIALIZERS[self.format_id]
+                self.progress.emit(f"正在导出 {serializer_class.display_name} 待翻译包...")
+                total = sum(len(keys) for keys in self.missing_keys.values())
+                with self.span('write', languages=len(self.missing_keys), entries=total):
+                    written = serialize_translation_package(
+                        self.missing_keys, base_data, self.format_id,
+                        self.temp_dir, self.base_lang, self.check_stopped
+                    )
+                
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", "")
+                    return
+                
+                for lang_code, files in sorted(written.items()):
+                    self.progress.emit(f"✓ {lang_code}: {len(self.missing_keys[lang_code])} 条 → {files[0]}")
+                
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                zip_filename = f"MissingKeys_{self.base_lang}_{timestamp}.zip"
+                zip_path = os.path.join(ConfigManager.get_export_path(), zip_filename)
+                zip_directory(self.temp_dir, zip_path)
+                
+                self.progress.emit(f"✓ 保存位置: {zip_path}")
+                self.finished.emit(True, f"成功导出 {len(written)} 个语言共 {total} 个待翻译的 key", zip_path)
+            finally:
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+        except Exception as e:
+            error_msg = self.emit_error("导出待翻译包", e)
+            self.finished.emit(False, error_msg, "")
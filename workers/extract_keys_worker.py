@@ -15,11 +15,15 @@ from PyQt6.QtCore import pyqtSignal
 class ExtractKeysWorker(BaseWorker):
     """提取 Key 的后台线程"""
     finished = pyqtSignal(bool, str, list)  # success, message, keys
+    RESULT_TYPES = (list,)
     
     def __init__(self, project_path: str, language: str):
         super().__init__(project_path)
         self.language = language
     
+    def job_key(self):
+        return self.base_job_key(self.language)
+    
     def validate_inputs(self) -> bool:
         """验证输入参数"""
         if not super().validate_project_path():
@@ -66,7 +70,7 @@ class ExtractKeysWorker(BaseWorker):
             self.progress.emit(f"找到文件: {strings_file}")
             
             # 解析文件，提取所有 key
-            parsed_data = LocalizationParser.parse_strings_file(strings_file)
+            parsed_data = LocalizationParser.parse_strings_file(strings_file, self.check_stopped)
             
             if not parsed_data:
                 self.finished.emit(False, f"文件为空或无法解析", [])
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+格式符检查工作线程
+对比各语言同一个 key 的格式符（%@、%d、%1$@、%lld 等），找出与基准语言不一致的翻译
+"""
+
+from typing import List
+from PyQt6.QtCore import pyqtSignal
+
+from models.analysis_cache import AnalysisCache
+from models.format_specifier import FormatSpecifierChecker
+from workers.base_worker import BaseWorker
+
+
+class FormatCheckWorker(BaseWorker):
+    """格式符检查工作线程"""
+    finished = pyqtSignal(bool, str, list)  # success, message, mismatches
+    RESULT_TYPES = (list,)
+
+    def __init__(self, project_path: str, base_lang: str, ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.base_lang = base_lang
+
+    def job_key(self):
+        return self.base_job_key(self.base_lang)
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", [])
+            return False
+
+        if not self.base_lang or not self.base_lang.strip():
+            self.finished.emit(False, "基准语言不能为空", [])
+            return False
+
+        return True
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", [])
+                return
+
+            # 2. 读取所有语言（与长度对比共享已读取的数据）
+            version, all_lang_data = self.load_all_lang_data(lproj_folders, catalog_files)
+            if all_lang_data is None:
+                self.finished.emit(False, "操作已取消", [])
+                return
+
+            if self.base_lang not in all_lang_data:
+                self.finished.emit(False, f"基准语言 {self.base_lang} 不存在或没有 key", [])
+                return
+
+            # 3. 对比格式符签名（语言文件没变且基准语言相同时直接复用）
+            mismatches = AnalysisCache.get('format_check', version, self.base_lang)
+            if mismatches is None:
+                self.progress.emit(f"正在对比格式符（基准语言 {self.base_lang}）...")
+                with self.span('compute', languages=len(all_lang_data)) as counters:
+                    mismatches = FormatSpecifierChecker.check(all_lang_data, self.base_lang, self.check_stopped)
+                    counters['mismatches'] = len(mismatches)
+                AnalysisCache.put('format_check', version, self.base_lang, mismatches)
+            else:
+                self.progress.emit("✓ 语言文件未变化，复用上次的检查结果")
+
+            # 4. 返回结果
+            if mismatches:
+                errors = sum(1 for item in mismatches if item['severity'] == 'error')
+                keys = len({item['key'] for item in mismatches})
+                message = f"检查完成，{keys} 个 key 共 {len(mismatches)} 处格式符不一致，其中 {errors} 处可能崩溃"
+            else:
+                message = "检查完成，所有语言的格式符都一致！"
+
+            with self.span('emit', mismatches=len(mismatches)):
+                self.finished.emit(True, message, mismatches)
+
+        except Exception as e:
+            error_msg = self.emit_error("格式符检查", e)
+            self.finished.emit(False, error_msg, [])
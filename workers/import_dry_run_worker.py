@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入预演工作线程
+直接读取 zip 成员（不解压），按 key 与项目中的语言文件做 hash 比对，不写任何文件
+"""
+
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import pyqtSignal
+
+from models import LocalizationParser
+from workers.import_worker import ImportWorker
+
+
+class ImportDryRunWorker(ImportWorker):
+    """导入预演：统计每个语言的新增 / 修改 / 未变 / 将产生重复的 key"""
+    finished = pyqtSignal(bool, str, dict)  # success, message, {语言: diff}
+    RESULT_TYPES = (dict,)
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not self.validate_project_path():
+            self.finished.emit(False, "项目路径无效", {})
+            return False
+
+        for zip_path in self.zip_paths or ['']:
+            if not zip_path or not os.path.exists(zip_path):
+                self.finished.emit(False, f"ZIP 文件不存在: {zip_path}", {})
+                return False
+
+        return True
+
+    def diff_entries(self, entries: list, existing: dict) -> dict:
+        """比对一个语言的待导入条目和已有条目"""
+        incoming = OrderedDict()
+        repeated = set()  # 导入文件内部重复的 key（批量导入时会先合并，不会重复）
+        for key, value in entries:
+            if key in incoming and len(self.zip_paths) == 1:
+                repeated.add(key)
+            incoming[key] = value
+
+        new, changed, unchanged = [], [], []
+        for key, value in incoming.items():
+            old_value = existing.get(key)
+            if old_value is None:
+                new.append((key, value))
+            elif old_value != value:
+                changed.append((key, old_value, value))
+            else:
+                unchanged.append((key, value))
+
+        if self.merge_mode:
+            # 合并模式下已有 key 原地更新，不会产生重复
+            duplicates = []
+        else:
+            # 追加模式下，所有已存在的 key 和导入文件内部重复的 key 都会重复
+            duplicates = [key for key in incoming if key in existing or key in repeated]
+
+        return {
+            'new': new,
+            'changed': changed,
+            'unchanged': unchanged,
+            'duplicates': duplicates,
+        }
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            self.progress.emit("正在读取导入文件...")
+            incoming = OrderedDict()  # 多个文件按顺序拼接，比对时后面的覆盖前面的
+            for zip_path in self.zip_paths:
+                for source_lang, entries in self.read_incoming(zip_path).items():
+                    incoming.setdefault(source_lang, []).extend(entries)
+            if not incoming:
+                self.finished.emit(False, "导入文件中没有可导入的条目", {})
+                return
+
+            self.progress.emit("正在查找项目语言文件夹...")
+            lproj_folders = self.find_lproj_folders()
+            if lproj_folders is None:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹", {})
+                return
+
+            existing_cache = {}  # {目标文件: {key: value}}，多个语言映射到同一文件时只读一次
+            results = OrderedDict()
+            for source_lang, entries in incoming.items():
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", {})
+                    return
+
+                target_file = self.resolve_target_file(source_lang, lproj_folders)
+                if target_file is None:
+                    continue
+
+                existing = existing_cache.get(target_file)
+                if existing is None:
+                    with open(target_file, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    existing = {key: value for key, value, _, _ in LocalizationParser.iter_entry_spans(content)}
+                    existing_cache[target_file] = existing
+
+                project_lang = os.path.splitext(os.path.basename(os.path.dirname(target_file)))[0]
+                label = source_lang if source_lang == project_lang else f"{source_lang} → {project_lang}"
+                results[label] = self.diff_entries(entries, existing)
+
+            if not results:
+                self.finished.emit(False, "没有与项目匹配的语言", {})
+                return
+
+            total_new = sum(len(diff['new']) for diff in results.values())
+            total_changed = sum(len(diff['changed']) for diff in results.values())
+            message = f"预演完成：{len(results)} 个语言，新增 {total_new} 条，修改 {total_changed} 条"
+            self.finished.emit(True, message, results)
+
+        except Exception as e:
+            error_msg = self.emit_error("导入预演", e)
+            self.finished.emit(False, error_msg, {})
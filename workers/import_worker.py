@@ -7,9 +7,11 @@
 import os
 import zipfile
 import shutil
+from collections import OrderedDict
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser
+from models import LocalizationParser, XLIFFParser
+from models.localization_parser import StringsFileMerger, escape_strings_text
 from workers.base_worker import BaseWorker
 from PyQt6.QtCore import pyqtSignal
 
@@ -19,11 +21,16 @@ class ImportWorker(BaseWorker):
     finished = pyqtSignal(bool, str)  # success, message
     
     def __init__(self, zip_path: str, project_path: str, version: str, 
-                 language_mappings: dict = None, ignore_folders: list = None):
+                 language_mappings: dict = None, ignore_folders: list = None,
+                 merge_mode: bool = False):
         super().__init__(project_path, ignore_folders)
-        self.zip_path = zip_path
+        # 支持一次导入多个 zip（列表），后面的 zip 覆盖前面的同名 key
+        self.zip_paths = [zip_path] if isinstance(zip_path, str) else list(zip_path)
+        self.zip_path = self.zip_paths[0] if self.zip_paths else ''
         self.version = version
         self.language_mappings = language_mappings or {}  # {zip_lang: project_lang}
+        # 合并模式：已有 key 原地更新，只把新 key 追加到版本号注释块中，每个文件只写一次
+        self.merge_mode = merge_mode
         self.extract_dir = None
     
     def validate_inputs(self) -> bool:
@@ -32,9 +39,10 @@ class ImportWorker(BaseWorker):
             self.finished.emit(False, "项目路径无效")
             return False
         
-        if not self.zip_path or not os.path.exists(self.zip_path):
-            self.finished.emit(False, f"ZIP 文件不存在: {self.zip_path}")
-            return False
+        for zip_path in self.zip_paths or ['']:
+            if not zip_path or not os.path.exists(zip_path):
+                self.finished.emit(False, f"ZIP 文件不存在: {zip_path}")
+                return False
         
         if not self.version or not self.version.strip():
             self.finished.emit(False, "版本号不能为空")
@@ -42,11 +50,224 @@ class ImportWorker(BaseWorker):
         
         return True
     
+    def resolve_project_lang(self, source_lang: str):
+        """按语言映射得到项目语言，未配置映射时返回 None"""
+        if not self.language_mappings:
+            return source_lang
+        return self.language_mappings.get(source_lang)
+    
+    def import_xliff(self, sources: list):
+        """流式导入 XLIFF，直接追加到各语言的 Localizable.strings
+        
+        Args:
+            sources: [(文件名, 打开二进制文件对象的函数), ...]
+        
+        trans-unit 逐个读取、逐条写出，不解压、不生成中间 .strings 文件，
+        内存占用与交付文件大小无关。
+        """
+        self.progress.emit("正在查找项目语言文件夹...")
+        lproj_folders = self.find_lproj_folders()
+        if lproj_folders is None:
+            self.finished.emit(False, "项目中未找到 .lproj 文件夹")
+            return
+        
+        lang_targets = {}   # {xliff_lang: 目标文件}，None 表示跳过
+        sinks = {}          # {目标文件: 追加模式的文件对象 / 合并模式的 StringsFileMerger}
+        counts = {}         # {目标文件: 导入条数}
+        untranslated = 0
+        header = f'\n\n//<!-- ========== {self.version} 新增 ========== -->\n'
+        completed = False
+        
+        try:
+            for name, open_source in sources:
+                self.progress.emit(f"正在读取 {name}...")
+                default_lang = XLIFFParser.language_from_filename(name)
+                
+                with open_source() as f:
+                    for unit_count, (xliff_lang, key, _, target) in enumerate(
+                            XLIFFParser.iter_units(f, default_lang), 1):
+                        self.report_progress(f"读取 {name}", unit_count)
+                        if self.check_stopped():
+                            if self.merge_mode:
+                                self.finished.emit(False, "操作已取消，未写入任何文件")
+                            else:
+                                self.finished.emit(False, "操作已取消（已导入的部分已写入）")
+                            return
+                        
+                        if target is None:
+                            untranslated += 1
+                            continue
+                        
+                        if xliff_lang not in lang_targets:
+                            lang_targets[xliff_lang] = self.resolve_target_file(xliff_lang, lproj_folders)
+                            if lang_targets[xliff_lang]:
+                                self.progress.emit(f"正在导入 {xliff_lang}...")
+                        target_file = lang_targets[xliff_lang]
+                        if target_file is None:
+                            continue
+                        
+                        sink = sinks.get(target_file)
+                        if sink is None:
+                            if self.merge_mode:
+                                sink = StringsFileMerger(target_file)
+                            else:
+                                sink = open(target_file, 'a', encoding='utf-8')
+                                sink.write(header)
+                            sinks[target_file] = sink
+                        
+                        if self.merge_mode:
+                            sink.add(key, target)
+                        else:
+                            sink.write(f'"{escape_strings_text(key)}" = "{escape_strings_text(target)}";\n')
+                        counts[target_file] = counts.get(target_file, 0) + 1
+            completed = True
+        finally:
+            if not self.merge_mode:
+                for sink in sinks.values():
+                    sink.write(f'//<!-- ========== {self.version} 新增 ========== -->\n')
+                    sink.close()
+        
+        if not completed:
+            return
+        
+        for target_file, count in counts.items():
+            lang_name = os.path.basename(os.path.dirname(target_file))
+            if self.merge_mode:
+                updated, added = sinks[target_file].commit(self.version)
+                self.progress.emit(f"✓ {lang_name} 合并完成 ({count} 条: 更新 {updated}，新增 {added})")
+            else:
+                self.progress.emit(f"✓ {lang_name} 导入成功 ({count} 条)")
+        if untranslated:
+            self.progress.emit(f"⚠ {untranslated} 条没有译文，已跳过")
+        
+        self.finished.emit(True, f"成功导入 {len(counts)} 个语言，共 {sum(counts.values())} 条")
+    
+    @staticmethod
+    def read_incoming(zip_path: str) -> OrderedDict:
+        """直接读取 zip 成员（或 XLIFF 文件），返回 {源语言: [(key, value), ...]}
+        
+        不解压；保留重复出现的 key，由调用方决定覆盖规则
+        """
+        incoming = OrderedDict()
+        
+        if XLIFFParser.is_xliff_file(zip_path):
+            default_lang = XLIFFParser.language_from_filename(zip_path)
+            for lang, key, _, target in XLIFFParser.iter_units(zip_path, default_lang):
+                if target is not None:
+                    incoming.setdefault(lang, []).append((key, target))
+            return incoming
+        
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            names = zip_ref.namelist()
+            xliff_names = [n for n in names if XLIFFParser.is_xliff_file(n)]
+            
+            if xliff_names:
+                for name in xliff_names:
+                    with zip_ref.open(name) as f:
+                        default_lang = XLIFFParser.language_from_filename(name)
+                        for lang, key, _, target in XLIFFParser.iter_units(f, default_lang):
+                            if target is not None:
+                                incoming.setdefault(lang, []).append((key, target))
+                return incoming
+            
+            # 与解压导入一致：优先使用顶层的 .strings 文件，没有时再取子目录中的
+            strings_names = [n for n in names if n.endswith('.strings') and '/' not in n]
+            if not strings_names:
+                strings_names = [n for n in names if n.endswith('.strings')]
+            
+            for name in strings_names:
+                lang = os.path.splitext(os.path.basename(name))[0]
+                content = zip_ref.read(name).decode('utf-8')
+                incoming[lang] = [(key, value) for key, value, _, _ in LocalizationParser.iter_entry_spans(content)]
+        
+        return incoming
+    
+    def import_batch(self):
+        """批量导入多个 zip：按目标文件合并所有条目（后面的 zip 优先），每个文件只写一次"""
+        self.progress.emit("正在查找项目语言文件夹...")
+        lproj_folders = self.find_lproj_folders()
+        if lproj_folders is None:
+            self.finished.emit(False, "项目中未找到 .lproj 文件夹")
+            return
+        
+        lang_targets = {}   # {源语言: 目标文件}，None 表示跳过
+        coalesced = {}      # {目标文件: OrderedDict(key: value)}
+        for index, zip_path in enumerate(self.zip_paths, 1):
+            if self.check_stopped():
+                self.finished.emit(False, "操作已取消，未写入任何文件")
+                return
+            
+            self.progress.emit(f"正在读取 ({index}/{len(self.zip_paths)}) {os.path.basename(zip_path)}...")
+            for source_lang, entries in self.read_incoming(zip_path).items():
+                if source_lang not in lang_targets:
+                    lang_targets[source_lang] = self.resolve_target_file(source_lang, lproj_folders)
+                target_file = lang_targets[source_lang]
+                if target_file is None:
+                    continue
+                
+                data = coalesced.setdefault(target_file, OrderedDict())
+                for key, value in entries:
+                    data[key] = value
+        
+        if not coalesced:
+            self.finished.emit(False, "没有与项目匹配的语言")
+            return
+        
+        for target_file, data in coalesced.items():
+            lang_name = os.path.basename(os.path.dirname(target_file))
+            if self.merge_mode:
+                merger = StringsFileMerger(target_file)
+                for key, value in data.items():
+                    merger.add(key, value)
+                updated, added = merger.commit(self.version)
+                self.progress.emit(f"✓ {lang_name} 合并完成 ({len(data)} 条: 更新 {updated}，新增 {added})")
+            else:
+                LocalizationParser.append_entries_with_version(target_file, data, self.version)
+                self.progress.emit(f"✓ {lang_name} 导入成功 ({len(data)} 条)")
+        
+        total = sum(len(data) for data in coalesced.values())
+        self.finished.emit(True, f"成功导入 {len(self.zip_paths)} 个文件到 {len(coalesced)} 个语言，共 {total} 条")
+    
+    def resolve_target_file(self, source_lang: str, lproj_folders: dict):
+        """找到导入语言对应的 Localizable.strings，找不到时返回 None（并输出原因）"""
+        project_lang = self.resolve_project_lang(source_lang)
+        if project_lang is None:
+            self.progress.emit(f"跳过: {source_lang} (未配置映射)")
+            return None
+        
+        if project_lang not in lproj_folders:
+            self.progress.emit(f"警告: 项目中未找到 {project_lang}.lproj 文件夹，跳过")
+            return None
+        
+        target_file = os.path.join(lproj_folders[project_lang], 'Localizable.strings')
+        if not os.path.exists(target_file):
+            self.progress.emit(f"警告: {target_file} 不存在，跳过")
+            return None
+        
+        return target_file
+    
     def run(self):
         try:
             if not self.validate_inputs():
                 return
             
+            # 多个文件：合并后每个目标文件写一次
+            if len(self.zip_paths) > 1:
+                self.import_batch()
+                return
+            
+            # XLIFF 文件（或包含 XLIFF 的 zip）走流式导入，不解压
+            if XLIFFParser.is_xliff_file(self.zip_path):
+                name = os.path.basename(self.zip_path)
+                self.import_xliff([(name, lambda: open(self.zip_path, 'rb'))])
+                return
+            
+            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
+                xliff_names = [n for n in zip_ref.namelist() if XLIFFParser.is_xliff_file(n)]
+                if xliff_names:
+                    self.import_xliff([(n, lambda n=n: zip_ref.open(n)) for n in xliff_names])
+                    return
+            
             # 1. 解压 zip 文件
             self.progress.emit("正在解压 zip 文件...")
             self.extract_dir = os.path.join(os.path.dirname(self.zip_path), 
@@ -92,6 +313,7 @@ class ImportWorker(BaseWorker):
             
             # 4. 导入语言文件
             imported_count = 0
+            mergers = {}  # 合并模式下 {目标文件: StringsFileMerger}，全部读完后每个文件写一次
             for zip_lang, strings_file in strings_files.items():
                 if self.check_stopped():
                     self.finished.emit(False, "操作已取消")
@@ -121,17 +343,30 @@ class ImportWorker(BaseWorker):
                     self.progress.emit(f"警告: {target_file} 不存在，跳过")
                     continue
                 
-                # 直接追加原始文件内容（不解析，保持原始格式）
-                LocalizationParser.append_strings_with_version(target_file, strings_file, self.version)
+                new_data = LocalizationParser.parse_strings_file(strings_file, self.check_stopped)
+                
+                if self.merge_mode:
+                    # 与已有 key 做 hash join：变化的原地更新，新 key 追加到版本号注释块
+                    merger = mergers.get(target_file)
+                    if merger is None:
+                        merger = mergers[target_file] = StringsFileMerger(target_file)
+                    for key, value in new_data.items():
+                        merger.add(key, value)
+                else:
+                    # 直接追加原始文件内容（不解析，保持原始格式）
+                    LocalizationParser.append_strings_with_version(target_file, strings_file, self.version)
                 
-                # 只用于统计显示
-                new_data = LocalizationParser.parse_strings_file(strings_file)
                 imported_count += 1
                 if self.language_mappings and zip_lang != project_lang:
                     self.progress.emit(f"✓ {zip_lang} → {project_lang} 导入成功 ({len(new_data)} 条)")
                 else:
                     self.progress.emit(f"✓ {project_lang} 导入成功 ({len(new_data)} 条)")
             
+            for target_file, merger in mergers.items():
+                updated, added = merger.commit(self.version)
+                lang_name = os.path.basename(os.path.dirname(target_file))
+                self.progress.emit(f"✓ {lang_name} 合并完成: 更新 {updated} 条，新增 {added} 条")
+            
             # 5. 清理解压目录
             if self.extract_dir and os.path.exists(self.extract_dir):
                 try:
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Key 引用索引工作线程
+增量刷新 key → file:line 倒排索引
+"""
+
+from typing import List
+from PyQt6.QtCore import pyqtSignal
+
+from models.key_usage_index import KeyUsageIndex
+from workers.base_worker import BaseWorker
+from workers.worker_pool import PRIORITY_BACKGROUND
+
+
+class KeyUsageIndexWorker(BaseWorker):
+    """刷新 Key 引用索引（只重新扫描有变化的源文件）"""
+    finished = pyqtSignal(bool, str, int)  # success, message, rescanned_count
+    RESULT_TYPES = (int,)
+    PRIORITY = PRIORITY_BACKGROUND
+
+    def __init__(self, project_path: str, usage_index: KeyUsageIndex, ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.usage_index = usage_index
+
+    def job_key(self):
+        # 带上索引的 generation：reset 之后的刷新不会合并进 reset 之前（已作废）的刷新
+        return self.base_job_key(id(self.usage_index), self.usage_index.generation)
+
+    def run(self):
+        try:
+            if not self.validate_project_path():
+                self.finished.emit(False, "项目路径无效", 0)
+                return
+
+            self.progress.emit("正在更新 Key 引用索引...")
+            rescanned, removed, total = self.usage_index.refresh(
+                self.project_path,
+                self.ignore_folders,
+                self.check_stopped
+            )
+
+            # 刷新期间切换了项目时，这次刷新的结果已作废
+            if self.check_stopped() or self.usage_index.project_path != self.project_path:
+                self.finished.emit(False, "操作已取消", rescanned)
+                return
+
+            message = (f"引用索引已更新：{total} 个源文件，{self.usage_index.key_count} 个 key"
+                       f"（重新扫描 {rescanned} 个，移除 {removed} 个）")
+            self.finished.emit(True, message, rescanned)
+
+        except Exception as e:
+            error_msg = self.emit_error("更新引用索引", e)
+            self.finished.emit(False, error_msg, 0)
@@ -5,17 +5,17 @@
 对比不同语言的 value 长度，找出变长的字段
 """
 
-import os
 from typing import Dict, List, Optional
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser
+from models.analysis_cache import AnalysisCache
 from workers.base_worker import BaseWorker
 
 
 class LengthCompareWorker(BaseWorker):
     """长度对比工作线程"""
     finished = pyqtSignal(bool, str, dict)  # success, message, results
+    RESULT_TYPES = (dict,)
     
     def __init__(
         self, 
@@ -23,7 +23,7 @@ class LengthCompareWorker(BaseWorker):
         target_languages: List[str],
         compare_mode: str = "average",  # "average", "max", "base_lang"
         base_lang: Optional[str] = None,
-        min_diff_percent: float = 0.0  # 最小差异百分比阈值
+        min_diff_percent: float = 0.0  # 最小差异百分比阈值（界面传 0，由 Tab 在内存中过滤）
     ):
         super().__init__(project_path)
         self.target_languages = target_languages
@@ -31,6 +31,9 @@ class LengthCompareWorker(BaseWorker):
         self.base_lang = base_lang
         self.min_diff_percent = min_diff_percent
     
+    def job_key(self):
+        return self.base_job_key(tuple(self.target_languages or ()), self.compare_mode, self.base_lang, self.min_diff_percent)
+    
     def validate_inputs(self) -> bool:
         """验证输入参数"""
         if not super().validate_project_path():
@@ -85,44 +88,94 @@ class LengthCompareWorker(BaseWorker):
         
         return 0.0
     
+    def compute_diffs(self, all_lang_data: Dict[str, dict], all_keys: set) -> Optional[dict]:
+        """对比所有变长的字段（不按阈值过滤），取消时返回 None"""
+        results = {}  # {key: {target_lang, target_value, target_length, base_length, diff, diff_percent, all_values}}
+        
+        for index, key in enumerate(all_keys, 1):
+            if self.check_stopped():
+                return None
+            self.report_progress("对比长度", index, len(all_keys))
+            
+            # 收集所有语言的 value 和长度
+            all_values = {}
+            for lang_code, lang_data in all_lang_data.items():
+                value = lang_data.get(key)
+                if value is not None:
+                    length = len(value)
+                    all_values[lang_code] = {
+                        "value": value,
+                        "length": length
+                    }
+            
+            # 对每个目标语言进行对比
+            for target_lang in self.target_languages:
+                if target_lang not in all_values:
+                    continue  # 该目标语言没有这个 key，跳过
+                
+                target_data = all_values[target_lang]
+                target_length = target_data["length"]
+                
+                # 计算基准长度（排除目标语言本身）
+                base_length = self.calculate_base_length(
+                    key, 
+                    all_values, 
+                    [target_lang]
+                )
+                
+                if base_length == 0:
+                    continue  # 没有基准数据，跳过
+                
+                # 计算差异
+                diff = target_length - base_length
+                diff_percent = (diff / base_length * 100) if base_length > 0 else 0.0
+                
+                # 只保留变长的字段，阈值由调用方过滤
+                if diff > 0:
+                    result_key = f"{key}__{target_lang}"  # 使用组合 key 支持多目标语言
+                    results[result_key] = {
+                        "key": key,
+                        "target_lang": target_lang,
+                        "target_value": target_data["value"],
+                        "target_length": target_length,
+                        "base_length": base_length,
+                        "diff": diff,
+                        "diff_percent": diff_percent,
+                        "all_values": all_values.copy()  # 保存所有语言的值用于参考
+                    }
+        return results
+    
     def run(self):
         try:
             if not self.validate_inputs():
                 return
             
-            # 1. 查找所有 .lproj 文件夹
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
             self.progress.emit("正在查找语言文件夹...")
-            lproj_folders = self.find_lproj_folders()
-            if lproj_folders is None:
-                self.finished.emit(False, "项目中未找到 .lproj 文件夹", {})
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", {})
+                return
+            
+            # 2. 读取所有语言的 strings 文件（语言文件没变时复用上次读取的数据）
+            version, all_lang_data = self.load_all_lang_data(lproj_folders, catalog_files)
+            if all_lang_data is None:
+                self.finished.emit(False, "操作已取消", {})
                 return
             
             # 验证目标语言是否存在
-            missing_langs = [lang for lang in self.target_languages if lang not in lproj_folders]
+            languages = set(lproj_folders) | set(all_lang_data)
+            missing_langs = [lang for lang in self.target_languages if lang not in languages]
             if missing_langs:
                 self.finished.emit(False, f"目标语言不存在: {', '.join(missing_langs)}", {})
                 return
             
             # 验证基准语言（如果使用 base_lang 模式）
-            if self.compare_mode == "base_lang" and self.base_lang not in lproj_folders:
+            if self.compare_mode == "base_lang" and self.base_lang not in languages:
                 self.finished.emit(False, f"基准语言 {self.base_lang} 不存在", {})
                 return
             
-            # 2. 读取所有语言的 strings 文件
-            self.progress.emit("正在读取所有语言文件...")
-            all_lang_data = {}  # {lang_code: {key: value}}
-            
-            for lang_code, lproj_path in lproj_folders.items():
-                if self.check_stopped():
-                    self.finished.emit(False, "操作已取消", {})
-                    return
-                
-                strings_file = os.path.join(lproj_path, 'Localizable.strings')
-                if os.path.exists(strings_file):
-                    lang_data = LocalizationParser.parse_strings_file(strings_file)
-                    all_lang_data[lang_code] = lang_data
-                    self.progress.emit(f"✓ 已读取 {lang_code}: {len(lang_data)} 个 key")
-            
             if not all_lang_data:
                 self.finished.emit(False, "未找到任何语言文件", {})
                 return
@@ -138,61 +191,28 @@ class LengthCompareWorker(BaseWorker):
             
             self.progress.emit(f"✓ 共找到 {len(all_keys)} 个 key")
             
-            # 4. 对每个 key 进行长度对比
-            self.progress.emit("正在对比长度...")
-            results = {}  # {key: {target_lang, target_value, target_length, base_length, diff, diff_percent, all_values}}
-            
-            for key in all_keys:
-                if self.check_stopped():
+            # 4. 对每个 key 进行长度对比（阈值不参与缓存，换阈值只需过滤）
+            params = (
+                tuple(self.target_languages),
+                self.compare_mode,
+                self.base_lang if self.compare_mode == "base_lang" else None,
+            )
+            results = AnalysisCache.get('length_compare', version, params)
+            if results is None:
+                self.progress.emit("正在对比长度...")
+                results = self.compute_diffs(all_lang_data, all_keys)
+                if results is None:
                     self.finished.emit(False, "操作已取消", {})
                     return
-                
-                # 收集所有语言的 value 和长度
-                all_values = {}
-                for lang_code, lang_data in all_lang_data.items():
-                    value = lang_data.get(key)
-                    if value is not None:
-                        length = len(value)
-                        all_values[lang_code] = {
-                            "value": value,
-                            "length": length
-                        }
-                
-                # 对每个目标语言进行对比
-                for target_lang in self.target_languages:
-                    if target_lang not in all_values:
-                        continue  # 该目标语言没有这个 key，跳过
-                    
-                    target_data = all_values[target_lang]
-                    target_length = target_data["length"]
-                    
-                    # 计算基准长度（排除目标语言本身）
-                    base_length = self.calculate_base_length(
-                        key, 
-                        all_values, 
-                        [target_lang]
-                    )
-                    
-                    if base_length == 0:
-                        continue  # 没有基准数据，跳过
-                    
-                    # 计算差异
-                    diff = target_length - base_length
-                    diff_percent = (diff / base_length * 100) if base_length > 0 else 0.0
-                    
-                    # 只保留变长的字段（diff > 0 且超过阈值）
-                    if diff > 0 and diff_percent >= self.min_diff_percent:
-                        result_key = f"{key}__{target_lang}"  # 使用组合 key 支持多目标语言
-                        results[result_key] = {
-                            "key": key,
-                            "target_lang": target_lang,
-                            "target_value": target_data["value"],
-                            "target_length": target_length,
-                            "base_length": base_length,
-                            "diff": diff,
-                            "diff_percent": diff_percent,
-                            "all_values": all_values.copy()  # 保存所有语言的值用于参考
-                        }
+                AnalysisCache.put('length_compare', version, params, results)
+            else:
+                self.progress.emit("✓ 参数未变化，复用上次的对比结果")
+            
+            if self.min_diff_percent > 0:
+                results = {
+                    result_key: data for result_key, data in results.items()
+                    if data["diff_percent"] >= self.min_diff_percent
+                }
             
             # 5. 返回结果
             if results:
@@ -206,4 +226,3 @@ class LengthCompareWorker(BaseWorker):
         except Exception as e:
             error_msg = self.emit_error("长度对比", e)
             self.finished.emit(False, error_msg, {})
-
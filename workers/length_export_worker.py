@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+长度对比结果导出工作线程
+按文件扩展名选择格式：.xlsx（openpyxl write-only 模式）、.csv、.jsonl，逐行流式写出
+"""
+
+import csv
+import json
+from typing import Iterator, List, Tuple
+from PyQt6.QtCore import pyqtSignal
+
+from workers.base_worker import BaseWorker
+
+EXPORT_HEADERS = ["Key", "英文 Value", "Value", "语言", "长度", "基准", "差异%"]
+EXPORT_COLUMN_WIDTHS = [30, 40, 40, 12, 10, 10, 12]
+
+
+def find_en_value(data: dict) -> str:
+    """获取英文 Value：优先 'en'，否则取第一个以 'en' 开头的语言"""
+    all_values = data.get('all_values')
+    if not all_values:
+        return ""
+    if 'en' in all_values:
+        return all_values['en']['value']
+    for lang_code, value in all_values.items():
+        if lang_code.startswith('en'):
+            return value['value']
+    return ""
+
+
+def iter_export_rows(sorted_results: list) -> Iterator[Tuple[list, float]]:
+    """逐行生成导出数据，yield (row, diff_percent)"""
+    for _, data in sorted_results:
+        base_len = data['base_length']
+        if isinstance(base_len, float) and base_len.is_integer():
+            base_str = int(base_len)
+        else:
+            base_str = round(base_len, 1)
+
+        diff_percent = data['diff_percent']
+        row = [
+            data['key'],
+            find_en_value(data),
+            data['target_value'],
+            data['target_lang'],
+            data['target_length'],
+            base_str,
+            f"+{diff_percent:.1f}%"
+        ]
+        yield row, diff_percent
+
+
+class LengthResultExportWorker(BaseWorker):
+    """长度对比结果导出工作线程"""
+    finished = pyqtSignal(bool, str, str)  # success, message, file_path
+    RESULT_TYPES = (str,)
+
+    def __init__(self, sorted_results: list, file_path: str):
+        super().__init__()
+        self.sorted_results = sorted_results
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            lower_path = self.file_path.lower()
+            if lower_path.endswith('.csv'):
+                count = self.write_csv()
+            elif lower_path.endswith('.jsonl'):
+                count = self.write_jsonl()
+            else:
+                count = self.write_xlsx()
+
+            if count is None:
+                self.finished.emit(False, "导出已取消", self.file_path)
+                return
+
+            self.finished.emit(True, f"已导出 {count} 行到 {self.file_path}", self.file_path)
+
+        except Exception as e:
+            error_msg = self.emit_error("导出", e)
+            self.finished.emit(False, error_msg, self.file_path)
+
+    def write_rows(self, write_row) -> int:
+        """把每一行交给 write_row(row, diff_percent)，返回行数；取消时返回 None"""
+        count = 0
+        for row, diff_percent in iter_export_rows(self.sorted_results):
+            if self.check_stopped():
+                return None
+            write_row(row, diff_percent)
+            count += 1
+            self.report_progress("导出", count, len(self.sorted_results))
+        return count
+
+    def write_csv(self) -> int:
+        with open(self.file_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_HEADERS)
+            return self.write_rows(lambda row, _: writer.writerow(row))
+
+    def write_jsonl(self) -> int:
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            def write_row(row, _):
+                f.write(json.dumps(dict(zip(EXPORT_HEADERS, row)), ensure_ascii=False))
+                f.write('\n')
+            return self.write_rows(write_row)
+
+    def write_xlsx(self) -> int:
+        """write-only 模式：行写出后即释放，样式通过命名样式共享，不逐格创建样式对象"""
+        # openpyxl 导入较慢，只在导出 xlsx 时加载
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        wb = Workbook(write_only=True)
+        for style in self.create_named_styles():
+            wb.add_named_style(style)
+
+        ws = wb.create_sheet("长度对比结果")
+        for col_num, width in enumerate(EXPORT_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(col_num)].width = width
+
+        def make_row(values: List, styles: List[str]) -> list:
+            cells = []
+            for value, style in zip(values, styles):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                cells.append(cell)
+            return cells
+
+        ws.append(make_row(EXPORT_HEADERS, ['length_header'] * len(EXPORT_HEADERS)))
+
+        row_styles = ['length_key', 'length_text', 'length_text', 'length_center', 'length_center', 'length_center']
+
+        def write_row(row, diff_percent):
+            if diff_percent >= 100:
+                diff_style = 'length_diff_high'
+            elif diff_percent >= 50:
+                diff_style = 'length_diff_mid'
+            else:
+                diff_style = 'length_diff_low'
+            ws.append(make_row(row, row_styles + [diff_style]))
+
+        count = self.write_rows(write_row)
+        if count is None:
+            return None
+
+        self.progress.emit("正在保存...")
+        wb.save(self.file_path)
+        return count
+
+    @staticmethod
+    def create_named_styles() -> list:
+        from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+
+        def named_style(name, font=None, fill=None, alignment=None):
+            style = NamedStyle(name=name)
+            if font:
+                style.font = font
+            if fill:
+                style.fill = fill
+            if alignment:
+                style.alignment = alignment
+            return style
+
+        def solid(color):
+            return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+        center = Alignment(horizontal="center", vertical="center")
+        return [
+            named_style('length_header', Font(bold=True, size=12, color="1D1D1F"), solid("F5F5F7"), center),
+            named_style('length_key', alignment=Alignment(horizontal="left", vertical="center")),
+            named_style('length_text', alignment=Alignment(horizontal="left", vertical="top", wrap_text=True)),
+            named_style('length_center', alignment=center),
+            named_style('length_diff_high', Font(bold=True, color="FF3B30"), solid("FFEBEE"), center),
+            named_style('length_diff_mid', Font(bold=True, color="FF6B35"), solid("FFF3E0"), center),
+            named_style('length_diff_low', Font(bold=True, color="FF9500"), solid("FFF8E1"), center),
+        ]
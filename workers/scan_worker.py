@@ -8,7 +8,8 @@ import os
 from typing import List
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser
+from models import LocalizationParser, XCStringsParser
+from models.scan_cache import ScanResultCache
 from workers.base_worker import BaseWorker
 from PyQt6.QtCore import pyqtSignal
 
@@ -16,6 +17,10 @@ from PyQt6.QtCore import pyqtSignal
 class ScanDuplicatesWorker(BaseWorker):
     """扫描重复项工作线程（不删除）"""
     finished = pyqtSignal(bool, str, dict)  # success, message, duplicates_info
+    RESULT_TYPES = (dict,)
+    
+    def job_key(self):
+        return self.base_job_key()
     
     def run(self):
         try:
@@ -25,11 +30,16 @@ class ScanDuplicatesWorker(BaseWorker):
             
             # 查找所有 .lproj 文件夹
             self.progress.emit("正在查找语言文件夹...")
-            lproj_folders = self.find_lproj_folders()
-            if lproj_folders is None:
-                self.finished.emit(False, "项目中未找到 .lproj 文件夹", {})
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", {})
                 return
             
+            # 没变的文件复用缓存结果；指定 git ref 时变更过的文件总是重新解析
+            changed_files = self.resolve_changed_files()
+            reused_count = 0
+            
             duplicates_info = {}
             total_duplicates = 0
             
@@ -47,8 +57,15 @@ class ScanDuplicatesWorker(BaseWorker):
                     self.progress.emit(f"跳过: {strings_file} 不存在")
                     continue
                 
-                # 查找重复项详情
-                duplicate_details = LocalizationParser.find_duplicates(strings_file)
+                # 查找重复项详情（缓存规则见 cached_file_result）
+                duplicate_details = self.cached_file_result('duplicates', strings_file, changed_files)
+                if duplicate_details is not None:
+                    reused_count += 1
+                else:
+                    with self.span('parse', lang=lang_code):
+                        duplicate_details = LocalizationParser.find_duplicates(strings_file, self.check_stopped)
+                    ScanResultCache.put('duplicates', strings_file, duplicate_details)
+                
                 if duplicate_details:
                     duplicate_count = sum(len(items) - 1 for items in duplicate_details.values())
                     duplicates_info[lang_code] = {
@@ -61,10 +78,43 @@ class ScanDuplicatesWorker(BaseWorker):
                 else:
                     self.progress.emit(f"✓ {lang_code}: 无重复项")
             
-            if total_duplicates > 0:
-                self.finished.emit(True, f"扫描完成，共发现 {total_duplicates} 个重复项", duplicates_info)
-            else:
-                self.finished.emit(True, "扫描完成，未发现重复项", {})
+            # String Catalog 中重复出现的 key
+            for catalog_file in catalog_files:
+                if self.check_stopped():
+                    self.finished.emit(False, "操作已取消", {})
+                    return
+                
+                catalog_name = os.path.relpath(catalog_file, self.project_path)
+                self.progress.emit(f"正在扫描 {catalog_name}...")
+                
+                duplicate_details = self.cached_file_result('duplicates', catalog_file, changed_files)
+                if duplicate_details is not None:
+                    reused_count += 1
+                else:
+                    with self.span('parse', file=catalog_name):
+                        duplicate_details = XCStringsParser.find_duplicates(catalog_file, self.check_stopped)
+                    ScanResultCache.put('duplicates', catalog_file, duplicate_details)
+                
+                if duplicate_details:
+                    duplicate_count = sum(len(items) - 1 for items in duplicate_details.values())
+                    duplicates_info[catalog_name] = {
+                        'file': catalog_file,
+                        'count': duplicate_count,
+                        'details': duplicate_details
+                    }
+                    total_duplicates += duplicate_count
+                    self.progress.emit(f"⚠ {catalog_name}: 发现 {duplicate_count} 个重复项")
+                else:
+                    self.progress.emit(f"✓ {catalog_name}: 无重复项")
+            
+            if reused_count:
+                self.progress.emit(f"✓ 复用 {reused_count} 个未变更文件的缓存结果")
+            
+            with self.span('emit', duplicates=total_duplicates):
+                if total_duplicates > 0:
+                    self.finished.emit(True, f"扫描完成，共发现 {total_duplicates} 个重复项", duplicates_info)
+                else:
+                    self.finished.emit(True, "扫描完成，未发现重复项", {})
             
         except Exception as e:
             error_msg = self.emit_error("扫描", e)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相似文案工作线程
+在基准语言中查找仅大小写、标点或个别单词不同的 value，作为合并 key 的候选
+"""
+
+from typing import List
+from PyQt6.QtCore import pyqtSignal
+
+from models.analysis_cache import AnalysisCache
+from models.near_duplicates import NearDuplicateFinder
+from workers.base_worker import BaseWorker
+
+
+class SimilarValuesWorker(BaseWorker):
+    """相似文案工作线程
+
+    返回未按阈值分组的候选（nodes / pairs），由界面按阈值在内存中分组，调整阈值不必重新查找
+    """
+    finished = pyqtSignal(bool, str, dict)  # success, message, {'nodes': [...], 'pairs': [...]}
+    RESULT_TYPES = (dict,)
+
+    def __init__(self, project_path: str, base_lang: str, ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.base_lang = base_lang
+
+    def job_key(self):
+        return self.base_job_key(self.base_lang)
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", {})
+            return False
+
+        if not self.base_lang or not self.base_lang.strip():
+            self.finished.emit(False, "基准语言不能为空", {})
+            return False
+
+        return True
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", {})
+                return
+
+            # 2. 读取所有语言（与其他分析共享已读取的数据）
+            version, all_lang_data = self.load_all_lang_data(lproj_folders, catalog_files)
+            if all_lang_data is None:
+                self.finished.emit(False, "操作已取消", {})
+                return
+
+            base_data = all_lang_data.get(self.base_lang)
+            if not base_data:
+                self.finished.emit(False, f"基准语言 {self.base_lang} 不存在或没有 key", {})
+                return
+
+            # 3. 归一化 + MinHash/LSH 找候选（语言文件没变且基准语言相同时直接复用）
+            result = AnalysisCache.get('near_duplicates', version, self.base_lang)
+            if result is None:
+                self.progress.emit(f"正在查找 {self.base_lang} 中的相似文案（{len(base_data)} 个 value）...")
+                with self.span('compute', values=len(base_data)) as counters:
+                    nodes, pairs = NearDuplicateFinder.find_candidates(base_data, self.check_stopped)
+                    counters['nodes'] = len(nodes)
+                    counters['pairs'] = len(pairs)
+                result = {'nodes': nodes, 'pairs': pairs}
+                AnalysisCache.put('near_duplicates', version, self.base_lang, result)
+            else:
+                self.progress.emit("✓ 语言文件未变化，复用上次的查找结果")
+
+            message = (f"查找完成，{len(base_data)} 个 value 归一化后为 {len(result['nodes'])} 个，"
+                       f"相似候选 {len(result['pairs'])} 对")
+            with self.span('emit', pairs=len(result['pairs'])):
+                self.finished.emit(True, message, result)
+
+        except Exception as e:
+            error_msg = self.emit_error("查找相似文案", e)
+            self.finished.emit(False, error_msg, {})
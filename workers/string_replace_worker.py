@@ -4,20 +4,24 @@
 字符串扫描和替换工作线程
 """
 
+import hashlib
 import os
 import re
 from typing import List, Dict
 from PyQt6.QtCore import pyqtSignal
 
-from models import LocalizationParser, ProjectInfoExtractor
+from models import LocalizationParser, ProjectInfoExtractor, ValueIndex
+from models.cancellation import CANCEL_CHECK_INTERVAL, OperationCancelled, raise_if_cancelled
+from models.scan_cache import ScanResultCache
 from workers.base_worker import BaseWorker
-from utils.constants import PROGRESS_REPORT_INTERVAL
+from utils import git_utils
 from PyQt6.QtCore import pyqtSignal
 
 
 class ScanStringsWorker(BaseWorker):
     """扫描硬编码字符串工作线程"""
     finished = pyqtSignal(bool, str, list, list)  # success, message, results, mismatched_keys
+    RESULT_TYPES = (list, list)
     
     # 多语言函数调用模式（预编译以提高性能）
     LOCALIZED_PATTERNS = [
@@ -30,13 +34,16 @@ class ScanStringsWorker(BaseWorker):
     ]
     
     def __init__(self, project_path: str, keys: List[str], scan_oc: bool, scan_swift: bool, 
-                 case_sensitive: bool = False, ignore_folders: List[str] = None):
-        super().__init__(project_path, ignore_folders)
+                 case_sensitive: bool = False, ignore_folders: List[str] = None, git_ref: str = None):
+        super().__init__(project_path, ignore_folders, git_ref)
         self.keys = keys or []
         self.scan_oc = scan_oc
         self.scan_swift = scan_swift
         self.case_sensitive = case_sensitive
     
+    def job_key(self):
+        return self.base_job_key(tuple(self.keys), self.scan_oc, self.scan_swift, self.case_sensitive)
+    
     def validate_inputs(self) -> bool:
         """验证输入参数"""
         if not super().validate_project_path():
@@ -60,7 +67,7 @@ class ScanStringsWorker(BaseWorker):
             
             # 1. 从多语言文件中建立 value -> key 的映射
             self.progress.emit("正在读取多语言文件...")
-            value_to_key_map, mismatched_keys = self.build_value_key_map()
+            value_to_key_map, mismatched_keys, value_index = self.build_value_key_map()
             
             if not value_to_key_map and not mismatched_keys:
                 self.finished.emit(False, "未找到多语言文件或映射", [], [])
@@ -69,6 +76,11 @@ class ScanStringsWorker(BaseWorker):
             self.progress.emit(f"✓ 建立映射：{len(value_to_key_map)} 个值")
             if mismatched_keys:
                 self.progress.emit(f"⚠ {len(mismatched_keys)} 个 Key 未找到对应的 Value")
+            ambiguous_values = value_index.ambiguous_values() if value_index else {}
+            if ambiguous_values:
+                self.progress.emit(f"⚠ {len(ambiguous_values)} 个 Value 对应多个 Key，替换时使用列表中靠前的 Key：")
+                for value, keys in ambiguous_values.items():
+                    self.progress.emit(f"  \"{value}\" → {' / '.join(keys)}")
             
             # 2. 扫描代码文件
             self.progress.emit("正在扫描代码文件...")
@@ -81,29 +93,59 @@ class ScanStringsWorker(BaseWorker):
             if self.scan_swift:
                 extensions.append('.swift')
             
-            # 扫描文件
-            file_count = 0
-            for root, dirs, files in os.walk(self.project_path):
-                if self.check_stopped():
+            # 扫描结果缓存按映射表和大小写选项区分
+            cache_namespace = self.cache_namespace(value_to_key_map)
+            
+            # 没变的文件复用缓存结果（规则见 cached_file_result）；指定 git ref 时文件列表取自 git ls-files
+            changed_files = self.resolve_changed_files()
+            if changed_files is not None:
+                file_count, reused_count = self.scan_changed_files(
+                    changed_files, tuple(extensions), value_to_key_map, cache_namespace, results
+                )
+                if file_count is None:
                     self.finished.emit(False, "操作已取消", [], mismatched_keys)
                     return
-                
-                # 排除无关目录
-                dirs[:] = [d for d in dirs if d not in self.ignore_folders]
-                
-                for file in files:
-                    if any(file.endswith(ext) for ext in extensions):
-                        file_path = os.path.join(root, file)
-                        file_count += 1
+                self.progress.emit(f"✓ 共扫描 {file_count} 个文件，复用 {reused_count} 个未变更文件的缓存结果")
+            else:
+                # 扫描文件
+                file_count = 0
+                reused_count = 0
+                with self.span('scan') as counters:
+                    for root, dirs, files in os.walk(self.project_path):
+                        if self.check_stopped():
+                            self.finished.emit(False, "操作已取消", [], mismatched_keys)
+                            return
                         
-                        if file_count % PROGRESS_REPORT_INTERVAL == 0:
-                            self.progress.emit(f"已扫描 {file_count} 个文件...")
+                        # 排除无关目录
+                        dirs[:] = [d for d in dirs if d not in self.ignore_folders]
                         
-                        # 扫描文件中的字符串
-                        file_results = self.scan_file(file_path, value_to_key_map)
-                        results.extend(file_results)
+                        for file in files:
+                            raise_if_cancelled(self.check_stopped)
+                            if any(file.endswith(ext) for ext in extensions):
+                                file_path = os.path.join(root, file)
+                                file_count += 1
+                                
+                                self.report_progress("扫描代码文件", file_count)
+                                
+                                # 扫描文件中的字符串
+                                file_results = self.cached_file_result(cache_namespace, file_path, None)
+                                if file_results is not None:
+                                    reused_count += 1
+                                else:
+                                    file_results = self.scan_file(file_path, value_to_key_map)
+                                    ScanResultCache.put(cache_namespace, file_path, file_results)
+                                results.extend(file_results)
+                    counters['files'] = file_count
+                    counters['matches'] = len(results)
+                
+                if reused_count:
+                    self.progress.emit(f"✓ 共 {file_count} 个文件，其中 {reused_count} 个未修改，复用缓存结果")
+                else:
+                    self.progress.emit(f"✓ 共扫描 {file_count} 个文件")
             
-            self.progress.emit(f"✓ 共扫描 {file_count} 个文件")
+            # 有歧义的 value 在结果中附上其他候选 key（不修改缓存中的结果）
+            if ambiguous_values:
+                results = [self.mark_ambiguous(item, value_index) for item in results]
             
             if results:
                 self.finished.emit(True, f"发现 {len(results)} 处需要替换", results, mismatched_keys)
@@ -114,32 +156,86 @@ class ScanStringsWorker(BaseWorker):
             error_msg = self.emit_error("扫描", e)
             self.finished.emit(False, error_msg, [], [])
     
+    def scan_changed_files(self, changed_files: set, extensions: tuple, value_to_key_map: Dict[str, str],
+                           cache_namespace: str, results: List[Dict]) -> tuple:
+        """git 模式：扫描变更文件，未变更文件合并缓存结果（没有缓存时仍然扫描）
+        
+        文件列表来自 git ls-files，避免遍历整个仓库
+        
+        Returns:
+            (scanned_count, reused_count)，取消时 scanned_count 为 None
+        """
+        all_files = git_utils.list_files(self.project_path, extensions, self.ignore_folders)
+        if all_files is None:
+            raise ValueError("git ls-files 执行失败")
+        
+        file_count = 0
+        reused_count = 0
+        for index, file_path in enumerate(all_files, 1):
+            if self.check_stopped():
+                return None, reused_count
+            self.report_progress("扫描变更文件", index, len(all_files))
+            
+            cached = self.cached_file_result(cache_namespace, file_path, changed_files)
+            if cached is not None:
+                reused_count += 1
+                results.extend(cached)
+                continue
+            
+            if not os.path.exists(file_path):
+                continue
+            file_count += 1
+            file_results = self.scan_file(file_path, value_to_key_map)
+            ScanResultCache.put(cache_namespace, file_path, file_results)
+            results.extend(file_results)
+        
+        return file_count, reused_count
+    
+    def cache_namespace(self, value_to_key_map: Dict[str, str]) -> str:
+        """扫描结果缓存的 namespace：映射表（排序后取 sha1）+ 大小写选项"""
+        digest = hashlib.sha1()
+        for value, key in sorted(value_to_key_map.items()):
+            digest.update(value.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(key.encode('utf-8'))
+            digest.update(b'\0')
+        return f"scan_strings:{self.case_sensitive}:{digest.hexdigest()}"
+    
     def build_value_key_map(self) -> tuple:
         """建立 value -> key 的映射
         
-        只映射用户提供的 keys
+        只映射用户提供的 keys；多个 key 的 value 相同时使用列表中靠前的 key
         
         Returns:
-            (value_to_key_map, mismatched_keys)
+            (value_to_key_map, mismatched_keys, value_index)
             - value_to_key_map: {value: key} 映射
             - mismatched_keys: 未找到的 keys 列表
+            - value_index: 用户提供的 keys 的 value → keys 索引（用于提示有歧义的 value），没有语言文件时为 None
         """
         value_to_key = {}
         found_keys = set()
+        value_index = None
         
-        # 查找所有语言文件夹（使用第一个语言文件，通常是英文）
+        # 查找所有语言文件夹，固定按 en → Base → 语言代码顺序选一个作为源码文案的语言
+        # （不能依赖目录遍历顺序，否则可能读到翻译后的文案，导致一个都匹配不上）
         lproj_folders = ProjectInfoExtractor.find_lproj_folders(
             self.project_path, 
             self.ignore_folders
         )
+        strings_files = {
+            lang_code: os.path.join(lproj_path, 'Localizable.strings')
+            for lang_code, lproj_path in lproj_folders.items()
+            if os.path.exists(os.path.join(lproj_path, 'Localizable.strings'))
+        }
+        candidates = [lang for lang in ('en', 'Base') if lang in strings_files]
+        candidates.extend(sorted(lang for lang in strings_files if lang not in ('en', 'Base')))
         
-        for lang_code, lproj_path in lproj_folders.items():
-            strings_file = os.path.join(lproj_path, 'Localizable.strings')
-            if not os.path.exists(strings_file):
-                continue
+        if candidates:
+            source_lang = candidates[0]
+            self.progress.emit(f"使用 {source_lang}.lproj 的文案匹配硬编码字符串")
             
-            # 解析文件
-            data = LocalizationParser.parse_strings_file(strings_file)
+            # 解析文件（只需要读取一个语言文件）
+            data = LocalizationParser.parse_strings_file(strings_files[source_lang], self.check_stopped)
             
             # 只添加用户提供的 keys
             for key in self.keys:
@@ -161,13 +257,25 @@ class ScanStringsWorker(BaseWorker):
                         if value not in value_to_key:
                             value_to_key[value] = key
             
-            # 只需要读取一个语言文件即可
-            break
+            # 与上面的映射使用相同的大小写规则
+            value_index = ValueIndex(
+                {key: data[key] for key in self.keys if key in data},
+                fold_case=not self.case_sensitive,
+                should_stop=self.check_stopped
+            )
         
         # 找出未匹配的 keys
         mismatched_keys = [k for k in self.keys if k not in found_keys]
         
-        return value_to_key, mismatched_keys
+        return value_to_key, mismatched_keys, value_index
+    
+    @staticmethod
+    def mark_ambiguous(item: Dict, value_index: ValueIndex) -> Dict:
+        """value 对应多个 key 时返回附带 'ambiguous_keys'（其他候选 key）的副本，否则原样返回"""
+        keys = value_index.keys_for(item['original'])
+        if len(keys) < 2:
+            return item
+        return dict(item, ambiguous_keys=[key for key in keys if key != item['key']])
     
     def scan_file(self, file_path: str, value_to_key_map: Dict[str, str]) -> List[Dict]:
         """扫描单个文件，查找多语言函数中的硬编码字符串
@@ -188,6 +296,8 @@ class ScanStringsWorker(BaseWorker):
             relative_path = file_path.replace(self.project_path, "").lstrip(os.sep)
             
             for line_num, line in enumerate(lines, 1):
+                if line_num % CANCEL_CHECK_INTERVAL == 0:
+                    raise_if_cancelled(self.check_stopped)
                 # 使用预编译的正则表达式匹配
                 for pattern in self.LOCALIZED_PATTERNS:
                     matches = pattern.finditer(line)
@@ -221,6 +331,8 @@ class ScanStringsWorker(BaseWorker):
                                 'line_content': line.strip()
                             })
         
+        except OperationCancelled:
+            raise
         except Exception as e:
             # 使用基类的错误处理
             self.progress.emit(f"⚠ 扫描文件失败 {file_path}: {e}")
@@ -231,6 +343,7 @@ class ScanStringsWorker(BaseWorker):
 class ReplaceStringsWorker(BaseWorker):
     """替换字符串工作线程"""
     finished = pyqtSignal(bool, str, int)  # success, message, replaced_count
+    RESULT_TYPES = (int,)
     
     def __init__(self, results: List[Dict]):
         super().__init__()  # 不需要 project_path
@@ -258,12 +371,12 @@ class ReplaceStringsWorker(BaseWorker):
             
             replaced_count = 0
             
-            for file_path, items in files_to_update.items():
+            for index, (file_path, items) in enumerate(files_to_update.items(), 1):
                 if self.check_stopped():
                     self.finished.emit(False, "操作已取消", 0)
                     return
                 
-                self.progress.emit(f"正在处理: {os.path.basename(file_path)}")
+                self.report_progress("替换", index, len(files_to_update))
                 
                 # 检查文件是否存在
                 if not os.path.exists(file_path):
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译记忆工作线程
+用基准文案相同（归一化后）的已有翻译为缺失的 key 生成候选译文，并按语言批量写回
+"""
+
+import os
+from typing import Dict, List, Optional
+from PyQt6.QtCore import pyqtSignal
+
+from models import LocalizationParser
+from models.analysis_cache import AnalysisCache
+from models.translation_memory import TranslationMemory
+from workers.base_worker import BaseWorker
+
+
+class TranslationMemoryWorker(BaseWorker):
+    """从翻译记忆补全缺失的翻译（只生成候选，不写文件）
+
+    翻译记忆按语言文件版本和基准语言缓存，多次补全时只建立一次
+    """
+    finished = pyqtSignal(bool, str, dict)  # success, message, {lang_code: [candidate, ...]}
+    RESULT_TYPES = (dict,)
+
+    def __init__(self, project_path: str, base_lang: str, missing_keys: Dict[str, List[str]],
+                 ignore_folders: List[str] = None):
+        super().__init__(project_path, ignore_folders)
+        self.base_lang = base_lang
+        self.missing_keys = missing_keys or {}
+
+    def job_key(self):
+        missing = tuple((lang, tuple(keys)) for lang, keys in sorted(self.missing_keys.items()))
+        return self.base_job_key(self.base_lang, missing)
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", {})
+            return False
+
+        if not self.base_lang or not self.base_lang.strip():
+            self.finished.emit(False, "基准语言不能为空", {})
+            return False
+
+        if not self.missing_keys:
+            self.finished.emit(False, "没有缺失的 key", {})
+            return False
+
+        return True
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            # 1. 查找所有 .lproj 文件夹和 String Catalog
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders() or {}
+            catalog_files = self.find_catalog_files()
+            if not lproj_folders and not catalog_files:
+                self.finished.emit(False, "项目中未找到 .lproj 文件夹或 .xcstrings 文件", {})
+                return
+
+            # 2. 读取所有语言（与其他分析共享已读取的数据）
+            version, all_lang_data = self.load_all_lang_data(lproj_folders, catalog_files)
+            if all_lang_data is None:
+                self.finished.emit(False, "操作已取消", {})
+                return
+
+            if not all_lang_data.get(self.base_lang):
+                self.finished.emit(False, f"基准语言 {self.base_lang} 不存在或没有 key", {})
+                return
+
+            # 3. 建立翻译记忆（语言文件没变且基准语言相同时直接复用）
+            memory = AnalysisCache.get('translation_memory', version, self.base_lang)
+            if memory is None:
+                self.progress.emit(f"正在建立翻译记忆（基准语言 {self.base_lang}）...")
+                with self.span('index', languages=len(all_lang_data)) as counters:
+                    memory = TranslationMemory(all_lang_data, self.base_lang, self.check_stopped)
+                    counters['entries'] = len(memory.entries)
+                AnalysisCache.put('translation_memory', version, self.base_lang, memory, limit=1)
+            else:
+                self.progress.emit("✓ 语言文件未变化，复用已建立的翻译记忆")
+
+            # 4. 批量查找候选译文
+            total_missing = sum(len(keys) for keys in self.missing_keys.values())
+            with self.span('compute', missing=total_missing) as counters:
+                candidates = memory.fill(self.missing_keys, self.check_stopped)
+                counters['candidates'] = sum(len(items) for items in candidates.values())
+
+            for lang_code, items in sorted(candidates.items()):
+                exact = sum(1 for item in items if item['exact'])
+                self.progress.emit(f"✓ {lang_code}: {len(items)} 个候选（{exact} 个基准文案完全相同）")
+
+            filled = sum(len(items) for items in candidates.values())
+            message = f"补全完成，{total_missing} 个缺失项中 {filled} 个在翻译记忆中找到译文"
+            with self.span('emit', candidates=filled):
+                self.finished.emit(True, message, candidates)
+
+        except Exception as e:
+            error_msg = self.emit_error("从翻译记忆补全", e)
+            self.finished.emit(False, error_msg, {})
+
+
+class WriteTranslationsWorker(BaseWorker):
+    """把补全的译文写回各语言的 Localizable.strings，每个语言文件只写一次"""
+    finished = pyqtSignal(bool, str, dict)  # success, message, {lang_code: (updated, added)}
+    RESULT_TYPES = (dict,)
+
+    def __init__(self, project_path: str, translations: Dict[str, Dict[str, str]],
+                 version: Optional[str] = None, ignore_folders: List[str] = None):
+        """
+        Args:
+            translations: {lang_code: {key: value}}
+            version: 追加的条目用版本号注释包裹（同导入），为空时直接追加
+        """
+        super().__init__(project_path, ignore_folders)
+        self.translations = translations or {}
+        self.version = version
+
+    def validate_inputs(self) -> bool:
+        """验证输入参数"""
+        if not super().validate_project_path():
+            self.finished.emit(False, "项目路径无效", {})
+            return False
+
+        if not self.translations:
+            self.finished.emit(False, "没有需要写入的译文", {})
+            return False
+
+        return True
+
+    def run(self):
+        try:
+            if not self.validate_inputs():
+                return
+
+            self.progress.emit("正在查找语言文件夹...")
+            lproj_folders = self.find_lproj_folders() or {}
+
+            # 先确定所有目标文件，取消时不留下写了一半的结果
+            targets = []  # [(lang_code, strings_file, {key: value})]
+            for lang_code, updates in sorted(self.translations.items()):
+                strings_file = os.path.join(lproj_folders.get(lang_code, ''), 'Localizable.strings')
+                if lang_code not in lproj_folders or not os.path.exists(strings_file):
+                    # String Catalog 中的语言暂不支持写回
+                    self.progress.emit(f"跳过: 项目中没有 {lang_code}.lproj/Localizable.strings")
+                    continue
+                targets.append((lang_code, strings_file, updates))
+
+            if not targets:
+                self.finished.emit(False, "没有可写入的语言文件", {})
+                return
+
+            if self.check_stopped():
+                self.finished.emit(False, "操作已取消，未写入任何文件", {})
+                return
+
+            result = {}
+            for index, (lang_code, strings_file, updates) in enumerate(targets, 1):
+                self.report_progress("写入", index, len(targets))
+                with self.span('write', lang=lang_code, entries=len(updates)):
+                    updated, added = LocalizationParser.patch_strings_file(strings_file, updates, self.version)
+                result[lang_code] = (updated, added)
+                self.progress.emit(f"✓ {lang_code}: 修改 {updated} 条，新增 {added} 条")
+
+            total = sum(updated + added for updated, added in result.values())
+            self.finished.emit(True, f"写入完成，{len(result)} 个语言共 {total} 条", result)
+
+        except Exception as e:
+            error_msg = self.emit_error("写入译文", e)
+            self.finished.emit(False, error_msg, {})
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享 Worker 线程池与任务调度
+所有 BaseWorker 在同一个 QThreadPool 上执行，线程常驻复用，不再每次点击新建线程。
+调度器自己维护等待队列：
+- 按优先级出队，当前可见 Tab 发起的任务额外提升优先级（切换 Tab 时队列重新排序）
+- 相同任务（job_key 相同）执行中时不重复执行，后来者订阅同一个结果（已请求停止的任务除外）
+"""
+
+import itertools
+import os
+import threading
+from typing import Optional
+from PyQt6.QtCore import QObject, QThreadPool, Qt, pyqtSignal
+
+# 线程数上限：扫描类任务以 IO 和正则为主，过多线程只会互相争抢 GIL
+MAX_POOL_THREADS = max(2, min(4, os.cpu_count() or 2))
+
+# 退出时等待正在运行的任务响应取消的最长时间（毫秒）
+SHUTDOWN_TIMEOUT_MS = 2000
+
+# 任务优先级（数值越大越先执行）
+PRIORITY_BACKGROUND = 0   # 引用索引刷新、ZIP 索引等后台任务
+PRIORITY_NORMAL = 5       # 用户发起的任务
+VISIBLE_BOOST = 10        # 发起任务的 Tab 当前可见时额外加的优先级
+
+
+class _Job:
+    """一个待执行 / 执行中的任务"""
+
+    __slots__ = ('worker', 'key', 'priority', 'owner', 'seq', 'subscribers', 'forwarded')
+
+    def __init__(self, worker, key: Optional[tuple], priority: int, owner, seq: int):
+        self.worker = worker
+        self.key = key
+        self.priority = priority
+        self.owner = owner
+        self.seq = seq
+        self.subscribers = []  # 合并进来的相同任务，共享 worker 的结果
+        self.forwarded = False  # 结果是否已转发给订阅者
+
+
+class WorkerPool(QObject):
+    """Worker 线程池与调度器（单例，首次使用时在主线程创建）"""
+
+    # 正在运行 + 排队的任务数量变化（可能从池线程发出，排队到主线程处理）
+    active_changed = pyqtSignal(int)
+
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(MAX_POOL_THREADS)
+        self.pool.setExpiryTimeout(-1)  # 空闲线程不回收，后续任务无需再创建线程
+        self._lock = threading.Lock()
+        self._pending = []      # 等待执行的 _Job
+        self._running = set()   # 执行中的 _Job
+        self._inflight = {}     # {job_key: _Job}，排队或执行中、可被合并的任务
+        self._seq = itertools.count()
+        self._visible_owner = None
+
+    @classmethod
+    def instance(cls) -> 'WorkerPool':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, worker, owner=None, priority: Optional[int] = None):
+        """提交 worker
+
+        Args:
+            worker: BaseWorker
+            owner: 发起任务的 Tab（可见时提升优先级）
+            priority: 默认取 worker.PRIORITY
+        """
+        key = worker.job_key()
+        with self._lock:
+            job = self._inflight.get(key) if key is not None else None
+            if job is not None and job.worker.check_stopped():
+                # 已请求停止的任务只会返回「操作已取消」：不再合并，新的请求重新排队执行
+                del self._inflight[key]
+                job = None
+            if job is not None:
+                # 相同任务已在排队 / 执行：订阅它的结果，不再重复执行
+                job.subscribers.append(worker)
+                job.worker.progress.connect(worker.progress)
+                job.worker.progress_state.connect(worker.progress_state)
+                if owner is not None and owner is self._visible_owner:
+                    job.owner = owner
+                count = self._count_locked()
+            else:
+                job = _Job(worker, key, worker.PRIORITY if priority is None else priority, owner, next(self._seq))
+                if key is not None:
+                    self._inflight[key] = job
+                    # 直连：在池线程中 finished 发出时立即把结果转发给订阅者
+                    worker.finished.connect(lambda *args: self._forward_result(job, args),
+                                            Qt.ConnectionType.DirectConnection)
+                self._pending.append(job)
+                count = self._count_locked()
+        self.active_changed.emit(count)
+        self._dispatch()
+
+    def _forward_result(self, job: _Job, args: tuple):
+        with self._lock:
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+            job.forwarded = True
+            subscribers = list(job.subscribers)
+        for subscriber in subscribers:
+            subscriber.finished.emit(*args)
+
+    def _count_locked(self) -> int:
+        return sum(1 + len(job.subscribers) for job in itertools.chain(self._pending, self._running))
+
+    def _effective_priority(self, job: _Job) -> tuple:
+        boost = VISIBLE_BOOST if job.owner is not None and job.owner is self._visible_owner else 0
+        return (job.priority + boost, -job.seq)
+
+    def _dispatch(self):
+        """有空闲线程时按优先级取出等待的任务执行"""
+        while True:
+            with self._lock:
+                if not self._pending or len(self._running) >= MAX_POOL_THREADS:
+                    return
+                job = max(self._pending, key=self._effective_priority)
+                self._pending.remove(job)
+                self._running.add(job)
+            self.pool.start(lambda job=job: self._execute(job))
+
+    def _execute(self, job: _Job):
+        try:
+            job.worker.execute()
+        finally:
+            with self._lock:
+                self._running.discard(job)
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]  # 没有发出 finished 就结束（异常）时也要移除
+                subscribers = list(job.subscribers)
+                forwarded = job.forwarded
+                count = self._count_locked()
+            for subscriber in subscribers:
+                job.worker.progress.disconnect(subscriber.progress)
+                job.worker.progress_state.disconnect(subscriber.progress_state)
+                if not forwarded:
+                    # 共享的 worker 没有发出 finished 就结束了：订阅者也要收到结果，否则发起的 Tab 一直等待
+                    subscriber.emit_failed("任务异常结束，没有返回结果")
+                subscriber.mark_finished()
+            self.active_changed.emit(count)
+            self._dispatch()
+
+    def set_visible_owner(self, owner):
+        """切换 Tab 时调用，之后出队时该 Tab 的任务优先"""
+        with self._lock:
+            self._visible_owner = owner
+
+    def active_count(self) -> int:
+        with self._lock:
+            return self._count_locked()
+
+    def cancel(self, worker) -> bool:
+        """取消单个 worker：还在排队时直接移出队列并标记结束（不会再执行，也不会发出 finished），
+        已在执行时只请求停止
+
+        Returns:
+            是否已从队列中移除（False 时它之后仍可能发出信号，需要由调用方忽略）
+        """
+        with self._lock:
+            job = next((job for job in self._pending if job.worker is worker), None)
+            if job is not None:
+                if job.subscribers:
+                    # 还有其他发起者在等这个结果：继续排队执行，由调用方忽略它的信号
+                    return False
+                self._pending.remove(job)
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+            else:
+                # 合并进排队任务的订阅者只退订，不影响共享的任务
+                job = next((job for job in self._pending if worker in job.subscribers), None)
+                if job is None:
+                    worker.stop()
+                    return False
+                job.subscribers.remove(worker)
+                job.worker.progress.disconnect(worker.progress)
+                job.worker.progress_state.disconnect(worker.progress_state)
+            count = self._count_locked()
+        worker.stop()
+        worker.mark_finished()
+        self.active_changed.emit(count)
+        return True
+
+    def cancel_all(self) -> int:
+        """请求取消所有排队和执行中的任务，返回取消的数量
+
+        排队中的任务仍会被执行，但会在第一次检查取消标志时立即结束，保证每个 worker 都发出 finished
+        """
+        with self._lock:
+            jobs = list(self._running) + list(self._pending)
+            count = self._count_locked()
+        for job in jobs:
+            job.worker.stop()
+        return count
+
+    @classmethod
+    def shutdown(cls):
+        """程序退出时取消所有任务并等待池线程结束"""
+        if cls._instance is None:
+            return
+        cls._instance.cancel_all()
+        cls._instance.pool.waitForDone(SHUTDOWN_TIMEOUT_MS)
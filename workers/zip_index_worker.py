@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入文件索引工作线程
+后台扫描导入文件夹，先发出文件列表，再逐个补全新增/已修改文件的语言信息
+"""
+
+import os
+from PyQt6.QtCore import pyqtSignal
+
+from models.zip_index import ZipIndex
+from workers.base_worker import BaseWorker
+from workers.worker_pool import PRIORITY_BACKGROUND
+
+
+class ZipIndexWorker(BaseWorker):
+    """刷新导入文件夹的索引（未修改的文件直接使用缓存）"""
+    listed = pyqtSignal(list)           # 文件夹中的全部记录（按修改时间倒序，未索引的 languages 为 None）
+    entry_indexed = pyqtSignal(dict)    # 单个文件索引完成
+    finished = pyqtSignal(bool, str, int)  # success, message, indexed_count
+    RESULT_TYPES = (int,)
+    PRIORITY = PRIORITY_BACKGROUND
+
+    def __init__(self, folder: str):
+        super().__init__()
+        self.folder = os.path.abspath(folder)
+
+    def run(self):
+        try:
+            if not os.path.isdir(self.folder):
+                self.finished.emit(False, "导入文件夹不存在", 0)
+                return
+
+            # 1. 只 stat，不打开文件
+            entries = []
+            pending = []  # [(entry, stat)] 需要重新索引的文件
+            with os.scandir(self.folder) as it:
+                for dir_entry in it:
+                    if not ZipIndex.is_import_file(dir_entry.name) or not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                    cached = ZipIndex.get(dir_entry.path, ZipIndex.signature(stat))
+                    if cached is None:
+                        cached = ZipIndex.make_entry(dir_entry.path, stat)
+                        pending.append((cached, stat))
+                    entries.append(cached)
+
+            entries.sort(key=lambda x: x['mtime'], reverse=True)
+            removed = ZipIndex.prune_folder(self.folder, {entry['path'] for entry in entries})
+            self.listed.emit(entries)
+
+            # 2. 从新到旧补全语言信息
+            pending.sort(key=lambda x: x[0]['mtime'], reverse=True)
+            indexed = 0
+            for entry, stat in pending:
+                if self.check_stopped():
+                    break
+                self.entry_indexed.emit(ZipIndex.index_file(entry['path'], stat))
+                indexed += 1
+
+            if indexed or removed:
+                ZipIndex.save()
+
+            if self.check_stopped():
+                self.finished.emit(False, "操作已取消", indexed)
+                return
+
+            self.finished.emit(True, f"{len(entries)} 个文件，重新索引 {indexed} 个", indexed)
+
+        except Exception as e:
+            error_msg = self.emit_error("索引导入文件", e)
+            self.finished.emit(False, error_msg, 0)